@@ -46,6 +46,15 @@ class ComponentManager:
         }
     }
 
+    # Iconos emoji por tipo de componente
+    COMPONENT_ICONS = {
+        'separador': '➖',
+        'nota': '📝',
+        'alerta': '⚠️',
+        'grupo': '📁'
+    }
+    DEFAULT_COMPONENT_ICON = '🔷'
+
     def __init__(self, db_manager):
         """
         Initialize ComponentManager
@@ -371,13 +380,18 @@ class ComponentManager:
         Returns:
             Emoji icon string
         """
-        icons = {
-            'separador': '➖',
-            'nota': '📝',
-            'alerta': '⚠️',
-            'grupo': '📁'
-        }
-        return icons.get(component_name, '🔷')
+        return self.COMPONENT_ICONS.get(component_name, self.DEFAULT_COMPONENT_ICON)
+
+    def get_all_component_icons(self) -> Dict[str, str]:
+        """
+        Get the name -> emoji icon mapping for all known component types
+
+        Names not present in the mapping use DEFAULT_COMPONENT_ICON.
+
+        Returns:
+            Copy of the component name to emoji icon dictionary
+        """
+        return dict(self.COMPONENT_ICONS)
 
     def invalidate_cache(self) -> None:
         """Invalidate the component types cache"""
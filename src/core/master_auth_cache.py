@@ -29,6 +29,8 @@ class MasterAuthCache:
         """Initialize authentication cache"""
         self._authenticated = False
         self._auth_timestamp = 0
+        # Expiry on the monotonic clock (immune to system clock changes)
+        self._valid_until = 0.0
         logger.debug("MasterAuthCache initialized")
 
     def authenticate(self):
@@ -40,6 +42,7 @@ class MasterAuthCache:
         """
         self._authenticated = True
         self._auth_timestamp = time.time()
+        self._valid_until = time.monotonic() + self.CACHE_DURATION
         logger.info(f"Master password cache authenticated (valid for {self.CACHE_DURATION}s)")
 
     def is_authenticated(self) -> bool:
@@ -53,14 +56,13 @@ class MasterAuthCache:
             logger.debug("Cache not authenticated")
             return False
 
-        # Check expiration
-        elapsed = time.time() - self._auth_timestamp
-        if elapsed > self.CACHE_DURATION:
-            logger.info(f"Cache expired after {elapsed:.1f}s (limit: {self.CACHE_DURATION}s)")
+        # Check expiration (single monotonic comparison)
+        remaining = self._valid_until - time.monotonic()
+        if remaining < 0:
+            logger.info(f"Cache expired (limit: {self.CACHE_DURATION}s)")
             self.invalidate()
             return False
 
-        remaining = self.CACHE_DURATION - elapsed
         logger.debug(f"Cache valid - {remaining:.1f}s remaining")
         return True
 
@@ -76,6 +78,7 @@ class MasterAuthCache:
         was_authenticated = self._authenticated
         self._authenticated = False
         self._auth_timestamp = 0
+        self._valid_until = 0.0
 
         if was_authenticated:
             logger.info("Master password cache invalidated")
@@ -92,6 +95,7 @@ class MasterAuthCache:
         if self._authenticated:
             old_timestamp = self._auth_timestamp
             self._auth_timestamp = time.time()
+            self._valid_until = time.monotonic() + self.CACHE_DURATION
             logger.debug(f"Cache extended - reset timer from {old_timestamp} to {self._auth_timestamp}")
         else:
             logger.warning("Attempted to extend cache but not authenticated")
@@ -106,8 +110,7 @@ class MasterAuthCache:
         if not self._authenticated:
             return 0
 
-        elapsed = time.time() - self._auth_timestamp
-        remaining = self.CACHE_DURATION - elapsed
+        remaining = self._valid_until - time.monotonic()
 
         return max(0, int(remaining))
 
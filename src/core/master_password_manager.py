@@ -5,14 +5,21 @@ Separate from login password (auth_manager.py)
 """
 import hashlib
 import secrets
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 from dotenv import load_dotenv, set_key
 import os
 import logging
 
+from src.core.master_auth_cache import get_master_auth_cache
+
 logger = logging.getLogger(__name__)
 
+# Incrementado cada vez que la contraseña maestra se crea, cambia o elimina;
+# invalida el resultado memoizado de has_master_password_cached()
+_master_password_version = 0
+
 
 class MasterPasswordManager:
     """
@@ -53,12 +60,13 @@ class MasterPasswordManager:
         # Update os.environ immediately
         os.environ[key] = value
 
-    def hash_password(self, password: str, salt: Optional[str] = None) -> Tuple[str, str]:
+    def hash_password(self, password: Union[str, bytes, bytearray], salt: Optional[str] = None) -> Tuple[str, str]:
         """
         Hash password with SHA256 + salt
 
         Args:
-            password: Plain text password
+            password: Plain text password (str, or UTF-8 bytes/bytearray so the
+                caller can wipe its buffer afterwards)
             salt: Optional salt (generates random if None)
 
         Returns:
@@ -67,21 +75,22 @@ class MasterPasswordManager:
         if salt is None:
             salt = secrets.token_hex(32)  # 64 characters
 
-        # Combine password + salt
-        salted = password + salt
+        if isinstance(password, str):
+            password = password.encode()
 
-        # Hash with SHA256
-        hash_obj = hashlib.sha256(salted.encode())
+        # Hash password + salt with SHA256 (fed incrementally, no joined copy)
+        hash_obj = hashlib.sha256(password)
+        hash_obj.update(salt.encode())
         password_hash = hash_obj.hexdigest()
 
         return password_hash, salt
 
-    def verify_master_password(self, password: str) -> bool:
+    def verify_master_password(self, password: Union[str, bytes, bytearray]) -> bool:
         """
         Verify password against stored master password hash
 
         Args:
-            password: Plain text password to verify
+            password: Plain text password to verify (str or UTF-8 bytes/bytearray)
 
         Returns:
             True if password is correct, False otherwise
@@ -96,7 +105,8 @@ class MasterPasswordManager:
         # Hash the provided password with stored salt
         new_hash, _ = self.hash_password(password, stored_salt)
 
-        is_valid = new_hash == stored_hash
+        # Comparación en tiempo constante (no corta en el primer byte distinto)
+        is_valid = secrets.compare_digest(new_hash.encode(), stored_hash.encode())
         if is_valid:
             logger.info("Master password verified successfully")
         else:
@@ -147,6 +157,7 @@ class MasterPasswordManager:
         # Save to .env
         self._set_env("MASTER_PASSWORD_HASH", password_hash)
         self._set_env("MASTER_PASSWORD_SALT", salt)
+        bump_master_password_version()
 
         logger.info("Master password created successfully")
 
@@ -180,4 +191,40 @@ class MasterPasswordManager:
         """
         self._set_env("MASTER_PASSWORD_HASH", "")
         self._set_env("MASTER_PASSWORD_SALT", "")
+        bump_master_password_version()
         logger.warning("Master password removed - protection disabled")
+
+
+def bump_master_password_version():
+    """
+    Invalidate memoized master password state
+
+    Called whenever the master password is created, changed or removed.
+    Also drops any cached authentication, which belonged to the old password.
+    """
+    global _master_password_version
+    _master_password_version += 1
+    _has_master_password_for.cache_clear()
+    get_master_auth_cache().invalidate()
+
+
+@lru_cache(maxsize=4)
+def _has_master_password_for(env_file: str, version: int) -> bool:
+    """Memoized has_master_password() per env file and config version"""
+    return MasterPasswordManager(env_file).has_master_password()
+
+
+def has_master_password_cached(env_file: str = ".env") -> bool:
+    """
+    Check if master password is configured, without re-reading the .env file
+
+    The result is memoized until bump_master_password_version() is called
+    (done automatically by set_master_password/remove_master_password).
+
+    Args:
+        env_file: Path to .env file (default: ".env")
+
+    Returns:
+        True if master password exists, False otherwise
+    """
+    return _has_master_password_for(env_file, _master_password_version)
@@ -89,6 +89,35 @@ class SearchResult:
     is_sensitive: bool = False
     is_favorite: bool = False
 
+    # Textos ya compuestos para mostrar (se calculan una vez en __post_init__)
+    display_name: str = field(default="", init=False, repr=False)
+    proyectos_str: str = field(default="", init=False, repr=False)
+    areas_str: str = field(default="", init=False, repr=False)
+    procesos_str: str = field(default="", init=False, repr=False)
+
+    # Texto de búsqueda en minúsculas, calculado la primera vez que se pide
+    _search_text_lower: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precalcula los textos que se muestran en tablas/exportaciones"""
+        self.display_name = f"{self.icon or '📄'} {self.name}"
+        self.proyectos_str = ", ".join(self.proyectos)
+        self.areas_str = ", ".join(self.areas)
+        self.procesos_str = ", ".join(self.procesos)
+
+    def get_search_text_lower(self) -> str:
+        """
+        Retorna nombre + contenido + descripción + tags en minúsculas (memoizado)
+
+        Returns:
+            Texto combinado usado por los operadores de búsqueda
+        """
+        if self._search_text_lower is None:
+            self._search_text_lower = " ".join(
+                (self.name, self.content, self.description or "", *self.tags)
+            ).lower()
+        return self._search_text_lower
+
     def matches_entity_filter(self, entity_filters: Dict[str, bool]) -> bool:
         """
         Verifica si el resultado coincide con los filtros de entidad activos
@@ -589,19 +618,37 @@ class UniversalSearchEngine:
         Returns:
             Dict con estadísticas
         """
+        items = proyectos = areas = categorias = tablas = 0
+        procesos = listas = favorites = sensitive = 0
+        unique_tags: Set[str] = set()
+
+        # Una sola pasada sobre los resultados para todos los contadores
+        for r in results:
+            items += r.result_type == SearchResultType.ITEM
+            proyectos += bool(r.proyectos)
+            areas += bool(r.areas)
+            categorias += bool(r.categoria)
+            tablas += bool(r.tabla)
+            procesos += bool(r.procesos)
+            listas += bool(r.lista)
+            favorites += r.is_favorite
+            sensitive += r.is_sensitive
+            for tag in r.tags:
+                unique_tags.add(tag.lower())
+
         stats = {
             'total': len(results),
-            'items': sum(1 for r in results if r.result_type == SearchResultType.ITEM),
-            'tags': sum(1 for r in results if r.result_type != SearchResultType.ITEM),
-            'with_proyectos': sum(1 for r in results if r.proyectos),
-            'with_areas': sum(1 for r in results if r.areas),
-            'with_categorias': sum(1 for r in results if r.categoria),
-            'with_tablas': sum(1 for r in results if r.tabla),
-            'with_procesos': sum(1 for r in results if r.procesos),
-            'with_listas': sum(1 for r in results if r.lista),
-            'unique_tags': len(self.extract_unique_tags(results)),
-            'favorites': sum(1 for r in results if r.is_favorite),
-            'sensitive': sum(1 for r in results if r.is_sensitive)
+            'items': items,
+            'tags': len(results) - items,
+            'with_proyectos': proyectos,
+            'with_areas': areas,
+            'with_categorias': categorias,
+            'with_tablas': tablas,
+            'with_procesos': procesos,
+            'with_listas': listas,
+            'unique_tags': len(unique_tags),
+            'favorites': favorites,
+            'sensitive': sensitive
         }
 
         return stats
@@ -17,6 +17,19 @@ from contextlib import contextmanager
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Máximo de ids por sentencia "IN (...)" (SQLite limita los parámetros a 999 en versiones antiguas)
+MAX_IDS_PER_STATEMENT = 500
+
+
+def _unicode_lower(value):
+    """LOWER() con plegado Unicode para SQLite (el LOWER nativo solo pliega ASCII)"""
+    return value.lower() if isinstance(value, str) else value
+
+
+def _register_functions(conn: sqlite3.Connection) -> None:
+    """Registra las funciones SQL propias en una conexión"""
+    conn.create_function('py_lower', 1, _unicode_lower, deterministic=True)
+
 
 class DBManager:
     """Gestor de base de datos SQLite para Widget Sidebar"""
@@ -31,6 +44,7 @@ class DBManager:
         self.db_path = Path(db_path)
         self.connection = None
         self._fts5_available = None  # Caché para verificación de FTS5
+        self._transaction_depth = 0  # Nivel de anidamiento de transaction()
         self._ensure_database()
         logger.info(f"Database initialized at: {self.db_path}")
 
@@ -57,10 +71,45 @@ class DBManager:
                 check_same_thread=False
             )
             self.connection.row_factory = sqlite3.Row
+            _register_functions(self.connection)
             # Enable foreign keys
             self.connection.execute("PRAGMA foreign_keys = ON")
         return self.connection
 
+    @contextmanager
+    def reader(self):
+        """
+        Context manager que entrega un DBManager con su propia conexión de solo lectura
+
+        Pensado para hilos de trabajo: cada hilo consulta por su conexión,
+        sin compartir la del hilo de la GUI ni ver sus transacciones sin
+        commit. Una base en memoria no puede abrirse dos veces, así que en
+        ese caso se entrega este mismo DBManager.
+
+        Usage:
+            with db.reader() as reader_db:
+                reader_db.universal_search_items(...)
+        """
+        if str(self.db_path) == ":memory:":
+            yield self
+            return
+
+        reader_db = DBManager.__new__(DBManager)
+        reader_db.db_path = self.db_path
+        reader_db._fts5_available = self._fts5_available
+        reader_db._transaction_depth = 0
+        reader_db.connection = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False
+        )
+        reader_db.connection.row_factory = sqlite3.Row
+        _register_functions(reader_db.connection)
+        try:
+            yield reader_db
+        finally:
+            reader_db.connection.close()
+
     def close(self):
         """Close database connection"""
         if self.connection:
@@ -76,8 +125,23 @@ class DBManager:
         Usage:
             with db.transaction() as conn:
                 conn.execute(...)
+
+        Es reentrante: las transacciones anidadas (y execute_update) se
+        unen a la transacción externa, que es la única que hace COMMIT o
+        ROLLBACK. Así una secuencia de inserts comparte un solo commit.
         """
         conn = self.connect()
+        if self._transaction_depth > 0:
+            self._transaction_depth += 1
+            try:
+                yield conn
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        self._transaction_depth = 1
         try:
             yield conn
             conn.commit()
@@ -85,6 +149,8 @@ class DBManager:
             conn.rollback()
             logger.error(f"Transaction failed: {e}")
             raise
+        finally:
+            self._transaction_depth = 0
 
     def _create_database(self):
         """Create database schema with all tables and indices - COMPLETE SCHEMA"""
@@ -1056,7 +1122,8 @@ class DBManager:
             conn = self.connect()
             cursor = conn.cursor()
             cursor.execute(query, params)
-            conn.commit()
+            if self._transaction_depth == 0:
+                conn.commit()
             return cursor.lastrowid
         except sqlite3.Error as e:
             logger.error(f"Update execution failed: {e}")
@@ -1187,6 +1254,29 @@ class DBManager:
 
         return None
 
+    def search_categories(self, pattern: str, include_inactive: bool = True) -> List[Dict]:
+        """
+        Search categories whose name contains pattern (case-insensitive,
+        including accented/non-ASCII letters)
+        Tags are NOT loaded, use get_category/get_categories for that
+
+        Args:
+            pattern: Text to search in the category name
+            include_inactive: Include inactive categories
+
+        Returns:
+            List[Dict]: Matching category rows ordered by order_index
+        """
+        # Escape LIKE wildcards so the pattern is matched literally
+        escaped = pattern.lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        query = """
+            SELECT * FROM categories
+            WHERE (is_active = 1 OR ? = 1)
+            AND py_lower(name) LIKE ? ESCAPE '\\'
+            ORDER BY order_index
+        """
+        return self.execute_query(query, (include_inactive, f"%{escaped}%"))
+
     def add_category(self, name: str, icon: str = None,
                      is_predefined: bool = False, order_index: int = None,
                      tags: List[str] = None) -> int:
@@ -2278,6 +2368,28 @@ class DBManager:
         logger.info(f"Item added: {label} (ID: {item_id}, Sensitive: {is_sensitive}, Favorite: {is_favorite}, Active: {is_active}, Archived: {is_archived}{list_info}{tags_info})")
         return item_id
 
+    def add_items_bulk(self, items: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add several items in a single transaction (one commit for all rows)
+
+        Each row goes through add_item so encryption of sensitive content
+        and tag relationships behave exactly the same as for single items.
+
+        Args:
+            items: List of dicts with add_item keyword arguments
+                   (category_id, label, content, item_type, tags, ...)
+
+        Returns:
+            List[int]: IDs of the created items, in the same order
+        """
+        item_ids = []
+        with self.transaction():
+            for item_data in items:
+                item_ids.append(self.add_item(**item_data))
+
+        logger.info(f"Bulk insert completed: {len(item_ids)} items")
+        return item_ids
+
     def update_item(self, item_id: int, **kwargs) -> None:
         """
         Update item fields
@@ -2354,6 +2466,71 @@ class DBManager:
         self.execute_update(query, (item_id,))
         logger.info(f"Item deleted: ID {item_id}")
 
+    def update_items_favorite(self, item_ids: List[int], is_favorite: bool) -> int:
+        """
+        Mark or unmark several items as favorite in a single transaction
+
+        Args:
+            item_ids: Item IDs to update
+            is_favorite: New favorite state
+
+        Returns:
+            int: Number of items updated
+        """
+        updated = 0
+        with self.transaction() as conn:
+            for start in range(0, len(item_ids), MAX_IDS_PER_STATEMENT):
+                chunk = item_ids[start:start + MAX_IDS_PER_STATEMENT]
+                placeholders = ','.join(['?' for _ in chunk])
+                cursor = conn.execute(
+                    f"""
+                    UPDATE items
+                    SET is_favorite = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id IN ({placeholders})
+                    """,
+                    (is_favorite, *chunk)
+                )
+                updated += cursor.rowcount
+        logger.info(f"Favorite set to {is_favorite} for {updated} items")
+        return updated
+
+    def delete_items(self, item_ids: List[int]) -> int:
+        """
+        Delete several items in a single transaction and update tag usage_count
+
+        Args:
+            item_ids: Item IDs to delete
+
+        Returns:
+            int: Number of items deleted
+        """
+        deleted = 0
+        with self.transaction() as conn:
+            for start in range(0, len(item_ids), MAX_IDS_PER_STATEMENT):
+                chunk = item_ids[start:start + MAX_IDS_PER_STATEMENT]
+                placeholders = ','.join(['?' for _ in chunk])
+
+                # Descontar de cada tag tantos usos como items suyos se eliminan
+                # (CASCADE borra item_tags, pero usage_count se mantiene a mano)
+                conn.execute(
+                    f"""
+                    UPDATE tags
+                    SET usage_count = MAX(0, usage_count - (
+                        SELECT COUNT(*) FROM item_tags
+                        WHERE item_tags.tag_id = tags.id AND item_tags.item_id IN ({placeholders})
+                    ))
+                    WHERE id IN (
+                        SELECT tag_id FROM item_tags WHERE item_id IN ({placeholders})
+                    )
+                    """,
+                    (*chunk, *chunk)
+                )
+
+                cursor = conn.execute(f"DELETE FROM items WHERE id IN ({placeholders})", tuple(chunk))
+                deleted += cursor.rowcount
+        logger.info(f"Items deleted: {deleted}/{len(item_ids)}")
+        return deleted
+
     # ==================== Table CRUD Operations ====================
 
     def add_table(self, name: str, description: str = "") -> int:
@@ -87,6 +87,7 @@ class BulkItemCreatorDialog(QWidget):
         self.main_controller = main_controller
         self.appbar_registered = False  # Estado del AppBar
         self.drag_position = QPoint()  # Para dragging de ventana
+        self._pending_info_restore = None  # Texto a restaurar en info_label
 
         # Screenshot controller (obtenido del main_controller)
         self.screenshot_controller = None
@@ -1571,103 +1572,106 @@ class BulkItemCreatorDialog(QWidget):
             return
 
         try:
-            # 1. Verificar si la lista ya existe (get_or_create)
-            existing_lista = self.db.get_lista_by_name(category_id, name.strip())
-
-            if existing_lista:
-                lista_id = existing_lista['id']
-                logger.info(f"Lista '{name}' ya existe en categoría {category_id}, reutilizando (ID: {lista_id})")
-                was_created = False
-            else:
-                # Crear nueva lista
-                lista_id = self.db.create_lista(
-                    category_id=category_id,
-                    name=name.strip(),
-                    description=f"Lista creada desde Creador Masivo"
-                )
-
-                if not lista_id:
-                    QMessageBox.critical(self, "Error", "No se pudo crear la lista")
-                    return
+            # Toda la secuencia lista → relación → tags en una sola transacción
+            # (un único commit en lugar de uno por cada tag asociado)
+            with self.db.transaction():
+                # 1. Verificar si la lista ya existe (get_or_create)
+                existing_lista = self.db.get_lista_by_name(category_id, name.strip())
+
+                if existing_lista:
+                    lista_id = existing_lista['id']
+                    logger.info(f"Lista '{name}' ya existe en categoría {category_id}, reutilizando (ID: {lista_id})")
+                    was_created = False
+                else:
+                    # Crear nueva lista
+                    lista_id = self.db.create_lista(
+                        category_id=category_id,
+                        name=name.strip(),
+                        description=f"Lista creada desde Creador Masivo"
+                    )
 
-                logger.info(f"Lista creada: {name} (ID: {lista_id})")
-                was_created = True
+                    if not lista_id:
+                        QMessageBox.critical(self, "Error", "No se pudo crear la lista")
+                        return
 
-            # 2. Crear relación proyecto/área → lista (si no existe ya)
-            relation_id = None
+                    logger.info(f"Lista creada: {name} (ID: {lista_id})")
+                    was_created = True
 
-            if project_id:
-                # Verificar si ya existe la relación
-                existing_relations = self.db.get_project_relations(project_id)
-                existing_relation = next(
-                    (r for r in existing_relations if r['entity_type'] == 'list' and r['entity_id'] == lista_id),
-                    None
-                )
+                # 2. Crear relación proyecto/área → lista (si no existe ya)
+                relation_id = None
 
-                if existing_relation:
-                    relation_id = existing_relation['id']
-                    logger.debug(f"Relación proyecto-lista ya existe: {relation_id}")
-                else:
-                    relation_id = self.db.add_project_relation(
-                        project_id=project_id,
-                        entity_type='list',
-                        entity_id=lista_id,
-                        description=f"Lista: {name.strip()}"
+                if project_id:
+                    # Verificar si ya existe la relación
+                    existing_relations = self.db.get_project_relations(project_id)
+                    existing_relation = next(
+                        (r for r in existing_relations if r['entity_type'] == 'list' and r['entity_id'] == lista_id),
+                        None
                     )
-                    logger.debug(f"Nueva relación proyecto-lista creada: {relation_id}")
-            else:
-                # Verificar si ya existe la relación con área
-                existing_relations = self.db.get_area_relations(area_id)
-                existing_relation = next(
-                    (r for r in existing_relations if r['entity_type'] == 'list' and r['entity_id'] == lista_id),
-                    None
-                )
 
-                if existing_relation:
-                    relation_id = existing_relation['id']
-                    logger.debug(f"Relación área-lista ya existe: {relation_id}")
+                    if existing_relation:
+                        relation_id = existing_relation['id']
+                        logger.debug(f"Relación proyecto-lista ya existe: {relation_id}")
+                    else:
+                        relation_id = self.db.add_project_relation(
+                            project_id=project_id,
+                            entity_type='list',
+                            entity_id=lista_id,
+                            description=f"Lista: {name.strip()}"
+                        )
+                        logger.debug(f"Nueva relación proyecto-lista creada: {relation_id}")
                 else:
-                    relation_id = self.db.add_area_relation(
-                        area_id=area_id,
-                        entity_type='list',
-                        entity_id=lista_id,
-                        description=f"Lista: {name.strip()}"
+                    # Verificar si ya existe la relación con área
+                    existing_relations = self.db.get_area_relations(area_id)
+                    existing_relation = next(
+                        (r for r in existing_relations if r['entity_type'] == 'list' and r['entity_id'] == lista_id),
+                        None
                     )
-                    logger.debug(f"Nueva relación área-lista creada: {relation_id}")
 
-            # 3. Asociar tags de proyecto/área a la relación (evitar duplicados)
-            logger.info(f"=== Asociando {len(selected_tags)} tags a relación {relation_id} ===")
-            for tag_name in selected_tags:
-                if project_id:
-                    tag = self.db.get_project_element_tag_by_name(tag_name)
-                    if tag:
-                        logger.debug(f"Tag '{tag_name}' encontrado con ID: {tag['id']}")
-                        # Verificar si el tag ya está asociado
-                        existing_tags = self.db.get_tags_for_project_relation(relation_id)
-                        logger.debug(f"Tags existentes en relación: {[t['id'] for t in existing_tags]}")
-                        if tag['id'] not in [t['id'] for t in existing_tags]:
-                            self.db.add_tag_to_project_relation(relation_id, tag['id'])
-                            logger.info(f"✅ Tag '{tag_name}' (ID: {tag['id']}) asociado a relación proyecto-lista {relation_id}")
-                        else:
-                            logger.info(f"Tag '{tag_name}' (ID: {tag['id']}) ya estaba asociado a relación proyecto-lista {relation_id}")
+                    if existing_relation:
+                        relation_id = existing_relation['id']
+                        logger.debug(f"Relación área-lista ya existe: {relation_id}")
                     else:
-                        logger.warning(f"Tag '{tag_name}' no encontrado en BD")
-                else:
-                    tag = self.db.get_area_element_tag_by_name(tag_name)
-                    if tag:
-                        logger.debug(f"Tag '{tag_name}' encontrado con ID: {tag['id']}")
-                        # Verificar si el tag ya está asociado
-                        existing_tags = self.db.get_tags_for_area_relation(relation_id)
-                        logger.debug(f"Tags existentes en relación: {[t['id'] for t in existing_tags]}")
-                        if tag['id'] not in [t['id'] for t in existing_tags]:
-                            self.db.assign_tag_to_area_relation(relation_id, tag['id'])
-                            logger.info(f"✅ Tag '{tag_name}' (ID: {tag['id']}) asociado a relación área-lista {relation_id}")
+                        relation_id = self.db.add_area_relation(
+                            area_id=area_id,
+                            entity_type='list',
+                            entity_id=lista_id,
+                            description=f"Lista: {name.strip()}"
+                        )
+                        logger.debug(f"Nueva relación área-lista creada: {relation_id}")
+
+                # 3. Asociar tags de proyecto/área a la relación (evitar duplicados)
+                logger.info(f"=== Asociando {len(selected_tags)} tags a relación {relation_id} ===")
+                for tag_name in selected_tags:
+                    if project_id:
+                        tag = self.db.get_project_element_tag_by_name(tag_name)
+                        if tag:
+                            logger.debug(f"Tag '{tag_name}' encontrado con ID: {tag['id']}")
+                            # Verificar si el tag ya está asociado
+                            existing_tags = self.db.get_tags_for_project_relation(relation_id)
+                            logger.debug(f"Tags existentes en relación: {[t['id'] for t in existing_tags]}")
+                            if tag['id'] not in [t['id'] for t in existing_tags]:
+                                self.db.add_tag_to_project_relation(relation_id, tag['id'])
+                                logger.info(f"✅ Tag '{tag_name}' (ID: {tag['id']}) asociado a relación proyecto-lista {relation_id}")
+                            else:
+                                logger.info(f"Tag '{tag_name}' (ID: {tag['id']}) ya estaba asociado a relación proyecto-lista {relation_id}")
                         else:
-                            logger.info(f"Tag '{tag_name}' (ID: {tag['id']}) ya estaba asociado a relación área-lista {relation_id}")
+                            logger.warning(f"Tag '{tag_name}' no encontrado en BD")
                     else:
-                        logger.warning(f"Tag '{tag_name}' no encontrado en BD")
+                        tag = self.db.get_area_element_tag_by_name(tag_name)
+                        if tag:
+                            logger.debug(f"Tag '{tag_name}' encontrado con ID: {tag['id']}")
+                            # Verificar si el tag ya está asociado
+                            existing_tags = self.db.get_tags_for_area_relation(relation_id)
+                            logger.debug(f"Tags existentes en relación: {[t['id'] for t in existing_tags]}")
+                            if tag['id'] not in [t['id'] for t in existing_tags]:
+                                self.db.assign_tag_to_area_relation(relation_id, tag['id'])
+                                logger.info(f"✅ Tag '{tag_name}' (ID: {tag['id']}) asociado a relación área-lista {relation_id}")
+                            else:
+                                logger.info(f"Tag '{tag_name}' (ID: {tag['id']}) ya estaba asociado a relación área-lista {relation_id}")
+                        else:
+                            logger.warning(f"Tag '{tag_name}' no encontrado en BD")
 
-            logger.info(f"=== Asociación de tags completada ===")
+                logger.info(f"=== Asociación de tags completada ===")
 
             # 4. Recargar listas desde BD (incluye la recién creada con todos sus tags)
             current_tab._reload_lists_by_tags()
@@ -1779,12 +1783,14 @@ class BulkItemCreatorDialog(QWidget):
             current_tab = self._get_current_tab_content()
             if current_tab:
                 # Mostrar mensaje breve en el info label
-                original_text = self.info_label.text()
+                # (si ya hay una restauración pendiente se conserva su texto original)
+                if self._pending_info_restore is None:
+                    self._pending_info_restore = self.info_label.text()
                 self.info_label.setText("✓ Datos actualizados")
                 self.info_label.setStyleSheet("color: #4CAF50; font-size: 9px; font-weight: bold;")
 
                 # Restaurar después de 2 segundos
-                QTimer.singleShot(2000, lambda: self._restore_info_label(original_text))
+                QTimer.singleShot(2000, self._restore_pending_info_label)
 
             logger.info("Datos actualizados correctamente")
 
@@ -1792,7 +1798,16 @@ class BulkItemCreatorDialog(QWidget):
             logger.error(f"Error actualizando datos: {e}")
             self.info_label.setText("❌ Error al actualizar")
             self.info_label.setStyleSheet("color: #d32f2f; font-size: 9px;")
-            QTimer.singleShot(3000, lambda: self._restore_info_label(f"{self.tab_widget.count()} tabs"))
+            self._pending_info_restore = f"{self.tab_widget.count()} tabs"
+            QTimer.singleShot(3000, self._restore_pending_info_label)
+
+    def _restore_pending_info_label(self):
+        """Restaura el info_label con el texto pendiente (si aún hay uno)"""
+        original_text = self._pending_info_restore
+        if original_text is None:
+            return
+        self._pending_info_restore = None
+        self._restore_info_label(original_text)
 
     def _restore_info_label(self, original_text: str):
         """Restaura el info_label a su estado original"""
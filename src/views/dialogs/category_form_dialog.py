@@ -246,14 +246,26 @@ class CategoryFormDialog(QDialog):
                 name = f"Copia de {name}"
             self.name_input.setText(name)
 
-            # Load icon
+            # Load icon and color with signals blocked so each preview is
+            # refreshed exactly once (and skipped when there is no value)
             icon = self.category.get('icon', '📁')
-            self.icon_input.setText(icon)
-
-            # Load color
             color = self.category.get('color')
+
+            self.icon_input.blockSignals(True)
+            self.color_input.blockSignals(True)
+            try:
+                if icon:
+                    self.icon_input.setText(icon)
+                if color:
+                    self.color_input.setText(color)
+            finally:
+                self.icon_input.blockSignals(False)
+                self.color_input.blockSignals(False)
+
+            if icon:
+                self._update_icon_preview(self.icon_input.text())
             if color:
-                self.color_input.setText(color)
+                self._update_color_preview(self.color_input.text())
 
             # Load tags
             tags = self.category.get('tags')
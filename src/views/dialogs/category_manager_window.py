@@ -4,23 +4,304 @@ FASE 3: Ventana de gestión con búsqueda, checkboxes y acciones
 """
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QScrollArea, QSizePolicy, QMessageBox, QDialog
+    QLineEdit, QScrollArea, QSizePolicy, QMessageBox, QDialog,
+    QCheckBox, QComboBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPoint
-from PyQt6.QtGui import QFont, QCursor, QIcon
-import sys
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPoint, QThread, QRect, QSignalBlocker
+from PyQt6.QtGui import QFont, QIcon, QGuiApplication
+from functools import lru_cache
+import json
 import logging
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.models.category import Category
 from src.core.taskbar_minimizable_mixin import TaskbarMinimizableMixin
-from src.views.widgets.category_list_item import CategoryListItem
+from src.views.widgets.category_list_item import CategoryListItem, cached_cursor
 from src.views.dialogs.category_form_dialog import CategoryFormDialog
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Filas que se crean por tanda al renderizar la lista (renderizado incremental)
+RENDER_BATCH_SIZE = 40
+# Distancia (px) al final del scroll a partir de la cual se crea la siguiente tanda
+RENDER_AHEAD_PX = 200
+# A partir de cuántas categorías la búsqueda por nombre se delega a SQLite (LIKE)
+SQL_SEARCH_THRESHOLD = 500
+
+# Hoja de estilos de la ventana: se aplica una sola vez en CategoryManagerWindow
+# y se resuelve por objectName en lugar de un setStyleSheet por widget
+CATEGORY_MANAGER_STYLESHEET = """
+    CategoryManagerWindow {
+        background-color: #2b2b2b;
+        border: 1px solid #3d3d3d;
+        border-radius: 8px;
+    }
+
+    /* ---------- Title bar ---------- */
+    CustomTitleBar {
+        background-color: #1e1e1e;
+        border-bottom: 1px solid #3d3d3d;
+    }
+    QLabel#titleLabel {
+        color: #ffffff;
+        font-size: 12pt;
+        font-weight: 500;
+    }
+    QPushButton#minimizeBtn, QPushButton#maximizeBtn, QPushButton#closeBtn {
+        background-color: transparent;
+        color: #cccccc;
+        border: none;
+        border-radius: 4px;
+        padding: 6px 12px;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QPushButton#minimizeBtn:hover, QPushButton#maximizeBtn:hover {
+        background-color: #3d3d3d;
+    }
+    QPushButton#minimizeBtn:pressed, QPushButton#maximizeBtn:pressed {
+        background-color: #4d4d4d;
+    }
+    QPushButton#closeBtn:hover {
+        background-color: #e81123;
+        color: #ffffff;
+    }
+    QPushButton#closeBtn:pressed {
+        background-color: #c50b18;
+    }
+
+    /* ---------- Content area (must stay before the per-widget rules) ---------- */
+    #contentArea, #contentArea QWidget {
+        background-color: #2b2b2b;
+    }
+
+    /* ---------- Search bar ---------- */
+    QLabel#searchIcon {
+        font-size: 16px;
+        color: #888888;
+    }
+    QLineEdit#searchInput {
+        background-color: #1e1e1e;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 6px;
+        padding: 10px 15px;
+        font-size: 11pt;
+    }
+    QLineEdit#searchInput:focus {
+        border: 1px solid #007acc;
+    }
+    QPushButton#clearSearchBtn {
+        background-color: transparent;
+        color: #888888;
+        border: none;
+        border-radius: 17px;
+        font-size: 20px;
+        font-weight: bold;
+    }
+    QPushButton#clearSearchBtn:hover {
+        background-color: #3d3d3d;
+        color: #cccccc;
+    }
+    QPushButton#selectAllBtn, QPushButton#deselectAllBtn {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 6px;
+        padding: 0 15px;
+        font-size: 10pt;
+    }
+    QPushButton#selectAllBtn:hover, QPushButton#deselectAllBtn:hover {
+        background-color: #3d3d3d;
+        border-color: #007acc;
+    }
+    QPushButton#selectAllBtn:pressed, QPushButton#deselectAllBtn:pressed {
+        background-color: #1d1d1d;
+    }
+    QLabel#searchModeLabel, QLabel#statusFilterLabel {
+        color: #888888;
+        font-size: 10pt;
+    }
+    QCheckBox#searchByNameCheckbox, QCheckBox#searchByTagsCheckbox {
+        color: #cccccc;
+        font-size: 10pt;
+        spacing: 5px;
+    }
+    QCheckBox#searchByNameCheckbox::indicator, QCheckBox#searchByTagsCheckbox::indicator {
+        width: 16px;
+        height: 16px;
+        border-radius: 3px;
+        border: 2px solid #3d3d3d;
+        background-color: #1e1e1e;
+    }
+    QCheckBox#searchByNameCheckbox::indicator:hover, QCheckBox#searchByTagsCheckbox::indicator:hover {
+        border: 2px solid #007acc;
+    }
+    QCheckBox#searchByNameCheckbox::indicator:checked, QCheckBox#searchByTagsCheckbox::indicator:checked {
+        background-color: #007acc;
+        border: 2px solid #005a9e;
+    }
+    QComboBox#statusFilterCombo {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 6px;
+        padding: 6px 12px;
+        font-size: 10pt;
+        min-width: 120px;
+    }
+    QComboBox#statusFilterCombo:hover {
+        border: 1px solid #007acc;
+    }
+    QComboBox#statusFilterCombo::drop-down {
+        border: none;
+        width: 20px;
+    }
+    QComboBox#statusFilterCombo::down-arrow {
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 5px solid #cccccc;
+        margin-right: 5px;
+    }
+    QComboBox#statusFilterCombo QAbstractItemView {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        selection-background-color: #007acc;
+        selection-color: #ffffff;
+        outline: none;
+    }
+    QPushButton#refreshBtn {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 6px;
+        font-size: 16px;
+    }
+    QPushButton#refreshBtn:hover {
+        background-color: #007acc;
+        border-color: #007acc;
+        color: #ffffff;
+    }
+    QPushButton#refreshBtn:pressed {
+        background-color: #005a9e;
+    }
+
+    /* ---------- Category list ---------- */
+    QScrollArea#categoryScrollArea {
+        background-color: #1e1e1e;
+        border: 1px solid #3d3d3d;
+        border-radius: 6px;
+    }
+    #categoryScrollArea QScrollBar:vertical {
+        background-color: #1e1e1e;
+        width: 12px;
+        border-radius: 6px;
+    }
+    #categoryScrollArea QScrollBar::handle:vertical {
+        background-color: #3d3d3d;
+        border-radius: 6px;
+        min-height: 30px;
+    }
+    #categoryScrollArea QScrollBar::handle:vertical:hover {
+        background-color: #4d4d4d;
+    }
+    QLabel#emptyLabel {
+        color: #888888;
+        font-size: 12pt;
+        padding: 50px;
+    }
+
+    /* ---------- Footer ---------- */
+    QLabel#countLabel {
+        color: #888888;
+        font-size: 10pt;
+    }
+    QPushButton#newCategoryBtn {
+        background-color: #007acc;
+        color: #ffffff;
+        border: 1px solid #005a9e;
+        border-radius: 6px;
+        padding: 10px 20px;
+        font-size: 10pt;
+        font-weight: 500;
+        min-width: 120px;
+    }
+    QPushButton#newCategoryBtn:hover {
+        background-color: #0088dd;
+        border: 1px solid #006bb3;
+    }
+    QPushButton#newCategoryBtn:pressed {
+        background-color: #006bb3;
+    }
+"""
+
+
+# Screen whose availableGeometryChanged invalidates the cached geometry
+_watched_screen = None
+_primary_screen_signal_connected = False
+
+
+@lru_cache(maxsize=1)
+def _primary_available_geometry() -> QRect:
+    """Available geometry of the primary screen (cached until screens change)"""
+    screen = QGuiApplication.primaryScreen()
+    _watch_primary_screen(screen)
+    return screen.availableGeometry()
+
+
+def _watch_primary_screen(screen):
+    """
+    Connect the cache invalidation signals exactly once
+
+    primaryScreenChanged is connected a single time; availableGeometryChanged
+    is moved from the previous primary screen to the current one.
+    """
+    global _watched_screen, _primary_screen_signal_connected
+
+    if not _primary_screen_signal_connected:
+        QGuiApplication.instance().primaryScreenChanged.connect(_clear_screen_geometry_cache)
+        _primary_screen_signal_connected = True
+
+    if screen is _watched_screen:
+        return
+
+    if _watched_screen is not None:
+        try:
+            _watched_screen.availableGeometryChanged.disconnect(_clear_screen_geometry_cache)
+        except (TypeError, RuntimeError):
+            pass  # The old screen was already removed
+    screen.availableGeometryChanged.connect(_clear_screen_geometry_cache)
+    _watched_screen = screen
+
+
+def _clear_screen_geometry_cache(*_args):
+    """Invalidate the cached primary screen geometry"""
+    _primary_available_geometry.cache_clear()
+
+
+class CategoriesLoadWorker(QThread):
+    """Worker thread que carga las categorías desde la BD sin bloquear la UI"""
+
+    loaded = pyqtSignal(list)  # categories
+    failed = pyqtSignal(str)  # error message
+
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.db = db
+
+    def run(self):
+        """Ejecuta la consulta de categorías"""
+        try:
+            # Conexión propia de solo lectura: la de la GUI no se comparte entre hilos
+            with self.db.reader() as reader_db:
+                categories = reader_db.get_categories(include_inactive=True)
+            self.loaded.emit(categories)
+        except Exception as e:
+            logger.error(f"Error in categories load worker: {e}", exc_info=True)
+            self.failed.emit(str(e))
+
 
 class CustomTitleBar(QWidget):
     """Custom title bar with minimize, maximize, and close buttons"""
@@ -35,19 +316,23 @@ class CustomTitleBar(QWidget):
         self.parent_window = parent
         self.title = title
         self.is_maximized = False
-        self.drag_position = None
+
+        # Drag state: cursor/window positions captured on press
+        self._press_global = None
+        self._press_topleft = None
+        self._pending_move = None
+
+        # Throttle window moves to ~60 fps while dragging
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._apply_pending_move)
 
         self.init_ui()
 
     def init_ui(self):
         """Initialize the title bar UI"""
         self.setFixedHeight(40)
-        self.setStyleSheet("""
-            CustomTitleBar {
-                background-color: #1e1e1e;
-                border-bottom: 1px solid #3d3d3d;
-            }
-        """)
 
         # Main layout
         layout = QHBoxLayout(self)
@@ -56,78 +341,34 @@ class CustomTitleBar(QWidget):
 
         # Title label
         self.title_label = QLabel(self.title)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 12pt;
-                font-weight: 500;
-            }
-        """)
+        self.title_label.setObjectName("titleLabel")
         layout.addWidget(self.title_label)
 
         # Spacer
         layout.addStretch()
 
-        # Window control buttons
-        button_style = """
-            QPushButton {
-                background-color: transparent;
-                color: #cccccc;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-            }
-            QPushButton:pressed {
-                background-color: #4d4d4d;
-            }
-        """
-
-        close_button_style = """
-            QPushButton {
-                background-color: transparent;
-                color: #cccccc;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e81123;
-                color: #ffffff;
-            }
-            QPushButton:pressed {
-                background-color: #c50b18;
-            }
-        """
-
         # Minimize button
         self.minimize_btn = QPushButton("−")
         self.minimize_btn.setFixedSize(40, 30)
-        self.minimize_btn.setStyleSheet(button_style)
+        self.minimize_btn.setObjectName("minimizeBtn")
         self.minimize_btn.clicked.connect(self.minimize_clicked.emit)
-        self.minimize_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.minimize_btn.setCursor(cached_cursor(Qt.CursorShape.PointingHandCursor))
         layout.addWidget(self.minimize_btn)
 
         # Maximize/Restore button
         self.maximize_btn = QPushButton("□")
         self.maximize_btn.setFixedSize(40, 30)
-        self.maximize_btn.setStyleSheet(button_style)
+        self.maximize_btn.setObjectName("maximizeBtn")
         self.maximize_btn.clicked.connect(self._on_maximize_clicked)
-        self.maximize_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.maximize_btn.setCursor(cached_cursor(Qt.CursorShape.PointingHandCursor))
         layout.addWidget(self.maximize_btn)
 
         # Close button
         self.close_btn = QPushButton("×")
         self.close_btn.setFixedSize(40, 30)
-        self.close_btn.setStyleSheet(close_button_style)
+        self.close_btn.setObjectName("closeBtn")
         self.close_btn.clicked.connect(self.close_clicked.emit)
-        self.close_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.close_btn.setCursor(cached_cursor(Qt.CursorShape.PointingHandCursor))
         layout.addWidget(self.close_btn)
 
     def _on_maximize_clicked(self):
@@ -139,18 +380,30 @@ class CustomTitleBar(QWidget):
     def mousePressEvent(self, event):
         """Handle mouse press for dragging"""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.drag_position = event.globalPosition().toPoint() - self.parent_window.frameGeometry().topLeft()
+            self._press_global = event.globalPosition().toPoint()
+            self._press_topleft = self.parent_window.frameGeometry().topLeft()
             event.accept()
 
     def mouseMoveEvent(self, event):
         """Handle mouse move for dragging"""
-        if event.buttons() == Qt.MouseButton.LeftButton and self.drag_position is not None:
-            self.parent_window.move(event.globalPosition().toPoint() - self.drag_position)
+        if event.buttons() == Qt.MouseButton.LeftButton and self._press_global is not None:
+            self._pending_move = self._press_topleft + (event.globalPosition().toPoint() - self._press_global)
+            if not self._move_timer.isActive():
+                self._move_timer.start()
             event.accept()
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release"""
-        self.drag_position = None
+        self._move_timer.stop()
+        self._apply_pending_move()
+        self._press_global = None
+        self._press_topleft = None
+
+    def _apply_pending_move(self):
+        """Move the window to the last position requested while dragging"""
+        if self._pending_move is not None:
+            self.parent_window.move(self._pending_move)
+            self._pending_move = None
 
     def mouseDoubleClickEvent(self, event):
         """Handle double click to maximize/restore"""
@@ -191,6 +444,36 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
         # Data
         self.all_categories = []
         self.filtered_categories = []
+        self._by_id = {}  # category_id -> category dict (same objects as all_categories)
+        self._active_count = 0  # Active categories in all_categories
+
+        # Pending controller filter cache invalidation (see _flush_filter_cache)
+        self._cache_dirty = False
+        self._has_invalidate = hasattr(self.controller, 'invalidate_filter_cache')
+
+        # Shared message box (created on first use, see _show_message)
+        self._message_box = None
+
+        # Background loading of categories
+        self._load_worker = None
+        self._reload_pending = False
+
+        # Trailing-edge throttle for load_categories()
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(100)
+        self._reload_timer.timeout.connect(self._do_load_categories)
+        self._rendered_count = 0  # Filas de filtered_categories ya creadas como widget
+
+        # Category row widgets: visible ones by category id and a free pool
+        self._active_items = {}
+        self._item_pool = []
+
+        # Search index (lowercase names/tags) and last search result
+        self._name_lower_index = []
+        self._tags_lower_index = []
+        self._position_by_id = {}
+        self._invalidate_search_cache()
 
         # Search debouncing
         self.search_timer = QTimer()
@@ -204,8 +487,10 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
         # Configurar soporte de minimización
         self.setup_taskbar_minimization()
 
+        # Categories are loaded the first time the window is shown
+        self._loaded = False
+
         self.init_ui()
-        self.load_categories()
 
     def init_ui(self):
         """Initialize the UI"""
@@ -220,14 +505,8 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
         self.resize(900, 600)
         self._center_on_screen()
 
-        # Apply dark theme
-        self.setStyleSheet("""
-            CategoryManagerWindow {
-                background-color: #2b2b2b;
-                border: 1px solid #3d3d3d;
-                border-radius: 8px;
-            }
-        """)
+        # Apply dark theme (single shared sheet for the whole window)
+        self.setStyleSheet(CATEGORY_MANAGER_STYLESHEET)
 
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -243,11 +522,7 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
 
         # Content area
         content_widget = QWidget()
-        content_widget.setStyleSheet("""
-            QWidget {
-                background-color: #2b2b2b;
-            }
-        """)
+        content_widget.setObjectName("contentArea")
         content_layout = QVBoxLayout(content_widget)
         content_layout.setContentsMargins(20, 20, 20, 20)
         content_layout.setSpacing(15)
@@ -278,102 +553,40 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
 
         # Search icon label
         search_icon = QLabel("🔍")
-        search_icon.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                color: #888888;
-            }
-        """)
+        search_icon.setObjectName("searchIcon")
         first_row_layout.addWidget(search_icon)
 
         # Search input
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Buscar categorías...")
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #1e1e1e;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 6px;
-                padding: 10px 15px;
-                font-size: 11pt;
-            }
-            QLineEdit:focus {
-                border: 1px solid #007acc;
-            }
-        """)
+        self.search_input.setObjectName("searchInput")
         self.search_input.textChanged.connect(self._on_search_text_changed)
         first_row_layout.addWidget(self.search_input, 1)
 
         # Clear button
         self.clear_btn = QPushButton("×")
         self.clear_btn.setFixedSize(35, 35)
-        self.clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #888888;
-                border: none;
-                border-radius: 17px;
-                font-size: 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                color: #cccccc;
-            }
-        """)
+        self.clear_btn.setObjectName("clearSearchBtn")
         self.clear_btn.clicked.connect(self._clear_search)
         self.clear_btn.hide()  # Hidden by default
-        self.clear_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.clear_btn.setCursor(cached_cursor(Qt.CursorShape.PointingHandCursor))
         first_row_layout.addWidget(self.clear_btn)
 
         # Select All button
         self.select_all_btn = QPushButton("☑ Todos")
         self.select_all_btn.setFixedHeight(35)
-        self.select_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 6px;
-                padding: 0 15px;
-                font-size: 10pt;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border-color: #007acc;
-            }
-            QPushButton:pressed {
-                background-color: #1d1d1d;
-            }
-        """)
+        self.select_all_btn.setObjectName("selectAllBtn")
         self.select_all_btn.clicked.connect(self._select_all_categories)
-        self.select_all_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.select_all_btn.setCursor(cached_cursor(Qt.CursorShape.PointingHandCursor))
         self.select_all_btn.setToolTip("Activar categorías filtradas (visibles)")
         first_row_layout.addWidget(self.select_all_btn)
 
         # Deselect All button
         self.deselect_all_btn = QPushButton("☐ Ninguno")
         self.deselect_all_btn.setFixedHeight(35)
-        self.deselect_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 6px;
-                padding: 0 15px;
-                font-size: 10pt;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border-color: #007acc;
-            }
-            QPushButton:pressed {
-                background-color: #1d1d1d;
-            }
-        """)
+        self.deselect_all_btn.setObjectName("deselectAllBtn")
         self.deselect_all_btn.clicked.connect(self._deselect_all_categories)
-        self.deselect_all_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.deselect_all_btn.setCursor(cached_cursor(Qt.CursorShape.PointingHandCursor))
         self.deselect_all_btn.setToolTip("Desactivar categorías filtradas (visibles)")
         first_row_layout.addWidget(self.deselect_all_btn)
 
@@ -388,69 +601,23 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
 
         # Label for search mode
         mode_label = QLabel("Buscar por:")
-        mode_label.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                font-size: 10pt;
-            }
-        """)
+        mode_label.setObjectName("searchModeLabel")
         second_row_layout.addWidget(mode_label)
 
         # Checkbox for search by name
-        from PyQt6.QtWidgets import QCheckBox
         self.search_by_name_checkbox = QCheckBox("Nombre")
         self.search_by_name_checkbox.setChecked(True)  # Default: search by name
-        self.search_by_name_checkbox.setStyleSheet("""
-            QCheckBox {
-                color: #cccccc;
-                font-size: 10pt;
-                spacing: 5px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 3px;
-                border: 2px solid #3d3d3d;
-                background-color: #1e1e1e;
-            }
-            QCheckBox::indicator:hover {
-                border: 2px solid #007acc;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #007acc;
-                border: 2px solid #005a9e;
-            }
-        """)
+        self.search_by_name_checkbox.setObjectName("searchByNameCheckbox")
         self.search_by_name_checkbox.stateChanged.connect(self._on_search_mode_changed)
-        self.search_by_name_checkbox.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.search_by_name_checkbox.setCursor(cached_cursor(Qt.CursorShape.PointingHandCursor))
         second_row_layout.addWidget(self.search_by_name_checkbox)
 
         # Checkbox for search by tags
         self.search_by_tags_checkbox = QCheckBox("Tags")
         self.search_by_tags_checkbox.setChecked(False)
-        self.search_by_tags_checkbox.setStyleSheet("""
-            QCheckBox {
-                color: #cccccc;
-                font-size: 10pt;
-                spacing: 5px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 3px;
-                border: 2px solid #3d3d3d;
-                background-color: #1e1e1e;
-            }
-            QCheckBox::indicator:hover {
-                border: 2px solid #007acc;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #007acc;
-                border: 2px solid #005a9e;
-            }
-        """)
+        self.search_by_tags_checkbox.setObjectName("searchByTagsCheckbox")
         self.search_by_tags_checkbox.stateChanged.connect(self._on_search_mode_changed)
-        self.search_by_tags_checkbox.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.search_by_tags_checkbox.setCursor(cached_cursor(Qt.CursorShape.PointingHandCursor))
         second_row_layout.addWidget(self.search_by_tags_checkbox)
 
         # Spacer between search mode and status filter
@@ -458,80 +625,26 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
 
         # Status filter label
         status_label = QLabel("Estado:")
-        status_label.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                font-size: 10pt;
-            }
-        """)
+        status_label.setObjectName("statusFilterLabel")
         second_row_layout.addWidget(status_label)
 
         # Status filter combobox
-        from PyQt6.QtWidgets import QComboBox
         self.status_filter_combo = QComboBox()
         self.status_filter_combo.addItem("Todos", "all")
         self.status_filter_combo.addItem("Activados", "active")
         self.status_filter_combo.addItem("Desactivados", "inactive")
         self.status_filter_combo.setCurrentIndex(0)  # Default: Todos
-        self.status_filter_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-size: 10pt;
-                min-width: 120px;
-            }
-            QComboBox:hover {
-                border: 1px solid #007acc;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 5px solid #cccccc;
-                margin-right: 5px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                selection-background-color: #007acc;
-                selection-color: #ffffff;
-                outline: none;
-            }
-        """)
+        self.status_filter_combo.setObjectName("statusFilterCombo")
         self.status_filter_combo.currentIndexChanged.connect(self._on_status_filter_changed)
-        self.status_filter_combo.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.status_filter_combo.setCursor(cached_cursor(Qt.CursorShape.PointingHandCursor))
         second_row_layout.addWidget(self.status_filter_combo)
 
         # Refresh button
         self.refresh_btn = QPushButton("🔄")
         self.refresh_btn.setFixedSize(35, 35)
-        self.refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 6px;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #007acc;
-                border-color: #007acc;
-                color: #ffffff;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-        """)
+        self.refresh_btn.setObjectName("refreshBtn")
         self.refresh_btn.clicked.connect(self._on_refresh_categories)
-        self.refresh_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.refresh_btn.setCursor(cached_cursor(Qt.CursorShape.PointingHandCursor))
         self.refresh_btn.setToolTip("Refrescar lista de categorías")
         second_row_layout.addWidget(self.refresh_btn)
 
@@ -549,26 +662,7 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: #1e1e1e;
-                border: 1px solid #3d3d3d;
-                border-radius: 6px;
-            }
-            QScrollBar:vertical {
-                background-color: #1e1e1e;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #3d3d3d;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #4d4d4d;
-            }
-        """)
+        self.scroll_area.setObjectName("categoryScrollArea")
 
         # Container for category list
         self.list_container = QWidget()
@@ -579,18 +673,16 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
 
         # Empty state label
         self.empty_label = QLabel("No se encontraron categorías")
-        self.empty_label.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                font-size: 12pt;
-                padding: 50px;
-            }
-        """)
+        self.empty_label.setObjectName("emptyLabel")
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.empty_label.hide()
         self.list_layout.addWidget(self.empty_label)
 
+        # Hidden parent used to destroy old rows in one go (see update_category_list)
+        self._gc_parent = QWidget()
+
         self.scroll_area.setWidget(self.list_container)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._on_list_scrolled)
         parent_layout.addWidget(self.scroll_area, 1)
 
     def _create_footer(self, parent_layout):
@@ -602,70 +694,53 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
 
         # Category count label
         self.count_label = QLabel("0 categorías (0 activas)")
-        self.count_label.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                font-size: 10pt;
-            }
-        """)
+        self.count_label.setObjectName("countLabel")
         footer_layout.addWidget(self.count_label)
 
         # Spacer
         footer_layout.addStretch()
 
-        # Action buttons style
-        button_style = """
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-size: 10pt;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border: 1px solid #4d4d4d;
-            }
-            QPushButton:pressed {
-                background-color: #252525;
-            }
-        """
-
-        primary_button_style = """
-            QPushButton {
-                background-color: #007acc;
-                color: #ffffff;
-                border: 1px solid #005a9e;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-size: 10pt;
-                font-weight: 500;
-                min-width: 120px;
-            }
-            QPushButton:hover {
-                background-color: #0088dd;
-                border: 1px solid #006bb3;
-            }
-            QPushButton:pressed {
-                background-color: #006bb3;
-            }
-        """
-
         # Nueva Categoría button (primary)
         self.new_category_btn = QPushButton("+ Nueva Categoría")
-        self.new_category_btn.setStyleSheet(primary_button_style)
-        self.new_category_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.new_category_btn.setObjectName("newCategoryBtn")
+        self.new_category_btn.setCursor(cached_cursor(Qt.CursorShape.PointingHandCursor))
         self.new_category_btn.clicked.connect(self._on_create_category)
         footer_layout.addWidget(self.new_category_btn)
 
         parent_layout.addWidget(footer_widget)
 
+    def _show_message(self, icon, title, text,
+                      buttons=QMessageBox.StandardButton.Ok,
+                      default_button=QMessageBox.StandardButton.NoButton):
+        """
+        Show a modal message reusing a single QMessageBox instance
+
+        Args:
+            icon: QMessageBox.Icon to display
+            title: Window title
+            text: Message text
+            buttons: Standard buttons to offer
+            default_button: Default button (NoButton for Qt's choice)
+
+        Returns:
+            QMessageBox.StandardButton: The button the user clicked
+        """
+        if self._message_box is None:
+            self._message_box = QMessageBox(self)
+
+        box = self._message_box
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(buttons)
+        box.setDefaultButton(default_button)
+        box.exec()
+
+        return box.standardButton(box.clickedButton())
+
     def _center_on_screen(self):
         """Center the window on screen"""
-        from PyQt6.QtGui import QScreen
-        screen = QScreen.availableGeometry(self.screen())
+        screen = _primary_available_geometry()
         x = (screen.width() - self.width()) // 2
         y = (screen.height() - self.height()) // 2
         self.move(x, y)
@@ -710,8 +785,8 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
 
             # Confirm action
             count = len(category_ids)
-            reply = QMessageBox.question(
-                self,
+            reply = self._show_message(
+                QMessageBox.Icon.Question,
                 "Confirmar activación",
                 f"¿Estás seguro de activar {'todas las' if count > 1 else 'la'} {count} {'categorías' if count > 1 else 'categoría'} filtrada{'s' if count > 1 else ''}?\n\nEsto hará que {'estas categorías' if count > 1 else 'esta categoría'} sea{'n' if count > 1 else ''} visible{'s' if count > 1 else ''} en el sidebar.",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
@@ -729,14 +804,15 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
             self.load_categories()
 
             # Emit signal to update sidebar
+            self._flush_filter_cache()
             self.categories_changed.emit()
 
             logger.info(f"Activated {len(category_ids)} filtered categories")
 
         except Exception as e:
             logger.error(f"Error selecting all categories: {e}", exc_info=True)
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Warning,
                 "Error",
                 f"No se pudieron activar todas las categorías:\n{str(e)}"
             )
@@ -755,8 +831,8 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
 
             # Confirm action
             count = len(category_ids)
-            reply = QMessageBox.question(
-                self,
+            reply = self._show_message(
+                QMessageBox.Icon.Question,
                 "Confirmar desactivación",
                 f"¿Estás seguro de desactivar {'todas las' if count > 1 else 'la'} {count} {'categorías' if count > 1 else 'categoría'} filtrada{'s' if count > 1 else ''}?\n\nEsto ocultará {'estas categorías' if count > 1 else 'esta categoría'} del sidebar.",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
@@ -774,14 +850,15 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
             self.load_categories()
 
             # Emit signal to update sidebar
+            self._flush_filter_cache()
             self.categories_changed.emit()
 
             logger.info(f"Deactivated {count} filtered categories")
 
         except Exception as e:
             logger.error(f"Error deselecting all categories: {e}", exc_info=True)
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Warning,
                 "Error",
                 f"No se pudieron desactivar todas las categorías:\n{str(e)}"
             )
@@ -793,9 +870,8 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
             # Re-check the one that was just unchecked
             sender = self.sender()
             if sender:
-                sender.blockSignals(True)
-                sender.setChecked(True)
-                sender.blockSignals(False)
+                with QSignalBlocker(sender):
+                    sender.setChecked(True)
             return
 
         # Update placeholder text based on selected mode
@@ -832,97 +908,206 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
             # Reset button after 500ms
             QTimer.singleShot(500, lambda: self.refresh_btn.setText(original_text))
 
-            logger.info(f"Categories refreshed: {len(self.all_categories)} total")
+            logger.info("Categories refresh requested")
 
         except Exception as e:
             logger.error(f"Error refreshing categories: {e}")
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Warning,
                 "Error",
                 f"No se pudieron refrescar las categorías:\n{str(e)}"
             )
 
+    def _rebuild_search_index(self):
+        """Precompute lowercase names/tags of all_categories for searching"""
+        self._name_lower_index = [cat['name'].lower() for cat in self.all_categories]
+        self._position_by_id = {cat['id']: i for i, cat in enumerate(self.all_categories)}
+
+        tags_index = []
+        for cat in self.all_categories:
+            tags = cat.get('tags')
+            # Parse tags if it's a JSON string
+            if isinstance(tags, str):
+                try:
+                    tags = json.loads(tags)
+                except:
+                    tags = []
+            if not isinstance(tags, list):
+                tags = []
+            tags_index.append([tag.lower() for tag in tags])
+        self._tags_lower_index = tags_index
+
+        self._invalidate_search_cache()
+
+    def _invalidate_search_cache(self):
+        """Forget the last search result so the next one scans everything"""
+        self._last_query = ''
+        self._last_search_mode = None
+        self._last_filtered_idx = []
+
+    def _search_names_in_db(self, search_text):
+        """Return the ids of categories whose name contains search_text (SQL LIKE)"""
+        try:
+            return {row['id'] for row in self.db.search_categories(search_text)}
+        except Exception as e:
+            logger.error(f"Error searching categories in database: {e}")
+            # Fall back to the in-memory index
+            return {
+                self.all_categories[i]['id']
+                for i, name in enumerate(self._name_lower_index)
+                if name.find(search_text) >= 0
+            }
+
     def _perform_search(self):
         """Perform the search and update the list"""
         search_text = self.search_input.text().strip().lower()
 
-        # Get status filter
+        # Get status filter and search mode
         status_filter = self.status_filter_combo.currentData()  # "all", "active", or "inactive"
-
-        # First, apply status filter
-        if status_filter == "active":
-            base_categories = [cat for cat in self.all_categories if cat.get('is_active', 1)]
-        elif status_filter == "inactive":
-            base_categories = [cat for cat in self.all_categories if not cat.get('is_active', 1)]
-        else:  # "all"
-            base_categories = self.all_categories
-
-        # Then, apply search filter
-        if not search_text:
-            # Show all categories (with status filter applied)
-            self.filtered_categories = base_categories
+        search_by_name = self.search_by_name_checkbox.isChecked()
+        search_by_tags = self.search_by_tags_checkbox.isChecked()
+        search_mode = (status_filter, search_by_name, search_by_tags)
+
+        # When the user keeps typing (new query extends the previous one with
+        # the same filters) only the previous matches need to be checked
+        sql_name_ids = None
+        if (self._last_query and search_text.startswith(self._last_query)
+                and search_mode == self._last_search_mode):
+            candidates = self._last_filtered_idx
+        elif search_text and search_by_name and len(self.all_categories) > SQL_SEARCH_THRESHOLD:
+            # Large sets: let SQLite filter names; only tag search stays in Python
+            sql_name_ids = self._search_names_in_db(search_text)
+            if search_by_tags:
+                candidates = range(len(self.all_categories))
+            else:
+                candidates = sorted(
+                    self._position_by_id[cat_id] for cat_id in sql_name_ids
+                    if cat_id in self._position_by_id
+                )
         else:
-            # Determine search mode
-            search_by_name = self.search_by_name_checkbox.isChecked()
-            search_by_tags = self.search_by_tags_checkbox.isChecked()
-
-            self.filtered_categories = []
-
-            for cat in base_categories:
-                match = False
-
-                # Search by name
-                if search_by_name and search_text in cat['name'].lower():
-                    match = True
-
-                # Search by tags
-                if search_by_tags and not match:
-                    tags = cat.get('tags')
-                    if tags:
-                        # Parse tags if it's a JSON string
-                        import json
-                        if isinstance(tags, str):
-                            try:
-                                tags = json.loads(tags)
-                            except:
-                                tags = []
-
-                        if isinstance(tags, list):
-                            # Check if search text matches any tag
-                            for tag in tags:
-                                if search_text in tag.lower():
-                                    match = True
-                                    break
-
-                if match:
-                    self.filtered_categories.append(cat)
+            candidates = range(len(self.all_categories))
+
+        name_index = self._name_lower_index
+        tags_index = self._tags_lower_index
+        matched_idx = []
+
+        for i in candidates:
+            cat = self.all_categories[i]
+
+            # First, apply status filter
+            if status_filter == "active" and not cat.get('is_active', 1):
+                continue
+            if status_filter == "inactive" and cat.get('is_active', 1):
+                continue
+
+            # Then, apply search filter
+            if not search_text:
+                matched_idx.append(i)
+            elif sql_name_ids is not None and cat['id'] in sql_name_ids:
+                matched_idx.append(i)
+            elif sql_name_ids is None and search_by_name and name_index[i].find(search_text) >= 0:
+                matched_idx.append(i)
+            elif search_by_tags and any(tag.find(search_text) >= 0 for tag in tags_index[i]):
+                matched_idx.append(i)
+
+        self._last_query = search_text
+        self._last_search_mode = search_mode
+        self._last_filtered_idx = matched_idx
+
+        self.filtered_categories = [self.all_categories[i] for i in matched_idx]
 
         self.update_category_list()
 
     def load_categories(self):
-        """Load all categories from database"""
+        """
+        Request a reload of the categories
+
+        Bursts of calls are coalesced by a 100 ms single-shot timer into one
+        load (see _do_load_categories).
+        """
+        self._reload_timer.start()
+
+    def _do_load_categories(self):
+        """Load all categories from database (in a background thread)"""
         if not self.db:
             logger.error("Database not available")
             return
 
-        try:
-            # Load all categories (including inactive)
-            self.all_categories = self.db.get_categories(include_inactive=True)
-            self.filtered_categories = self.all_categories
-            self.update_category_list()
-            self.update_count_label()
+        # A load is already running: reload again once it finishes
+        if self._load_worker is not None and self._load_worker.isRunning():
+            self._reload_pending = True
+            return
 
-            logger.info(f"Loaded {len(self.all_categories)} categories")
-        except Exception as e:
-            logger.error(f"Error loading categories: {e}")
+        self._reload_pending = False
+        self._load_worker = CategoriesLoadWorker(self.db, parent=self)
+        self._load_worker.loaded.connect(self._on_categories_loaded)
+        self._load_worker.failed.connect(self._on_categories_load_failed)
+        self._load_worker.finished.connect(self._load_worker.deleteLater)
+        self._load_worker.start()
+
+    def _on_categories_loaded(self, categories):
+        """Apply the categories fetched by CategoriesLoadWorker"""
+        # The worker deletes itself once its thread finishes
+        self._load_worker = None
+
+        if self._reload_pending:
+            # Data changed while loading: discard this result and fetch again
+            self._do_load_categories()
+            return
+
+        self.all_categories = categories
+        self.filtered_categories = self.all_categories
+        self._by_id = {cat['id']: cat for cat in self.all_categories}
+        self._active_count = sum(1 for cat in self.all_categories if cat.get('is_active', 1))
+        self._rebuild_search_index()
+        self.update_category_list()
+        self.update_count_label()
+
+        logger.info(f"Loaded {len(self.all_categories)} categories")
+
+    def _on_categories_load_failed(self, error_msg):
+        """Handle a failed background load"""
+        logger.error(f"Error loading categories: {error_msg}")
+        self._load_worker = None
+        if self._reload_pending:
+            self._do_load_categories()
 
     def update_category_list(self):
         """Update the category list display"""
-        # Clear existing items (except empty label)
-        for i in reversed(range(self.list_layout.count())):
-            widget = self.list_layout.itemAt(i).widget()
-            if widget and widget != self.empty_label:
-                widget.deleteLater()
+        # Detach the container from the scroll area and freeze painting and
+        # layout while rebuilding, so Qt does a single layout pass at the end
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar.blockSignals(True)
+        self.scroll_area.takeWidget()
+        self.list_container.setUpdatesEnabled(False)
+        self.list_layout.setEnabled(False)
+
+        try:
+            self._rebuild_category_rows()
+        finally:
+            self.list_layout.setEnabled(True)
+            self.scroll_area.setWidget(self.list_container)
+            self.list_container.setUpdatesEnabled(True)
+            scroll_bar.blockSignals(False)
+
+    def _rebuild_category_rows(self):
+        """Replace the rows of the list with the current filtered categories"""
+        # Clear existing items: detach the empty label, park category rows in
+        # the pool for reuse and destroy anything else in one go through a
+        # hidden scratch parent
+        self.list_layout.removeWidget(self.empty_label)
+        while (item := self.list_layout.takeAt(0)) is not None:
+            widget = item.widget()
+            if isinstance(widget, CategoryListItem):
+                self._park_item_widget(widget)
+            elif widget:
+                widget.setParent(self._gc_parent)
+        self._active_items.clear()
+        self._gc_parent.deleteLater()
+        self._gc_parent = QWidget()
+        self.list_layout.addWidget(self.empty_label)
+
+        self._rendered_count = 0
 
         # Show empty state if no categories
         if not self.filtered_categories:
@@ -931,26 +1116,120 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
 
         self.empty_label.hide()
 
-        # Add category items with CategoryListItem widget
-        for category in self.filtered_categories:
-            item_widget = CategoryListItem(category, db=self.db, parent=self)
+        # Only the first batch is created now; the rest is created on demand
+        # while scrolling (see _on_list_scrolled)
+        self._render_next_batch()
+
+        self.update_count_label()
+
+    def _render_next_batch(self):
+        """Show rows for the next batch of filtered categories"""
+        start = self._rendered_count
+        end = min(start + RENDER_BATCH_SIZE, len(self.filtered_categories))
+
+        # When called from update_category_list updates are already frozen
+        freeze = self.list_container.updatesEnabled()
+        if freeze:
+            self.list_container.setUpdatesEnabled(False)
+        try:
+            for category in self.filtered_categories[start:end]:
+                item_widget = self._acquire_item_widget(category)
+                self._active_items[category['id']] = item_widget
+                self.list_layout.addWidget(item_widget)
+                item_widget.show()
+        finally:
+            if freeze:
+                self.list_container.setUpdatesEnabled(True)
+
+        self._rendered_count = end
+
+    def _acquire_item_widget(self, category):
+        """Take a CategoryListItem from the pool (or create one) bound to category"""
+        if self._item_pool:
+            item_widget = self._item_pool.pop()
+            item_widget.rebind(category, self.db)
+            return item_widget
+
+        item_widget = CategoryListItem(category, db=self.db, parent=self.list_container)
+
+        # Connect signals (once per widget lifetime, pooled widgets keep them)
+        item_widget.active_toggled.connect(self._on_category_active_toggled)
+        item_widget.edit_requested.connect(self._on_edit_category)
+        item_widget.delete_requested.connect(self._on_delete_category)
+        item_widget.duplicate_requested.connect(self._on_duplicate_category)
+        item_widget.pin_toggled.connect(self._on_pin_category)
+
+        return item_widget
+
+    def _park_item_widget(self, item_widget):
+        """Hide a CategoryListItem and keep it in the pool for later reuse"""
+        item_widget.hide()
+        self._item_pool.append(item_widget)
+
+    def _on_list_scrolled(self, value):
+        """Render the next batch when the scroll gets close to the end"""
+        if self._rendered_count >= len(self.filtered_categories):
+            return
+
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        if value >= scroll_bar.maximum() - RENDER_AHEAD_PX:
+            self._render_next_batch()
+
+    def _find_item_widget(self, category_id):
+        """Return the rendered CategoryListItem for a category, if any"""
+        return self._active_items.get(category_id)
+
+    def _matches_status_filter(self, category):
+        """Check whether a category passes the current status filter"""
+        status_filter = self.status_filter_combo.currentData()
+        if status_filter == "active":
+            return bool(category.get('is_active', 1))
+        if status_filter == "inactive":
+            return not category.get('is_active', 1)
+        return True
+
+    def _refresh_category_row(self, category):
+        """Update a single row in place after its category dict changed"""
+        self._invalidate_search_cache()
+
+        if category in self.filtered_categories and not self._matches_status_filter(category):
+            # The row drops out of the current filter: recompute the list
+            self._perform_search()
+            return
+
+        item_widget = self._find_item_widget(category['id'])
+        if item_widget:
+            item_widget.update_from_dict(category)
+        self.update_count_label()
+
+    def _remove_category_row(self, category):
+        """Remove a single category from memory and from the list"""
+        self.all_categories = [cat for cat in self.all_categories if cat['id'] != category['id']]
+        self._by_id.pop(category['id'], None)
+        if category.get('is_active', 1):
+            self._active_count -= 1
+        self._rebuild_search_index()
 
-            # Connect signals
-            item_widget.active_toggled.connect(self._on_category_active_toggled)
-            item_widget.edit_requested.connect(self._on_edit_category)
-            item_widget.delete_requested.connect(self._on_delete_category)
-            item_widget.duplicate_requested.connect(self._on_duplicate_category)
-            item_widget.pin_toggled.connect(self._on_pin_category)
+        if category in self.filtered_categories:
+            index = self.filtered_categories.index(category)
+            self.filtered_categories = [cat for cat in self.filtered_categories if cat['id'] != category['id']]
 
-            self.list_layout.addWidget(item_widget)
+            item_widget = self._active_items.pop(category['id'], None)
+            if item_widget:
+                self.list_layout.removeWidget(item_widget)
+                self._park_item_widget(item_widget)
+            if index < self._rendered_count:
+                self._rendered_count -= 1
+
+            if not self.filtered_categories:
+                self.empty_label.show()
 
         self.update_count_label()
 
     def update_count_label(self):
         """Update the category count label"""
         total = len(self.all_categories)
-        active = sum(1 for cat in self.all_categories if cat.get('is_active', 1))
-        self.count_label.setText(f"{total} categorías ({active} activas)")
+        self.count_label.setText(f"{total} categorías ({self._active_count} activas)")
 
     def _on_create_category(self):
         """Handle create category button click"""
@@ -980,23 +1259,19 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
                 # Reload categories
                 self.load_categories()
 
-                # Invalidate cache
-                if self.controller:
-                    try:
-                        self.controller.invalidate_filter_cache()
-                    except AttributeError:
-                        pass
+                # Invalidate filter cache (flushed once when the window is hidden/closed)
+                self._cache_dirty = True
 
                 # Show success message
-                QMessageBox.information(
-                    self,
+                self._show_message(
+                    QMessageBox.Icon.Information,
                     "Categoría Creada",
                     f"La categoría '{data['name']}' ha sido creada exitosamente."
                 )
             except Exception as e:
                 logger.error(f"Error creating category: {e}")
-                QMessageBox.critical(
-                    self,
+                self._show_message(
+                    QMessageBox.Icon.Critical,
                     "Error",
                     f"No se pudo crear la categoría: {str(e)}"
                 )
@@ -1005,22 +1280,26 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
         """Handle category active state toggle"""
         logger.info(f"Category {category_id} active state toggled to: {is_active}")
 
-        # Update count label
-        self.load_categories()
+        # Update the in-memory category and only its row (the item widget
+        # already persisted the change and updated its own look)
+        category = self._by_id.get(category_id)
+        if category:
+            if bool(category.get('is_active', 1)) != bool(is_active):
+                self._active_count += 1 if is_active else -1
+            category['is_active'] = 1 if is_active else 0
+            self._refresh_category_row(category)
+        else:
+            self.load_categories()
 
-        # Invalidate filter cache
-        if self.controller:
-            try:
-                self.controller.invalidate_filter_cache()
-            except AttributeError:
-                logger.warning("Controller does not have invalidate_filter_cache method")
+        # Invalidate filter cache (flushed once when the window is hidden/closed)
+        self._cache_dirty = True
 
     def _on_edit_category(self, category_id):
         """Handle edit category request"""
         # Get category data
-        category = next((cat for cat in self.all_categories if cat['id'] == category_id), None)
+        category = self._by_id.get(category_id)
         if not category:
-            QMessageBox.warning(self, "Error", "Categoría no encontrada.")
+            self._show_message(QMessageBox.Icon.Warning, "Error", "Categoría no encontrada.")
             return
 
         # Open edit dialog
@@ -1041,26 +1320,32 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
 
                 logger.info(f"Category {category_id} updated: {data['name']}")
 
-                # Reload categories
-                self.load_categories()
+                # Update the in-memory category and its row
+                category['name'] = data['name']
+                category['icon'] = data['icon']
+                category['tags'] = data.get('tags', [])
+                category['color'] = data.get('color')
+                self._rebuild_search_index()
+
+                if self.search_input.text().strip():
+                    # New name/tags may change whether the row matches the search
+                    self._perform_search()
+                else:
+                    self._refresh_category_row(category)
 
-                # Invalidate cache
-                if self.controller:
-                    try:
-                        self.controller.invalidate_filter_cache()
-                    except AttributeError:
-                        pass
+                # Invalidate filter cache (flushed once when the window is hidden/closed)
+                self._cache_dirty = True
 
                 # Show success message
-                QMessageBox.information(
-                    self,
+                self._show_message(
+                    QMessageBox.Icon.Information,
                     "Categoría Actualizada",
                     f"La categoría '{data['name']}' ha sido actualizada exitosamente."
                 )
             except Exception as e:
                 logger.error(f"Error updating category: {e}")
-                QMessageBox.critical(
-                    self,
+                self._show_message(
+                    QMessageBox.Icon.Critical,
                     "Error",
                     f"No se pudo actualizar la categoría: {str(e)}"
                 )
@@ -1068,13 +1353,13 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
     def _on_delete_category(self, category_id):
         """Handle delete category request"""
         # Get category name
-        category = next((cat for cat in self.all_categories if cat['id'] == category_id), None)
+        category = self._by_id.get(category_id)
         if not category:
             return
 
         # Confirmation dialog
-        reply = QMessageBox.question(
-            self,
+        reply = self._show_message(
+            QMessageBox.Icon.Question,
             "Eliminar Categoría",
             f"¿Estás seguro de que deseas eliminar la categoría '{category['name']}'?\n\n"
             f"Esta acción eliminará la categoría y todos sus items asociados.",
@@ -1088,26 +1373,22 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
                 self.db.delete_category(category_id)
                 logger.info(f"Category {category_id} deleted successfully")
 
-                # Reload categories
-                self.load_categories()
+                # Remove only the deleted row
+                self._remove_category_row(category)
 
-                # Invalidate cache
-                if self.controller:
-                    try:
-                        self.controller.invalidate_filter_cache()
-                    except AttributeError:
-                        pass
+                # Invalidate filter cache (flushed once when the window is hidden/closed)
+                self._cache_dirty = True
 
                 # Show success message
-                QMessageBox.information(
-                    self,
+                self._show_message(
+                    QMessageBox.Icon.Information,
                     "Categoría Eliminada",
                     f"La categoría '{category['name']}' ha sido eliminada exitosamente."
                 )
             except Exception as e:
                 logger.error(f"Error deleting category: {e}")
-                QMessageBox.critical(
-                    self,
+                self._show_message(
+                    QMessageBox.Icon.Critical,
                     "Error",
                     f"No se pudo eliminar la categoría: {str(e)}"
                 )
@@ -1115,9 +1396,9 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
     def _on_duplicate_category(self, category_id):
         """Handle duplicate category request"""
         # Get category data
-        category = next((cat for cat in self.all_categories if cat['id'] == category_id), None)
+        category = self._by_id.get(category_id)
         if not category:
-            QMessageBox.warning(self, "Error", "Categoría no encontrada.")
+            self._show_message(QMessageBox.Icon.Warning, "Error", "Categoría no encontrada.")
             return
 
         # Open duplicate dialog (with "Copia de" prefix)
@@ -1144,8 +1425,8 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
                 logger.info(f"Category duplicated: {data['name']} (new ID: {new_category_id})")
 
                 # Ask if user wants to duplicate items too
-                reply = QMessageBox.question(
-                    self,
+                reply = self._show_message(
+                    QMessageBox.Icon.Question,
                     "Duplicar Items",
                     f"Categoría '{data['name']}' creada.\n\n"
                     f"¿Deseas también duplicar los items de la categoría original?",
@@ -1157,40 +1438,39 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
                     # Get items from original category
                     original_items = self.db.get_items_by_category(category_id)
 
-                    for item in original_items:
-                        self.db.add_item(
-                            category_id=new_category_id,
-                            label=item['label'],
-                            content=item['content'],
-                            item_type=item.get('item_type', 'TEXT'),
-                            is_sensitive=item.get('is_sensitive', 0),
-                            description=item.get('description'),
-                            tags=item.get('tags', [])
-                        )
+                    # Insert all copies in a single transaction
+                    self.db.add_items_bulk([
+                        {
+                            'category_id': new_category_id,
+                            'label': item['label'],
+                            'content': item['content'],
+                            'item_type': item.get('type', 'TEXT'),
+                            'is_sensitive': item.get('is_sensitive', 0),
+                            'description': item.get('description'),
+                            'tags': item.get('tags', [])
+                        }
+                        for item in original_items
+                    ])
 
                     logger.info(f"Duplicated {len(original_items)} items to category {new_category_id}")
 
                 # Reload categories
                 self.load_categories()
 
-                # Invalidate cache
-                if self.controller:
-                    try:
-                        self.controller.invalidate_filter_cache()
-                    except AttributeError:
-                        pass
+                # Invalidate filter cache (flushed once when the window is hidden/closed)
+                self._cache_dirty = True
 
                 # Show success message
                 items_msg = f" con {len(original_items)} items" if reply == QMessageBox.StandardButton.Yes else ""
-                QMessageBox.information(
-                    self,
+                self._show_message(
+                    QMessageBox.Icon.Information,
                     "Categoría Duplicada",
                     f"La categoría '{data['name']}' ha sido duplicada exitosamente{items_msg}."
                 )
             except Exception as e:
                 logger.error(f"Error duplicating category: {e}")
-                QMessageBox.critical(
-                    self,
+                self._show_message(
+                    QMessageBox.Icon.Critical,
                     "Error",
                     f"No se pudo duplicar la categoría: {str(e)}"
                 )
@@ -1198,7 +1478,7 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
     def _on_pin_category(self, category_id):
         """Handle pin/unpin category request"""
         # Get category
-        category = next((cat for cat in self.all_categories if cat['id'] == category_id), None)
+        category = self._by_id.get(category_id)
         if not category:
             return
 
@@ -1216,13 +1496,14 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
                 )
                 logger.info(f"Category {category_id} pinned state changed to: {new_pinned}")
 
-                # Reload categories
-                self.load_categories()
+                # Update the in-memory category and its row
+                category['is_pinned'] = 1 if new_pinned else 0
+                self._refresh_category_row(category)
 
                 # Show feedback
                 action = "anclada" if new_pinned else "desanclada"
-                QMessageBox.information(
-                    self,
+                self._show_message(
+                    QMessageBox.Icon.Information,
                     "Categoría Actualizada",
                     f"La categoría '{category['name']}' ha sido {action} exitosamente."
                 )
@@ -1230,12 +1511,19 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
                 logger.warning("Database does not support pinned status update")
         except Exception as e:
             logger.error(f"Error updating pinned status: {e}")
-            QMessageBox.critical(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Critical,
                 "Error",
                 f"No se pudo actualizar el estado de anclaje: {str(e)}"
             )
 
+    def showEvent(self, event):
+        """Load categories lazily on first show"""
+        if not self._loaded:
+            self.load_categories()
+            self._loaded = True
+        super().showEvent(event)
+
     def changeEvent(self, event):
         """Interceptar minimización para usar barra lateral izquierda"""
         if event.type() == event.Type.WindowStateChange:
@@ -1246,7 +1534,19 @@ class CategoryManagerWindow(QWidget, TaskbarMinimizableMixin):
                 return
         super().changeEvent(event)
 
+    def _flush_filter_cache(self):
+        """Invalidate the controller filter cache once if anything changed"""
+        if self._cache_dirty and self._has_invalidate:
+            self.controller.invalidate_filter_cache()
+        self._cache_dirty = False
+
+    def hideEvent(self, event):
+        """Flush pending cache invalidation when the window is hidden"""
+        self._flush_filter_cache()
+        super().hideEvent(event)
+
     def closeEvent(self, event):
         """Handle window close event"""
+        self._flush_filter_cache()
         self.categories_changed.emit()
         super().closeEvent(event)
@@ -3,13 +3,14 @@ ComponentManagerDialog - Ventana para gestionar tipos de componentes visuales
 """
 import json
 import logging
+from functools import lru_cache
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QListWidget, QListWidgetItem, QTextEdit, QMessageBox,
     QWidget, QSplitter, QGroupBox, QLineEdit
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker, QRegularExpression
+from PyQt6.QtGui import QFont, QRegularExpressionValidator
 
 import sys
 from pathlib import Path
@@ -20,6 +21,12 @@ from src.models.component_type import ComponentType
 
 logger = logging.getLogger(__name__)
 
+# Nombre de componente: empieza por letra o '_', hasta 64 caracteres
+COMPONENT_NAME_PATTERN = r"^[\p{L}_][\p{L}\p{N}_ -]{0,63}$"
+
+# Decoder reutilizado por la validación del editor JSON
+_JSON_DECODER = json.JSONDecoder()
+
 
 class ComponentManagerDialog(QDialog):
     """Dialog for managing visual component types"""
@@ -27,6 +34,38 @@ class ComponentManagerDialog(QDialog):
     # Signals
     component_types_changed = pyqtSignal()  # Emitted when components are modified
 
+    # Stylesheets shared by every instance
+    _GROUPBOX_STYLE = """
+            QGroupBox {
+                color: #ffffff;
+                border: 1px solid #3d3d3d;
+                border-radius: 4px;
+                margin-top: 10px;
+                font-weight: bold;
+                padding-top: 10px;
+            }
+            QGroupBox::title {
+                subcontrol-origin: margin;
+                subcontrol-position: top left;
+                padding: 0 5px;
+                color: #007acc;
+            }
+        """
+
+    _INPUT_STYLE = """
+            QLineEdit {
+                background-color: #1e1e1e;
+                color: #ffffff;
+                border: 1px solid #3d3d3d;
+                border-radius: 4px;
+                padding: 8px;
+                font-size: 10pt;
+            }
+            QLineEdit:focus {
+                border-color: #007acc;
+            }
+        """
+
     def __init__(self, component_manager: ComponentManager, parent=None):
         """
         Initialize ComponentManagerDialog
@@ -38,6 +77,22 @@ class ComponentManagerDialog(QDialog):
         super().__init__(parent)
         self.component_manager = component_manager
         self.current_component_type = None
+        # JSON formateado por id de componente (se invalida al guardar)
+        self._json_cache = {}
+        # Nombres ya existentes, para detectar duplicados sin ir a la BD
+        self._existing_names = set()
+        # Último JSON validado (texto, objeto) para no volver a parsearlo al guardar
+        self._validated_config = None
+        # Texto de cada fila por id: (ComponentType, texto); se reutiliza
+        # mientras el objeto sea el mismo
+        self._display_text_cache = {}
+
+        # Debounce de validación JSON: solo parsear cuando el usuario pausa
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(250)
+        self._validate_timer.timeout.connect(self._do_validate_json)
+
         self.init_ui()
         self.load_component_types()
 
@@ -161,12 +216,15 @@ class ComponentManagerDialog(QDialog):
 
         # Name field
         name_group = QGroupBox("Nombre del Componente")
-        name_group.setStyleSheet(self._get_groupbox_style())
+        name_group.setStyleSheet(self._GROUPBOX_STYLE)
         name_layout = QVBoxLayout(name_group)
 
         self.name_input = QLineEdit()
-        self.name_input.setStyleSheet(self._get_input_style())
+        self.name_input.setStyleSheet(self._INPUT_STYLE)
         self.name_input.setPlaceholderText("ej: separador, nota, alerta...")
+        self.name_input.setValidator(
+            QRegularExpressionValidator(QRegularExpression(COMPONENT_NAME_PATTERN), self.name_input)
+        )
         self.name_input.textChanged.connect(self.on_field_changed)
         name_layout.addWidget(self.name_input)
 
@@ -174,11 +232,11 @@ class ComponentManagerDialog(QDialog):
 
         # Description field
         desc_group = QGroupBox("Descripción")
-        desc_group.setStyleSheet(self._get_groupbox_style())
+        desc_group.setStyleSheet(self._GROUPBOX_STYLE)
         desc_layout = QVBoxLayout(desc_group)
 
         self.description_input = QLineEdit()
-        self.description_input.setStyleSheet(self._get_input_style())
+        self.description_input.setStyleSheet(self._INPUT_STYLE)
         self.description_input.setPlaceholderText("Descripción breve del componente...")
         self.description_input.textChanged.connect(self.on_field_changed)
         desc_layout.addWidget(self.description_input)
@@ -187,7 +245,7 @@ class ComponentManagerDialog(QDialog):
 
         # Default config field (JSON editor)
         config_group = QGroupBox("Configuración por Defecto (JSON)")
-        config_group.setStyleSheet(self._get_groupbox_style())
+        config_group.setStyleSheet(self._GROUPBOX_STYLE)
         config_layout = QVBoxLayout(config_group)
 
         self.config_editor = QTextEdit()
@@ -264,8 +322,10 @@ class ComponentManagerDialog(QDialog):
             }
         """)
 
-    def _get_button_style(self, color: str) -> str:
-        """Get button stylesheet with specified color"""
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _get_button_style(color: str) -> str:
+        """Get button stylesheet with specified color (cached per color)"""
         return f"""
             QPushButton {{
                 background-color: {color};
@@ -289,61 +349,82 @@ class ComponentManagerDialog(QDialog):
             }}
         """
 
-    def _get_groupbox_style(self) -> str:
-        """Get groupbox stylesheet"""
-        return """
-            QGroupBox {
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                margin-top: 10px;
-                font-weight: bold;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 5px;
-                color: #007acc;
-            }
-        """
-
-    def _get_input_style(self) -> str:
-        """Get input field stylesheet"""
-        return """
-            QLineEdit {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 10pt;
-            }
-            QLineEdit:focus {
-                border-color: #007acc;
-            }
-        """
-
     def load_component_types(self):
         """Load component types into list"""
+        self._json_cache.clear()
+        self._existing_names.clear()
+        self.components_list.setUpdatesEnabled(False)
+        # clear() sí notifica la deselección; solo se silencian los addItem
         self.components_list.clear()
+        self.components_list.blockSignals(True)
 
         try:
             component_types = self.component_manager.get_all_component_types(active_only=False)
+            self._existing_names = {comp_type.name for comp_type in component_types}
+
+            icons = self.component_manager.get_all_component_icons()
+            default_icon = self.component_manager.DEFAULT_COMPONENT_ICON
 
-            for comp_type in component_types:
-                icon = self.component_manager.get_component_icon(comp_type.name)
-                status = "" if comp_type.is_active else " [INACTIVO]"
-                item_text = f"{icon} {comp_type.name}{status}"
+            # Construir todos los items antes de tocar el widget
+            items = [
+                self._create_component_item(comp_type, icons.get(comp_type.name, default_icon))
+                for comp_type in component_types
+            ]
 
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.ItemDataRole.UserRole, comp_type)
+            for item in items:
                 self.components_list.addItem(item)
 
         except Exception as e:
             logger.error(f"Error loading component types: {e}")
             QMessageBox.critical(self, "Error", f"Error al cargar componentes:\n{e}")
 
+        finally:
+            self.components_list.blockSignals(False)
+            self.components_list.setUpdatesEnabled(True)
+            self.components_list.viewport().update()
+
+    def _create_component_item(self, comp_type: ComponentType, icon: str = None) -> QListWidgetItem:
+        """
+        Build the list item for a component type
+
+        Args:
+            comp_type: ComponentType to display
+            icon: Emoji icon (looked up from the manager if not given)
+
+        Returns:
+            QListWidgetItem carrying the component type in UserRole
+        """
+        item = QListWidgetItem()
+        self._apply_component_to_item(item, comp_type, icon)
+        return item
+
+    def _apply_component_to_item(self, item: QListWidgetItem, comp_type: ComponentType, icon: str = None):
+        """Update text and data of an existing list item in place"""
+        item.setText(self._component_display_text(comp_type, icon))
+        item.setData(Qt.ItemDataRole.UserRole, comp_type)
+
+    def _component_display_text(self, comp_type: ComponentType, icon: str = None) -> str:
+        """
+        Get the list text for a component type, reusing it while the object is unchanged
+
+        Args:
+            comp_type: ComponentType to display
+            icon: Emoji icon (looked up from the manager if not given)
+
+        Returns:
+            Display text such as "📝 nota [INACTIVO]"
+        """
+        cached = self._display_text_cache.get(comp_type.id)
+        if cached is not None and cached[0] is comp_type:
+            return cached[1]
+
+        if icon is None:
+            icon = self.component_manager.get_component_icon(comp_type.name)
+        status = "" if comp_type.is_active else " [INACTIVO]"
+        text = f"{icon} {comp_type.name}{status}"
+        self._display_text_cache[comp_type.id] = (comp_type, text)
+        return text
+
     def on_component_selected(self, current: QListWidgetItem, previous: QListWidgetItem):
         """Handle component selection"""
         if not current:
@@ -361,19 +442,26 @@ class ComponentManagerDialog(QDialog):
         self.description_input.setText(component_type.description)
 
         # Format JSON config
+        self._validate_timer.stop()
         try:
-            config_json = json.dumps(component_type.default_config, indent=2, ensure_ascii=False)
-            self.config_editor.setText(config_json)
+            config_json = self._json_cache.get(component_type.id)
+            if config_json is None:
+                config_json = json.dumps(component_type.default_config, indent=2, ensure_ascii=False)
+                self._json_cache[component_type.id] = config_json
+            with QSignalBlocker(self.config_editor):
+                self.config_editor.setText(config_json)
             self.validate_json()
         except Exception as e:
             logger.error(f"Error formatting config JSON: {e}")
-            self.config_editor.setText(str(component_type.default_config))
+            with QSignalBlocker(self.config_editor):
+                self.config_editor.setText(str(component_type.default_config))
 
         # Disable save button initially
         self.save_btn.setEnabled(False)
 
     def clear_details(self):
         """Clear detail fields"""
+        self._validate_timer.stop()
         self.name_input.clear()
         self.description_input.clear()
         self.config_editor.clear()
@@ -382,19 +470,34 @@ class ComponentManagerDialog(QDialog):
 
     def on_field_changed(self):
         """Handle field changes"""
-        self.save_btn.setEnabled(True)
+        self.save_btn.setEnabled(not self._is_name_taken(self.name_input.text().strip()))
         if self.sender() == self.config_editor:
-            self.validate_json()
+            self._validate_timer.start()
+
+    def _is_name_taken(self, name: str) -> bool:
+        """Check whether name belongs to a component other than the one being edited"""
+        if name not in self._existing_names:
+            return False
+        return self.current_component_type is None or self.current_component_type.name != name
 
     def validate_json(self):
-        """Validate JSON in config editor"""
+        """Validate JSON in config editor immediately, cancelling any pending debounced run"""
+        self._validate_timer.stop()
+        return self._do_validate_json()
+
+    def _do_validate_json(self):
+        """Parse config editor contents and update the validation label"""
         try:
             json_text = self.config_editor.toPlainText().strip()
             if not json_text:
                 self.json_validation_label.setText("")
                 return True
 
-            json.loads(json_text)
+            config, end = _JSON_DECODER.raw_decode(json_text)
+            if end != len(json_text):
+                raise json.JSONDecodeError("Extra data", json_text, end)
+            self._validated_config = (json_text, config)
+
             self.json_validation_label.setText("✓ JSON válido")
             self.json_validation_label.setStyleSheet("QLabel { color: #00ff88; }")
             return True
@@ -420,24 +523,29 @@ class ComponentManagerDialog(QDialog):
             description = self.description_input.text().strip()
             config_text = self.config_editor.toPlainText().strip()
 
+            # Reunir todos los errores y mostrarlos en un único diálogo
+            errors = []
             if not name:
-                QMessageBox.warning(self, "Validación", "El nombre es requerido")
-                return
+                errors.append("El nombre es requerido")
+            elif self._is_name_taken(name):
+                errors.append(f"Ya existe un componente llamado '{name}'")
 
             if not description:
-                QMessageBox.warning(self, "Validación", "La descripción es requerida")
-                return
+                errors.append("La descripción es requerida")
 
             if not config_text:
-                QMessageBox.warning(self, "Validación", "La configuración es requerida")
-                return
+                errors.append("La configuración es requerida")
+            elif not self.validate_json():
+                errors.append("El JSON de configuración no es válido")
 
-            # Validate JSON
-            if not self.validate_json():
-                QMessageBox.warning(self, "Validación", "El JSON de configuración no es válido")
+            if errors:
+                QMessageBox.warning(self, "Validación", "\n".join(errors))
                 return
 
-            config_dict = json.loads(config_text)
+            if self._validated_config and self._validated_config[0] == config_text:
+                config_dict = self._validated_config[1]
+            else:
+                config_dict = json.loads(config_text)
 
             # Create or update component type
             if self.current_component_type:
@@ -450,9 +558,20 @@ class ComponentManagerDialog(QDialog):
                 )
 
                 if success:
+                    self._json_cache.pop(self.current_component_type.id, None)
                     QMessageBox.information(self, "Éxito", "Componente actualizado exitosamente")
                     self.component_types_changed.emit()
-                    self.load_component_types()
+
+                    # Actualizar solo la fila afectada
+                    updated = self.component_manager.get_component_type_by_name(name)
+                    current_item = self.components_list.currentItem()
+                    self._existing_names.discard(self.current_component_type.name)
+                    self._existing_names.add(name)
+                    if updated and current_item:
+                        self._apply_component_to_item(current_item, updated)
+                        self.current_component_type = updated
+                    else:
+                        self.load_component_types()
                 else:
                     QMessageBox.critical(self, "Error", "Error al actualizar el componente")
 
@@ -467,8 +586,17 @@ class ComponentManagerDialog(QDialog):
                 if component_id:
                     QMessageBox.information(self, "Éxito", "Componente creado exitosamente")
                     self.component_types_changed.emit()
-                    self.load_component_types()
-                    self.clear_details()
+
+                    # Añadir solo la nueva fila y seleccionarla
+                    self._existing_names.add(name)
+                    created = self.component_manager.get_component_type_by_name(name)
+                    if created:
+                        new_item = self._create_component_item(created)
+                        self.components_list.addItem(new_item)
+                        self.components_list.setCurrentItem(new_item)
+                    else:
+                        self.load_component_types()
+                        self.clear_details()
                 else:
                     QMessageBox.critical(self, "Error", "Error al crear el componente")
 
@@ -509,11 +637,21 @@ class ComponentManagerDialog(QDialog):
                 )
 
                 if success:
+                    self._json_cache.pop(self.current_component_type.id, None)
+                    self._existing_names.discard(self.current_component_type.name)
+                    self._display_text_cache.pop(self.current_component_type.id, None)
                     QMessageBox.information(self, "Éxito", "Componente eliminado exitosamente")
                     self.component_types_changed.emit()
-                    self.load_component_types()
-                    self.clear_details()
-                    self.current_component_type = None
+
+                    # Quitar solo la fila eliminada; currentItemChanged
+                    # actualiza el panel de detalles con la nueva selección
+                    row = self.components_list.currentRow()
+                    if row >= 0:
+                        self.components_list.takeItem(row)
+                    else:
+                        self.load_component_types()
+                    if self.components_list.currentItem() is None:
+                        self.on_component_selected(None, None)
                 else:
                     QMessageBox.critical(self, "Error", "Error al eliminar el componente")
 
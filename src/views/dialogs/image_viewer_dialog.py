@@ -18,15 +18,50 @@ Fecha: 2025-12-31
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QScrollArea, QWidget, QSizePolicy
+    QGraphicsView, QGraphicsScene, QWidget, QSizePolicy
+)
+from PyQt6.QtCore import Qt, QSize, QThread, QTimer, QFileInfo, pyqtSignal
+from PyQt6.QtGui import (
+    QPixmap, QPixmapCache, QImage, QWheelEvent, QCursor, QTransform, QColor
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QPixmap, QWheelEvent, QCursor
-import os
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Lado mínimo (px) a partir del cual se generan mipmaps (½ y ¼)
+MIPMAP_MIN_SIDE = 2048
+
+# Límite de QPixmapCache (en KB) para compartir imágenes entre visores
+PIXMAP_CACHE_LIMIT_KB = 262144  # 256 MiB
+
+
+class ImageLoadWorker(QThread):
+    """
+    Worker que decodifica la imagen fuera del hilo de la GUI
+
+    QImage es seguro de construir en un hilo secundario; la conversión a
+    QPixmap se hace en el slot conectado, ya en el hilo principal.
+    """
+
+    loaded = pyqtSignal(QImage)
+    failed = pyqtSignal(str)
+
+    def __init__(self, image_path: str, parent=None):
+        super().__init__(parent)
+        self.image_path = image_path
+
+    def run(self):
+        """Decodificar la imagen desde disco"""
+        try:
+            image = QImage(self.image_path)
+            if image.isNull():
+                self.failed.emit("Formato no soportado")
+                return
+            self.loaded.emit(image)
+        except Exception as e:
+            logger.error(f"Error decodificando imagen {self.image_path}: {e}")
+            self.failed.emit(str(e))
+
 
 class ImageViewerDialog(QDialog):
     """
@@ -51,15 +86,46 @@ class ImageViewerDialog(QDialog):
         super().__init__(parent)
 
         self.image_path = image_path
+        # Metadatos del archivo (existencia, tamaño, nombre, mtime) en un solo stat
+        self._file_info = QFileInfo(image_path or "")
         self.original_pixmap = None
+        # Dimensiones del original, leídas una vez al cargar
+        self._orig_w = 0
+        self._orig_h = 0
         self.current_zoom = 1.0  # 100%
+        self._load_worker = None
+        self._pixmap_cache_key = None
+        # Mipmaps (½, ¼) de imágenes grandes, generados bajo demanda
+        self._mipmaps = None
+        # Pixmap asignado al item de la escena (original o mipmap)
+        self._display_source = None
+        # Zoom y calidad aplicados actualmente a la vista
+        self._displayed_zoom = None
+        self._displayed_smooth = False
+
+        # Durante zoom rápido se dibuja en modo Fast; al detenerse se
+        # vuelve a dibujar en modo Smooth
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(120)
+        self._settle_timer.timeout.connect(self._render_smooth)
+
+        # Reajuste tras redimensionar la ventana (solo en modo "ajustar")
+        self._fit_mode = True
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(80)
+        self._resize_timer.timeout.connect(self._fit_to_window)
 
         # Usar nombre de archivo como título si no se proporciona otro
         if title == "Visor de Imagen" and image_path:
-            title = f"Visor de Imagen - {os.path.basename(image_path)}"
+            title = f"Visor de Imagen - {self._file_info.fileName()}"
 
         self.setWindowTitle(title)
         self.setModal(True)
+
+        if QPixmapCache.cacheLimit() < PIXMAP_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
         self.resize(900, 700)
 
         self._setup_ui()
@@ -136,32 +202,28 @@ class ImageViewerDialog(QDialog):
 
         layout.addLayout(toolbar)
 
-        # ==== ÁREA DE IMAGEN CON SCROLL ====
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(False)
-        self.scroll_area.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
+        # ==== ÁREA DE IMAGEN (QGraphicsView: el zoom es una transformación) ====
+        self.scene = QGraphicsScene(self)
+        self.pixmap_item = self.scene.addPixmap(QPixmap())
+        self.pixmap_item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+
+        # Texto para "Cargando..." y mensajes de error
+        self.message_item = self.scene.addSimpleText("")
+        self.message_item.setBrush(QColor("#cccccc"))
+
+        self.view = QGraphicsView(self.scene, self)
+        self.view.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.view.setStyleSheet("""
+            QGraphicsView {
                 background-color: #1e1e1e;
                 border: 1px solid #444;
             }
         """)
 
-        # Label de imagen
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setStyleSheet("""
-            QLabel {
-                background-color: #2d2d2d;
-                padding: 10px;
-            }
-        """)
-
         # Habilitar wheel event para zoom
-        self.image_label.wheelEvent = self._wheel_event
+        self.view.wheelEvent = self._wheel_event
 
-        self.scroll_area.setWidget(self.image_label)
-        layout.addWidget(self.scroll_area)
+        layout.addWidget(self.view)
 
         # ==== BOTÓN CERRAR ====
         close_btn = QPushButton("Cerrar")
@@ -210,30 +272,82 @@ class ImageViewerDialog(QDialog):
         """)
 
     def _load_image(self):
-        """Cargar imagen desde archivo"""
-        if not self.image_path or not os.path.exists(self.image_path):
-            self.image_label.setText("❌ Imagen no encontrada")
+        """Cargar imagen desde archivo (decodificación en segundo plano)"""
+        info = self._file_info
+        if not self.image_path or not info.exists():
+            self._show_message("❌ Imagen no encontrada")
             self.info_label.setText("Error: Archivo no existe")
             logger.error(f"Imagen no encontrada: {self.image_path}")
             return
 
+        # Reutilizar la imagen ya decodificada por otro visor (misma ruta y mtime)
+        self._pixmap_cache_key = (
+            f"image_viewer:{info.canonicalFilePath()}:"
+            f"{info.lastModified().toSecsSinceEpoch()}"
+        )
+        cached_pixmap = QPixmapCache.find(self._pixmap_cache_key)
+        if cached_pixmap is not None and not cached_pixmap.isNull():
+            self._set_original_pixmap(cached_pixmap)
+            return
+
+        self._show_message("Cargando...")
+
+        worker = ImageLoadWorker(self.image_path, parent=self)
+        worker.loaded.connect(self._on_image_loaded)
+        worker.failed.connect(self._on_image_load_failed)
+        worker.finished.connect(worker.deleteLater)
+        self._load_worker = worker
+        worker.start()
+
+    def _show_message(self, text: str):
+        """Mostrar un texto en lugar de la imagen"""
+        self.pixmap_item.setPixmap(QPixmap())
+        self._display_source = None
+        self._displayed_zoom = None
+        self.message_item.setText(text)
+        self.message_item.show()
+        self.scene.setSceneRect(self.message_item.boundingRect())
+        self.view.resetTransform()
+
+    def _on_image_load_failed(self, error: str):
+        """Mostrar error de decodificación"""
+        self._load_worker = None
+        self._show_message("❌ Error al cargar imagen")
+        self.info_label.setText(f"Error: {error}")
+        logger.error(f"Error al cargar pixmap: {self.image_path} ({error})")
+
+    def _on_image_loaded(self, image: QImage):
+        """Convertir la imagen decodificada a QPixmap y mostrarla"""
+        self._load_worker = None
+
+        pixmap = QPixmap.fromImage(image)
+        if not pixmap.isNull() and self._pixmap_cache_key:
+            QPixmapCache.insert(self._pixmap_cache_key, pixmap)
+        self._set_original_pixmap(pixmap)
+
+    def _set_original_pixmap(self, pixmap: QPixmap):
+        """Establecer el pixmap original, actualizar información y ajustar"""
         try:
-            # Cargar imagen original
-            self.original_pixmap = QPixmap(self.image_path)
+            self.original_pixmap = pixmap
+            self._mipmaps = None
+            self._display_source = None
+            self._displayed_zoom = None
+            self.message_item.hide()
 
             if self.original_pixmap.isNull():
-                self.image_label.setText("❌ Error al cargar imagen")
+                self._show_message("❌ Error al cargar imagen")
                 self.info_label.setText("Error: Formato no soportado")
                 logger.error(f"Error al cargar pixmap: {self.image_path}")
                 return
 
             # Actualizar información
-            width = self.original_pixmap.width()
-            height = self.original_pixmap.height()
-            size_kb = os.path.getsize(self.image_path) / 1024
+            self._orig_w = self.original_pixmap.width()
+            self._orig_h = self.original_pixmap.height()
+            width, height = self._orig_w, self._orig_h
+            size_kb = self._file_info.size() / 1024
 
             self.info_label.setText(
-                f"📐 {width}x{height}px | 💾 {size_kb:.1f} KB | 📁 {os.path.basename(self.image_path)}"
+                f"📐 {width}x{height}px | 💾 {size_kb:.1f} KB | 📁 {self._file_info.fileName()}"
             )
 
             # Ajustar a ventana inicialmente
@@ -242,69 +356,146 @@ class ImageViewerDialog(QDialog):
             logger.info(f"Imagen cargada: {self.image_path} ({width}x{height})")
 
         except Exception as e:
-            self.image_label.setText("❌ Error al cargar imagen")
+            self._show_message("❌ Error al cargar imagen")
             self.info_label.setText(f"Error: {str(e)}")
             logger.error(f"Excepción al cargar imagen: {e}")
             import traceback
             logger.error(traceback.format_exc())
 
-    def _update_image(self):
-        """Actualizar imagen mostrada según zoom actual"""
+    def _update_image(self, mode: Qt.TransformationMode = Qt.TransformationMode.SmoothTransformation):
+        """
+        Actualizar imagen mostrada según zoom actual
+
+        El pixmap no se re-escala: el zoom se aplica como transformación de
+        la vista y Qt lo resuelve al pintar.
+
+        Args:
+            mode: Modo de filtrado al pintar (Fast durante zoom activo)
+        """
         if not self.original_pixmap or self.original_pixmap.isNull():
             return
 
-        # Calcular nuevo tamaño
-        new_width = int(self.original_pixmap.width() * self.current_zoom)
-        new_height = int(self.original_pixmap.height() * self.current_zoom)
+        # Nada que hacer si ya se muestra este zoom con igual o mejor calidad
+        smooth = mode == Qt.TransformationMode.SmoothTransformation
+        if (self._displayed_zoom == self.current_zoom
+                and (self._displayed_smooth or not smooth)):
+            self.zoom_label.setText(f"{int(self.current_zoom * 100)}%")
+            return
 
-        # Escalar imagen
-        scaled_pixmap = self.original_pixmap.scaled(
-            new_width, new_height,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+        new_width = int(self._orig_w * self.current_zoom)
 
-        self.image_label.setPixmap(scaled_pixmap)
-        self.image_label.resize(scaled_pixmap.size())
+        # Pintar desde el mipmap adecuado y compensar su escala en la transformación
+        source = self._scale_source(new_width)
+        if source is not self._display_source:
+            self.pixmap_item.setPixmap(source)
+            self.scene.setSceneRect(self.pixmap_item.boundingRect())
+            self._display_source = source
+
+        self.pixmap_item.setTransformationMode(mode)
+        factor = self.current_zoom * self._orig_w / source.width()
+        self.view.setTransform(QTransform.fromScale(factor, factor))
+
+        self._displayed_zoom = self.current_zoom
+        self._displayed_smooth = smooth
 
         # Actualizar label de zoom
         self.zoom_label.setText(f"{int(self.current_zoom * 100)}%")
 
-        logger.debug(f"Imagen actualizada a {int(self.current_zoom * 100)}% ({new_width}x{new_height})")
+        logger.debug(f"Imagen actualizada a {int(self.current_zoom * 100)}%")
+
+    def _scale_source(self, target_width: int) -> QPixmap:
+        """
+        Elegir el pixmap más pequeño que aún cubre el ancho objetivo
+
+        Para imágenes grandes se pinta desde un mipmap (½ o ¼) en lugar
+        del original, reduciendo el trabajo de remuestreo en zooms bajos.
+
+        Args:
+            target_width: Ancho final en píxeles
+
+        Returns:
+            Pixmap origen para el pintado
+        """
+        original = self.original_pixmap
+        if max(self._orig_w, self._orig_h) < MIPMAP_MIN_SIDE:
+            return original
+
+        if target_width * 2 > self._orig_w:
+            return original
+
+        if self._mipmaps is None:
+            half = original.scaled(
+                self._orig_w // 2, self._orig_h // 2,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            quarter = half.scaled(
+                half.width() // 2, half.height() // 2,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            self._mipmaps = (quarter, half)
+
+        for mip in self._mipmaps:
+            if mip.width() >= target_width:
+                return mip
+        return original
 
     def _zoom_in(self):
         """Aumentar zoom (máx 400%)"""
-        if self.current_zoom < 4.0:
-            self.current_zoom = min(4.0, self.current_zoom + 0.25)
-            self._update_image()
+        new_zoom = min(4.0, self.current_zoom + 0.25)
+        if new_zoom != self.current_zoom:
+            self._fit_mode = False
+            self.current_zoom = new_zoom
+            self._update_image(Qt.TransformationMode.FastTransformation)
+            self._settle_timer.start()
 
     def _zoom_out(self):
         """Reducir zoom (mín 25%)"""
-        if self.current_zoom > 0.25:
-            self.current_zoom = max(0.25, self.current_zoom - 0.25)
-            self._update_image()
+        if self.current_zoom <= 0.25:
+            return
+        new_zoom = max(0.25, self.current_zoom - 0.25)
+        if new_zoom != self.current_zoom:
+            self._fit_mode = False
+            self.current_zoom = new_zoom
+            self._update_image(Qt.TransformationMode.FastTransformation)
+            self._settle_timer.start()
+
+    def _render_smooth(self):
+        """Re-renderizar el zoom final con SmoothTransformation"""
+        self._update_image(Qt.TransformationMode.SmoothTransformation)
 
     def _fit_to_window(self):
         """Ajustar imagen a tamaño de ventana"""
+        self._settle_timer.stop()
+        self._fit_mode = True
         if not self.original_pixmap or self.original_pixmap.isNull():
             return
 
+        # Antes de mostrarse el viewport aún no tiene su tamaño final;
+        # showEvent hace el ajuste
+        if not self.view.isVisible():
+            return
+
         # Obtener tamaño disponible (con margen)
-        available_width = self.scroll_area.width() - 40
-        available_height = self.scroll_area.height() - 40
+        viewport = self.view.viewport()
+        available_width = viewport.width() - 40
+        available_height = viewport.height() - 40
 
         # Calcular zoom para ajustar
-        zoom_width = available_width / self.original_pixmap.width()
-        zoom_height = available_height / self.original_pixmap.height()
+        zoom_width = available_width / self._orig_w
+        zoom_height = available_height / self._orig_h
 
-        # Usar el menor para que quepa completamente
-        self.current_zoom = min(zoom_width, zoom_height, 1.0)  # Max 100% al ajustar
+        # Usar el menor para que quepa completamente (entre 25% y 100%)
+        self.current_zoom = max(0.25, min(zoom_width, zoom_height, 1.0))
 
         self._update_image()
         logger.debug("Imagen ajustada a ventana")
 
     def _actual_size(self):
         """Mostrar imagen en tamaño real (100%)"""
+        self._settle_timer.stop()
+        self._fit_mode = False
         self.current_zoom = 1.0
         self._update_image()
         logger.debug("Imagen a tamaño real (100%)")
@@ -320,7 +511,28 @@ class ImageViewerDialog(QDialog):
             event.accept()
         else:
             # Scroll normal
-            event.ignore()
+            QGraphicsView.wheelEvent(self.view, event)
+
+    def showEvent(self, event):
+        """Ajustar a la ventana al mostrarse, con el viewport ya dimensionado"""
+        super().showEvent(event)
+        if self._fit_mode:
+            self._fit_to_window()
+
+    def resizeEvent(self, event):
+        """Reajustar a la ventana una sola vez cuando el tamaño se estabiliza"""
+        super().resizeEvent(event)
+        if self._fit_mode:
+            self._resize_timer.start()
+
+    def done(self, result):
+        """Esperar al worker de carga antes de cerrar el diálogo"""
+        if self._load_worker is not None and self._load_worker.isRunning():
+            self._load_worker.loaded.disconnect(self._on_image_loaded)
+            self._load_worker.failed.disconnect(self._on_image_load_failed)
+            self._load_worker.wait()
+            self._load_worker = None
+        super().done(result)
 
     def keyPressEvent(self, event):
         """Manejar eventos de teclado"""
@@ -2,27 +2,89 @@
 Master Password Verification Dialog
 Dialog to verify master password for accessing sensitive items and exports
 """
-import sys
-from pathlib import Path
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton,
     QHBoxLayout
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QPropertyAnimation, QTimer
 from PyQt6.QtGui import QFont
+from PyQt6 import sip
 import logging
+from functools import lru_cache
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-from src.core.master_password_manager import MasterPasswordManager
+from src.core.master_password_manager import MasterPasswordManager, has_master_password_cached
 from src.core.master_auth_cache import get_master_auth_cache
 
 logger = logging.getLogger(__name__)
 
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
+
+@lru_cache(maxsize=1)
+def _title_font() -> QFont:
+    """Bold 13pt title font, built once (needs a QApplication, so not at import)"""
+    font = QFont()
+    font.setPointSize(13)
+    font.setBold(True)
+    return font
+
+
+# Dialog reused by MasterPasswordDialog.verify() across invocations
+_shared_dialog = None
+
+# Shake animation keyframes: (step, horizontal offset in px)
+_SHAKE_KEYFRAMES = (
+    (0, 0), (0.1, -10), (0.2, 10), (0.3, -10),
+    (0.4, 10), (0.5, -5), (0.6, 5), (1, 0)
+)
+
+# Dialog stylesheet, shared by every instance
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #1e1e1e;
+    }
+    QLabel {
+        color: #cccccc;
+    }
+    QLineEdit {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        border: 2px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 8px;
+        font-size: 10pt;
+    }
+    QLineEdit:focus {
+        border: 2px solid #00aa55;
+    }
+    QPushButton {
+        background-color: #00aa55;
+        color: #ffffff;
+        border: none;
+        border-radius: 4px;
+        font-size: 10pt;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #008844;
+    }
+    QPushButton:pressed {
+        background-color: #006633;
+    }
+    QPushButton#cancel {
+        background-color: #555555;
+    }
+    QPushButton#cancel:hover {
+        background-color: #666666;
+    }
+"""
+
 
 class MasterPasswordDialog(QDialog):
     """Dialog to verify master password for sensitive operations"""
 
-    def __init__(self, title="Contraseña Maestra", message="Ingresa tu contraseña maestra para continuar:", parent=None):
+    def __init__(self, title="Contraseña Maestra", message="Ingresa tu contraseña maestra para continuar:",
+                 parent=None, master_mgr: MasterPasswordManager = None):
         """
         Initialize master password verification dialog
 
@@ -30,14 +92,26 @@ class MasterPasswordDialog(QDialog):
             title: Dialog title
             message: Message to display
             parent: Parent widget
+            master_mgr: Existing MasterPasswordManager to reuse (created on first verify if None)
         """
         super().__init__(parent)
-        self.master_mgr = MasterPasswordManager()
+        self._master_mgr = master_mgr
         self.title_text = title
         self.message_text = message
         self.password_verified = False
+        self._shake_anim = None
+        self._shake_origin = None
+        # Consecutive failed attempts (drives the retry backoff)
+        self._fail_count = 0
         self.init_ui()
 
+    @property
+    def master_mgr(self) -> MasterPasswordManager:
+        """MasterPasswordManager, created lazily on first verification"""
+        if self._master_mgr is None:
+            self._master_mgr = MasterPasswordManager()
+        return self._master_mgr
+
     def init_ui(self):
         """Initialize UI"""
         self.setWindowTitle(self.title_text)
@@ -50,19 +124,16 @@ class MasterPasswordDialog(QDialog):
         main_layout.setSpacing(15)
 
         # Title with icon
-        title = QLabel(f"🔐 {self.title_text}")
-        title_font = QFont()
-        title_font.setPointSize(13)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        main_layout.addWidget(title)
+        self.title_label = QLabel(f"🔐 {self.title_text}")
+        self.title_label.setFont(_title_font())
+        self.title_label.setAlignment(_ALIGN_CENTER)
+        main_layout.addWidget(self.title_label)
 
         # Message
-        message = QLabel(self.message_text)
-        message.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        message.setWordWrap(True)
-        main_layout.addWidget(message)
+        self.message_label = QLabel(self.message_text)
+        self.message_label.setAlignment(_ALIGN_CENTER)
+        self.message_label.setWordWrap(True)
+        main_layout.addWidget(self.message_label)
 
         main_layout.addSpacing(10)
 
@@ -89,7 +160,7 @@ class MasterPasswordDialog(QDialog):
 
         # Error label
         self.error_label = QLabel("")
-        self.error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.error_label.setAlignment(_ALIGN_CENTER)
         self.error_label.setStyleSheet("color: #ff4444; font-weight: bold;")
         self.error_label.hide()
         main_layout.addWidget(self.error_label)
@@ -105,54 +176,16 @@ class MasterPasswordDialog(QDialog):
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
 
-        verify_btn = QPushButton("Verificar")
-        verify_btn.setFixedSize(100, 35)
-        verify_btn.clicked.connect(self.verify_password)
-        verify_btn.setDefault(True)  # Make it default button
-        button_layout.addWidget(verify_btn)
+        self.verify_btn = QPushButton("Verificar")
+        self.verify_btn.setFixedSize(100, 35)
+        self.verify_btn.clicked.connect(self.verify_password)
+        self.verify_btn.setDefault(True)  # Make it default button
+        button_layout.addWidget(self.verify_btn)
 
         main_layout.addLayout(button_layout)
 
         # Apply styles
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-            }
-            QLabel {
-                color: #cccccc;
-            }
-            QLineEdit {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 2px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 10pt;
-            }
-            QLineEdit:focus {
-                border: 2px solid #00aa55;
-            }
-            QPushButton {
-                background-color: #00aa55;
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                font-size: 10pt;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #008844;
-            }
-            QPushButton:pressed {
-                background-color: #006633;
-            }
-            QPushButton#cancel {
-                background-color: #555555;
-            }
-            QPushButton#cancel:hover {
-                background-color: #666666;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
 
         # Set object name for cancel button
         cancel_btn.setObjectName("cancel")
@@ -160,6 +193,31 @@ class MasterPasswordDialog(QDialog):
         # Focus on password input
         self.password_input.setFocus()
 
+    def reset(self, title, message, parent=None):
+        """
+        Prepare the dialog for a new verification
+
+        Args:
+            title: Dialog title
+            message: Message to display
+            parent: Parent widget for this invocation
+        """
+        self.title_text = title
+        self.message_text = message
+        self.password_verified = False
+
+        self.setParent(parent, self.windowFlags())
+        self.setWindowTitle(title)
+        self.title_label.setText(f"🔐 {title}")
+        self.message_label.setText(message)
+
+        self.password_input.clear()
+        self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.show_password_btn.setText("👁")
+        self.error_label.clear()
+        self.error_label.hide()
+        self.password_input.setFocus()
+
     def toggle_password_visibility(self):
         """Toggle password visibility"""
         if self.password_input.echoMode() == QLineEdit.EchoMode.Password:
@@ -171,14 +229,27 @@ class MasterPasswordDialog(QDialog):
 
     def verify_password(self):
         """Verify the entered master password"""
-        password = self.password_input.text()
+        # Still in the post-failure backoff window
+        if not self.verify_btn.isEnabled():
+            return
+
+        # Keep the password in a mutable buffer so it can be wiped afterwards
+        password = bytearray(self.password_input.text(), 'utf-8')
+        self.password_input.clear()
 
         if not password:
             self.show_error("Por favor ingresa tu contraseña maestra")
             return
 
         # Verify password with MasterPasswordManager
-        if self.master_mgr.verify_master_password(password):
+        try:
+            is_valid = self.master_mgr.verify_master_password(password)
+        finally:
+            for i in range(len(password)):
+                password[i] = 0
+
+        if is_valid:
+            self._fail_count = 0
             self.password_verified = True
             logger.info("Master password verified in dialog")
 
@@ -190,13 +261,25 @@ class MasterPasswordDialog(QDialog):
             self.accept()
         else:
             self.show_error("Contraseña maestra incorrecta")
-            self.password_input.clear()
             self.password_input.setFocus()
             logger.warning("Master password verification failed in dialog")
 
             # Shake animation for error feedback
             self.shake_dialog()
 
+            # Exponential backoff before the next attempt (0.2s, 0.4s, ... max 3s)
+            self._fail_count += 1
+            delay_ms = int(min(2 ** self._fail_count, 30) * 100)
+            self.verify_btn.setEnabled(False)
+            self.password_input.setEnabled(False)
+            QTimer.singleShot(delay_ms, self._end_backoff)
+
+    def _end_backoff(self):
+        """Re-enable input after the failed-attempt backoff"""
+        self.verify_btn.setEnabled(True)
+        self.password_input.setEnabled(True)
+        self.password_input.setFocus()
+
     def show_error(self, message):
         """Show error message"""
         self.error_label.setText(message)
@@ -204,35 +287,33 @@ class MasterPasswordDialog(QDialog):
 
     def shake_dialog(self):
         """Shake dialog for error feedback"""
-        from PyQt6.QtCore import QPropertyAnimation, QRect
-
-        # Get current geometry
-        current_geom = self.geometry()
-
-        # Create animation
-        animation = QPropertyAnimation(self, b"geometry")
-        animation.setDuration(500)
-        animation.setLoopCount(1)
+        if self._shake_anim is None:
+            self._shake_anim = QPropertyAnimation(self, b"geometry")
+            self._shake_anim.setDuration(500)
+            self._shake_anim.setLoopCount(1)
+
+        # Restart from the resting position if a shake is still running
+        if self._shake_anim.state() == QPropertyAnimation.State.Running:
+            self._shake_anim.stop()
+            current_geom = self._shake_origin
+        else:
+            current_geom = self.geometry()
+        self._shake_origin = current_geom
 
         # Shake left and right
-        animation.setKeyValueAt(0, current_geom)
-        animation.setKeyValueAt(0.1, QRect(current_geom.x() - 10, current_geom.y(), current_geom.width(), current_geom.height()))
-        animation.setKeyValueAt(0.2, QRect(current_geom.x() + 10, current_geom.y(), current_geom.width(), current_geom.height()))
-        animation.setKeyValueAt(0.3, QRect(current_geom.x() - 10, current_geom.y(), current_geom.width(), current_geom.height()))
-        animation.setKeyValueAt(0.4, QRect(current_geom.x() + 10, current_geom.y(), current_geom.width(), current_geom.height()))
-        animation.setKeyValueAt(0.5, QRect(current_geom.x() - 5, current_geom.y(), current_geom.width(), current_geom.height()))
-        animation.setKeyValueAt(0.6, QRect(current_geom.x() + 5, current_geom.y(), current_geom.width(), current_geom.height()))
-        animation.setKeyValueAt(1, current_geom)
+        for step, dx in _SHAKE_KEYFRAMES:
+            self._shake_anim.setKeyValueAt(step, current_geom.translated(dx, 0))
 
-        animation.start()
+        self._shake_anim.start()
 
     @staticmethod
     def verify(title="Contraseña Maestra", message="Ingresa tu contraseña maestra para continuar:", parent=None):
         """
         Static method to show verification dialog and return result
 
-        IMPORTANT: This method checks if master password is configured first.
-        If no master password exists, returns True immediately (no verification needed).
+        IMPORTANT: This method checks the authentication cache and whether a master
+        password is configured first. If the cache is still valid or no master
+        password exists, returns True immediately (no verification needed).
 
         Args:
             title: Dialog title
@@ -240,7 +321,8 @@ class MasterPasswordDialog(QDialog):
             parent: Parent widget
 
         Returns:
-            bool: True if password was verified OR no master password configured, False if cancelled
+            bool: True if password was verified, cache is valid OR no master password
+                configured, False if cancelled
 
         Example:
             from src.views.dialogs.master_password_dialog import MasterPasswordDialog
@@ -257,14 +339,29 @@ class MasterPasswordDialog(QDialog):
                 # User cancelled
                 pass
         """
+        # Recently authenticated - no need to ask again
+        cache = get_master_auth_cache()
+        if cache.is_authenticated():
+            logger.debug("Master password cache valid - skipping verification dialog")
+            return True
+
         # CRITICAL: Check if master password is configured
-        master_mgr = MasterPasswordManager()
-        if not master_mgr.has_master_password():
+        if not has_master_password_cached():
             logger.debug("No master password configured - allowing access without verification")
             return True
 
         # Master password exists - show dialog
         logger.debug("Master password configured - showing verification dialog")
-        dialog = MasterPasswordDialog(title, message, parent)
-        result = dialog.exec()
+        global _shared_dialog
+        if _shared_dialog is None or sip.isdeleted(_shared_dialog):
+            _shared_dialog = MasterPasswordDialog(title, message, parent)
+        else:
+            _shared_dialog.reset(title, message, parent)
+
+        dialog = _shared_dialog
+        try:
+            result = dialog.exec()
+        finally:
+            # Detach so the dialog is not destroyed together with this parent
+            dialog.setParent(None, dialog.windowFlags())
         return result == QDialog.DialogCode.Accepted and dialog.password_verified
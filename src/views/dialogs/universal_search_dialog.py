@@ -5,23 +5,759 @@ Permite buscar items y tags en toda la aplicación mostrando sus relaciones
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QLineEdit, QTableWidget, QTableWidgetItem, QHeaderView,
+    QLineEdit, QTableView, QAbstractItemView, QHeaderView,
     QCheckBox, QWidget, QSplitter, QFrame, QScrollArea,
     QButtonGroup, QRadioButton, QMenu, QMessageBox, QFileDialog,
-    QTextEdit
+    QTextEdit, QListWidget, QApplication
+)
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QTimer, QPoint, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel, QThread, QSignalBlocker
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPoint
 from PyQt6.QtGui import QCursor, QColor, QFont, QAction
 import logging
 import csv
 import json
 import re
+import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 
 from src.core.universal_search_engine import UniversalSearchEngine, SearchResultType
 
 logger = logging.getLogger(__name__)
 
+# Máximo de páginas de resultados mantenidas en caché (FIFO)
+PAGE_CACHE_SIZE = 5
+
+# Bits de la máscara de filtros de entidad
+ENTITY_FILTER_BITS = {
+    'proyectos': 1,
+    'areas': 2,
+    'categorias': 4,
+    'tablas': 8,
+    'procesos': 16,
+}
+ALL_ENTITIES_MASK = sum(ENTITY_FILTER_BITS.values())
+
+# Atributo de SearchResult que corresponde a cada filtro de entidad
+ENTITY_FILTER_ATTRS = (
+    ('proyectos', ENTITY_FILTER_BITS['proyectos']),
+    ('areas', ENTITY_FILTER_BITS['areas']),
+    ('categoria', ENTITY_FILTER_BITS['categorias']),
+    ('tabla', ENTITY_FILTER_BITS['tablas']),
+    ('procesos', ENTITY_FILTER_BITS['procesos']),
+)
+
+# Método de db_manager que lista cada tipo de entidad navegable (para índices nombre -> id)
+NAME_INDEX_SOURCES = {
+    'categoria': 'get_categories',
+    'proyecto': 'get_all_projects',
+    'area': 'get_all_areas',
+}
+
+# Buffer de escritura de los archivos exportados (menos write() en exportaciones grandes)
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# Debounce de búsqueda (ms): se alarga si la última búsqueda fue lenta
+SEARCH_DEBOUNCE_MS = 300
+SLOW_SEARCH_DEBOUNCE_MS = 400
+SLOW_SEARCH_SECONDS = 0.5
+
+# Hoja de estilos del diálogo: se aplica una sola vez y los widgets del
+# preview, historial y ayuda se estilan por objectName
+UNIVERSAL_SEARCH_QSS = """
+QDialog {
+    background-color: #1e1e1e;
+    color: #cccccc;
+}
+
+QFrame {
+    background-color: #252526;
+    border: 1px solid #3e3e42;
+}
+
+QPushButton {
+    background-color: #3e3e42;
+    color: #cccccc;
+    border: 1px solid #555555;
+    padding: 5px 10px;
+    border-radius: 3px;
+}
+
+QPushButton:hover {
+    background-color: #4e4e52;
+}
+
+QPushButton:pressed {
+    background-color: #2e2e32;
+}
+
+QPushButton:checked {
+    background-color: #007acc;
+    color: #ffffff;
+}
+
+QLineEdit {
+    background-color: #3c3c3c;
+    color: #cccccc;
+    border: 1px solid #555555;
+    padding: 5px;
+    border-radius: 3px;
+}
+
+QLineEdit:focus {
+    border: 1px solid #007acc;
+}
+
+QTableView {
+    background-color: #1e1e1e;
+    color: #cccccc;
+    gridline-color: #3e3e42;
+    border: 1px solid #3e3e42;
+}
+
+QTableView::item {
+    padding: 5px;
+}
+
+QTableView::item:selected {
+    background-color: #094771;
+    color: #ffffff;
+}
+
+QTableView::item:alternate {
+    background-color: #252526;
+}
+
+QHeaderView::section {
+    background-color: #2d2d30;
+    color: #cccccc;
+    padding: 5px;
+    border: 1px solid #3e3e42;
+    font-weight: bold;
+}
+
+QCheckBox {
+    color: #cccccc;
+    spacing: 5px;
+}
+
+QCheckBox::indicator {
+    width: 15px;
+    height: 15px;
+    border: 1px solid #555555;
+    border-radius: 3px;
+    background-color: #3c3c3c;
+}
+
+QCheckBox::indicator:checked {
+    background-color: #007acc;
+    border-color: #007acc;
+}
+
+QListWidget {
+    background-color: #252526;
+    color: #cccccc;
+    border: none;
+}
+
+QListWidget::indicator {
+    width: 15px;
+    height: 15px;
+    border: 1px solid #555555;
+    border-radius: 3px;
+    background-color: #3c3c3c;
+}
+
+QListWidget::indicator:checked {
+    background-color: #007acc;
+    border-color: #007acc;
+}
+
+QScrollArea {
+    border: none;
+    background-color: transparent;
+}
+
+QScrollBar:vertical {
+    background-color: #2d2d30;
+    width: 12px;
+}
+
+QScrollBar::handle:vertical {
+    background-color: #555555;
+    border-radius: 6px;
+}
+
+QScrollBar::handle:vertical:hover {
+    background-color: #666666;
+}
+
+/* Panel de preview */
+QLabel#previewPlaceholder {
+    color: #666666;
+    padding: 40px 20px;
+    font-size: 11pt;
+}
+
+QLabel#previewTitle {
+    font-size: 14pt;
+    font-weight: bold;
+    color: #ffffff;
+    padding: 5px;
+    background-color: #2d2d30;
+    border-radius: 4px;
+}
+
+QLabel#previewType {
+    color: #888888;
+    font-size: 9pt;
+}
+
+QFrame#previewSeparator {
+    background-color: #3e3e42;
+}
+
+QLabel#previewSection {
+    font-weight: bold;
+    color: #cccccc;
+}
+
+QTextEdit#previewContent {
+    background-color: #1e1e1e;
+    color: #d4d4d4;
+    border: 1px solid #3e3e42;
+    border-radius: 3px;
+    padding: 5px;
+    font-family: 'Consolas', 'Courier New', monospace;
+    font-size: 9pt;
+}
+
+QLabel#previewDescription {
+    color: #d4d4d4;
+    padding: 5px;
+}
+
+QPushButton#previewTag {
+    background-color: #007acc;
+    color: #ffffff;
+    border: none;
+    padding: 3px 8px;
+    border-radius: 3px;
+    font-size: 8pt;
+}
+
+QLabel#previewTagsMore {
+    color: #888888;
+    font-size: 8pt;
+}
+
+QLabel#previewRelation {
+    color: #d4d4d4;
+    font-size: 9pt;
+    padding-left: 10px;
+}
+
+QLabel#previewFavorite {
+    color: #FFD700;
+    font-size: 9pt;
+    padding-left: 10px;
+}
+
+QLabel#previewSensitive {
+    color: #ff6b6b;
+    font-size: 9pt;
+    padding-left: 10px;
+}
+
+QLabel#previewMeta {
+    color: #888888;
+    font-size: 9pt;
+    padding-left: 10px;
+}
+
+QPushButton#previewDeleteButton {
+    background-color: #c41e3a;
+    color: #ffffff;
+}
+
+QPushButton#previewDeleteButton:hover {
+    background-color: #e4475b;
+}
+
+/* Menú de historial */
+QMenu#searchHistoryMenu {
+    background-color: #2d2d30;
+    color: #cccccc;
+    border: 1px solid #555555;
+}
+
+QMenu#searchHistoryMenu::item {
+    padding: 5px 20px;
+}
+
+QMenu#searchHistoryMenu::item:selected {
+    background-color: #094771;
+}
+
+/* Ayuda de búsqueda */
+QMessageBox#searchHelpBox {
+    background-color: #1e1e1e;
+}
+
+QMessageBox#searchHelpBox QLabel {
+    color: #cccccc;
+    min-width: 500px;
+}
+
+QMessageBox#searchHelpBox QPushButton {
+    padding: 5px 15px;
+}
+"""
+
+
+class SearchWorker(QThread):
+    """Worker thread que ejecuta el conteo y la búsqueda paginada fuera de la GUI"""
+
+    loaded = pyqtSignal(int, int, int, list, dict)  # search_id, page, total, results, parsed_query
+    failed = pyqtSignal(int, str)  # search_id, error message
+
+    def __init__(self, db, parsed_query, page, page_size, search_id, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.parsed_query = parsed_query
+        self.page = page
+        self.page_size = page_size
+        self.search_id = search_id
+
+    def run(self):
+        """Ejecuta la búsqueda"""
+        try:
+            search_query = self.parsed_query['base_query']
+            # Conexión propia: la del hilo de la GUI no se comparte entre hilos
+            with self.db.reader() as reader_db:
+                total = reader_db.universal_search_items_count(search_query)
+                offset = (self.page - 1) * self.page_size
+                results = UniversalSearchEngine(reader_db).search_items(
+                    search_query, limit=self.page_size, offset=offset
+                )
+            self.loaded.emit(self.search_id, self.page, total, results, self.parsed_query)
+        except Exception as e:
+            logger.error(f"Error in search worker: {e}", exc_info=True)
+            self.failed.emit(self.search_id, str(e))
+
+
+class SearchPageWorker(QThread):
+    """Worker thread que precarga una página de resultados sin bloquear la UI"""
+
+    loaded = pyqtSignal(int, str, int, list)  # generation, query, page, results
+
+    def __init__(self, db, query, page, page_size, generation, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.query = query
+        self.page = page
+        self.page_size = page_size
+        self.generation = generation
+
+    def run(self):
+        """Ejecuta la búsqueda de la página"""
+        offset = (self.page - 1) * self.page_size
+        # Conexión propia: la del hilo de la GUI no se comparte entre hilos
+        with self.db.reader() as reader_db:
+            results = UniversalSearchEngine(reader_db).search_items(
+                self.query, limit=self.page_size, offset=offset
+            )
+        self.loaded.emit(self.generation, self.query, self.page, results)
+
+
+# Operadores de búsqueda (compilados una vez al cargar el módulo)
+_PHRASE_RE = re.compile(r'"([^"]+)"')
+_NOT_RE = re.compile(r'(?:NOT\s+|-)(\w+)', re.IGNORECASE)
+_AND_RE = re.compile(r'(?:AND\s+|\+)(\w+)', re.IGNORECASE)
+_OR_RE = re.compile(r'(?:OR\s+|\|)(\w+)', re.IGNORECASE)
+
+
+def _extract_operator(pattern, text):
+    """
+    Extrae los términos de un operador y los quita del texto en una sola pasada
+
+    Equivale a pattern.findall(text) + pattern.sub('', text) recorriendo
+    el texto una única vez.
+
+    Returns:
+        Tupla (lista de términos capturados, texto sin las coincidencias)
+    """
+    terms = []
+    pieces = []
+    last = 0
+    for m in pattern.finditer(text):
+        terms.append(m.group(1))
+        pieces.append(text[last:m.start()])
+        last = m.end()
+    if not terms:
+        return terms, text
+    pieces.append(text[last:])
+    return terms, ''.join(pieces)
+
+
+# A partir de cuántos términos de operador conviene una sola pasada combinada
+MULTI_TERM_MATCH_MIN = 4
+
+
+@lru_cache(maxsize=64)
+def _term_matcher(terms):
+    """
+    Crea una función que encuentra en una sola pasada qué términos aparecen en un texto
+
+    Args:
+        terms: Tupla de términos únicos en minúsculas
+
+    Returns:
+        Función text -> set de términos presentes en text
+    """
+    # Lookahead para detectar coincidencias en cada posición; con los términos
+    # más largos primero, en cada posición se registra el más largo
+    ordered = sorted(terms, key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))')
+
+    # Un término más largo encontrado implica todos los que contiene
+    implied = {term: {t for t in terms if t in term} for term in terms}
+    total = len(terms)
+
+    def match(text):
+        hits = set()
+        for m in pattern.finditer(text):
+            hits |= implied[m.group(1)]
+            if len(hits) == total:
+                break
+        return hits
+
+    return match
+
+
+@lru_cache(maxsize=256)
+def _parse_search_query(query):
+    """
+    Parsea la query de búsqueda (memoizado por texto de query)
+
+    Las listas de términos se devuelven como tuplas en minúsculas para que
+    el resultado cacheado no pueda modificarse desde fuera y para compararlas
+    directamente con SearchResult.get_search_text_lower(). base_query conserva
+    el texto original.
+    """
+    parsed = {
+        'base_query': query,
+        'and_terms': (),
+        'or_terms': (),
+        'not_terms': (),
+        'exact_phrases': (),
+        'has_operators': False
+    }
+
+    # Extraer frases exactas (entre comillas) y quitarlas de la query
+    exact_phrases, query_without_phrases = _extract_operator(_PHRASE_RE, query)
+    if exact_phrases:
+        parsed['exact_phrases'] = tuple(term.lower() for term in exact_phrases)
+        parsed['has_operators'] = True
+
+    # Detectar términos NOT (- o NOT seguido de palabra)
+    not_terms, query_without_phrases = _extract_operator(_NOT_RE, query_without_phrases)
+    if not_terms:
+        parsed['not_terms'] = tuple(term.lower() for term in not_terms)
+        parsed['has_operators'] = True
+
+    # Detectar términos con AND explícito (AND o +)
+    and_terms, query_without_phrases = _extract_operator(_AND_RE, query_without_phrases)
+    if and_terms:
+        parsed['and_terms'] = tuple(term.lower() for term in and_terms)
+        parsed['has_operators'] = True
+
+    # Detectar términos con OR explícito (OR o |)
+    or_terms, query_without_phrases = _extract_operator(_OR_RE, query_without_phrases)
+    if or_terms:
+        parsed['or_terms'] = tuple(term.lower() for term in or_terms)
+        parsed['has_operators'] = True
+
+    # Los términos restantes se consideran términos base (búsqueda normal)
+    remaining_terms = [t for t in query_without_phrases.strip().split() if t]
+
+    # Crear query base limpia para el motor de búsqueda
+    # Si HAY operadores, combinar todos los términos
+    # Si NO hay operadores, usar la query original
+    if parsed['has_operators']:
+        all_search_terms = remaining_terms + and_terms + or_terms
+        parsed['base_query'] = ' '.join(all_search_terms + exact_phrases)
+    else:
+        # No hay operadores, usar la query original
+        parsed['base_query'] = query
+
+    logger.info(f"Query parseada: base='{parsed['base_query']}', operadores={parsed['has_operators']}")
+    return parsed
+
+
+class SearchResultsModel(QAbstractTableModel):
+    """
+    Modelo de tabla respaldado directamente por la lista de SearchResult.
+
+    Qt solo pide data() de las celdas visibles durante el pintado, así que
+    refrescar resultados es un beginResetModel/endResetModel en lugar de
+    construir widgets por fila. La columna 0 es el checkbox (CheckStateRole).
+    """
+
+    HEADERS = ("☐", "Nombre", "PROYECTO", "AREA", "TABLA", "PROCESO", "CATEGORIA", "LISTA")
+
+    # Texto mostrado por columna
+    _COL_GETTERS = (
+        lambda r: "",
+        lambda r: r.display_name,
+        lambda r: r.proyectos_str,
+        lambda r: r.areas_str,
+        lambda r: r.tabla or "",
+        lambda r: r.procesos_str,
+        lambda r: r.categoria or "",
+        lambda r: r.lista or "",
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._display = []  # Textos por fila, calculados la primera vez que se pintan
+        self._filter_masks = None  # (máscaras de entidad, máscaras de tags, bit por tag)
+        self._checked_rows = set()  # Filas marcadas (índices de _rows)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            texts = self._display[row]
+            if texts is None:
+                result = self._rows[row]
+                texts = self._display[row] = tuple(getter(result) for getter in self._COL_GETTERS)
+            return texts[column]
+
+        if role == Qt.ItemDataRole.CheckStateRole and column == 0:
+            return Qt.CheckState.Checked if row in self._checked_rows else Qt.CheckState.Unchecked
+
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole or index.column() != 0:
+            return False
+
+        state = value if isinstance(value, Qt.CheckState) else Qt.CheckState(value)
+        if state == Qt.CheckState.Checked:
+            self._checked_rows.add(index.row())
+        else:
+            self._checked_rows.discard(index.row())
+
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == 0:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def set_results(self, results):
+        """Reemplaza los resultados mostrados (un único reset del modelo)"""
+        self.beginResetModel()
+        self._rows = results
+        self._display = [None] * len(results)
+        self._filter_masks = None
+        self._checked_rows = set()
+        self.endResetModel()
+
+    def result_at(self, row):
+        """Retorna el SearchResult de una fila del modelo (o None)"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def checked_rows(self):
+        """Retorna las filas del modelo marcadas (sin orden)"""
+        return self._checked_rows
+
+    def filter_masks(self):
+        """
+        Retorna las máscaras de filtro por fila (se calculan una vez por conjunto)
+
+        Returns:
+            Tupla (entity_masks, tag_masks, tag_bits): bits de entidades con
+            relación y de tags (en minúsculas) por fila, y el bit de cada tag
+        """
+        if self._filter_masks is None:
+            tag_bits = {}
+            entity_masks = []
+            tag_masks = []
+
+            for result in self._rows:
+                entity_mask = 0
+                for attr, bit in ENTITY_FILTER_ATTRS:
+                    if getattr(result, attr):
+                        entity_mask |= bit
+                entity_masks.append(entity_mask)
+
+                tag_mask = 0
+                for tag in result.tags:
+                    tag_mask |= tag_bits.setdefault(tag.lower(), 1 << len(tag_bits))
+                tag_masks.append(tag_mask)
+
+            self._filter_masks = (entity_masks, tag_masks, tag_bits)
+
+        return self._filter_masks
+
+    def set_all_checked(self, checked, rows=None):
+        """
+        Marca o desmarca filas con una única notificación
+
+        Args:
+            checked: True para marcar, False para desmarcar
+            rows: Filas a marcar (p.ej. solo las visibles); None = todas.
+                Al marcar, las filas fuera de rows quedan desmarcadas
+        """
+        if not checked:
+            self._checked_rows = set()
+        elif rows is None:
+            self._checked_rows = set(range(len(self._rows)))
+        else:
+            self._checked_rows = set(rows)
+        self._emit_check_column_changed()
+
+    def invert_checked(self, rows=None):
+        """
+        Invierte la marca de las filas con una única notificación
+
+        Args:
+            rows: Filas a invertir (p.ej. solo las visibles); None = todas.
+                Las filas fuera de rows quedan desmarcadas
+        """
+        rows = range(len(self._rows)) if rows is None else rows
+        self._checked_rows = set(rows) - self._checked_rows
+        self._emit_check_column_changed()
+
+    def _emit_check_column_changed(self):
+        """Notifica el cambio de toda la columna de checkboxes"""
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._rows) - 1, 0),
+                [Qt.ItemDataRole.CheckStateRole]
+            )
+
+
+class SearchResultsProxyModel(QSortFilterProxyModel):
+    """
+    Proxy de ordenamiento y filtrado por entidad/tags de SearchResultsModel
+
+    El filtrado compara las máscaras precalculadas de cada fila, así que
+    cambiar un filtro es un invalidateFilter() y no reconstruir el modelo.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entity_mask = 0  # Al menos una de estas relaciones (0 = sin filtro)
+        self._tag_mask = 0  # Todos estos tags
+        self._reject_all = False
+
+    def set_filters(self, entity_mask, tags):
+        """
+        Aplica los filtros de entidad y tags
+
+        Args:
+            entity_mask: Bits de ENTITY_FILTER_BITS activos
+            tags: Tags requeridos (lógica AND)
+        """
+        _, _, tag_bits = self.sourceModel().filter_masks()
+
+        tag_mask = 0
+        reject_all = False
+        for tag in tags:
+            bit = tag_bits.get(tag.lower())
+            if bit is None:
+                reject_all = True  # Ningún resultado tiene este tag
+                break
+            tag_mask |= bit
+
+        self._entity_mask = entity_mask
+        self._tag_mask = tag_mask
+        self._reject_all = reject_all
+        self.invalidateFilter()
+
+    def visible_source_rows(self):
+        """Retorna las filas del modelo fuente que pasan el filtro, en el orden de la vista"""
+        return [
+            self.mapToSource(self.index(row, 0)).row()
+            for row in range(self.rowCount())
+        ]
+
+    def _visible_checked_indexes(self):
+        """
+        Mapea a la vista solo las filas marcadas (O(k) para k marcadas)
+
+        Returns:
+            Lista de (fila en la vista, fila en el modelo); se omiten las
+            filas ocultas por los filtros
+        """
+        model = self.sourceModel()
+        mapped = []
+        for row in model.checked_rows():
+            index = self.mapFromSource(model.index(row, 0))
+            if index.isValid():
+                mapped.append((index.row(), row))
+        return mapped
+
+    def checked_results(self):
+        """Retorna los resultados marcados y visibles, en el orden de la vista"""
+        model = self.sourceModel()
+        return [model.result_at(row) for _, row in sorted(self._visible_checked_indexes())]
+
+    def checked_count(self):
+        """Retorna el número de resultados marcados y visibles"""
+        model = self.sourceModel()
+        return sum(
+            1 for row in model.checked_rows()
+            if self.mapFromSource(model.index(row, 0)).isValid()
+        )
+
+    def clear_filters(self):
+        """Quita los filtros sin refiltrar (para usar antes de un reset del modelo)"""
+        self._entity_mask = 0
+        self._tag_mask = 0
+        self._reject_all = False
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._reject_all:
+            return False
+        if not (self._entity_mask or self._tag_mask):
+            return True
+
+        entity_masks, tag_masks, _ = self.sourceModel().filter_masks()
+        if self._entity_mask and not entity_masks[source_row] & self._entity_mask:
+            return False
+        return tag_masks[source_row] & self._tag_mask == self._tag_mask
+
 
 class UniversalSearchDialog(QDialog):
     """Ventana de búsqueda universal con filtros y resultados"""
@@ -47,7 +783,8 @@ class UniversalSearchDialog(QDialog):
         self.db = db_manager
         self.search_engine = UniversalSearchEngine(db_manager)
         self.current_results = []
-        self.search_timer = QTimer()
+        self._current_stats = None
+        self.search_timer = QTimer(self)
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self.perform_search)
 
@@ -56,17 +793,41 @@ class UniversalSearchDialog(QDialog):
         self.page_size = 100
         self.total_items = 0
 
+        # Caché de páginas: (query, página) -> (total, resultados)
+        self._page_cache = OrderedDict()
+        self._page_cache_generation = 0
+        self._prefetch_workers = {}  # (query, página) -> SearchPageWorker
+
+        # Búsqueda en segundo plano: solo se aplica la respuesta más reciente
+        self._search_id = 0
+        self._search_workers = set()
+        self._search_started = 0.0
+        self._search_debounce_ms = SEARCH_DEBOUNCE_MS
+
+        # Época de resultados: los filtros pedidos sobre resultados ya
+        # reemplazados se descartan
+        self._results_epoch = 0
+        self._filter_epoch = 0
+
         # Optimización de filtros
         self.filter_timer = QTimer()
         self.filter_timer.setSingleShot(True)
         self.filter_timer.timeout.connect(self.apply_filters_debounced)
-        self.last_entity_filters = None
-        self.last_tag_filters = None
+        self._entity_mask = ALL_ENTITIES_MASK  # Todos marcados por defecto
+        self._active_tags = set()  # Tags marcados en el panel
+        self._last_entity_mask = None
+        self._last_active_tags = None
 
         # Historial de búsquedas
-        self.search_history = []
+        self.search_history = OrderedDict()  # query -> None, la más reciente al final
         self.max_history = 20  # Máximo de búsquedas en historial
 
+        # Diálogo de ayuda (se construye la primera vez que se muestra)
+        self._help_dialog = None
+
+        # Índices nombre -> id para navegación (se cargan al primer uso)
+        self._name_indexes = {}
+
         self.init_ui()
         self.apply_styles()
         self.load_initial_data()
@@ -270,6 +1031,11 @@ class UniversalSearchDialog(QDialog):
 
         self.entity_checkboxes = {}
 
+        # Grupo no exclusivo: una sola conexión para todos los checkboxes,
+        # con el bit de la máscara como id del botón
+        self.entity_group = QButtonGroup(self)
+        self.entity_group.setExclusive(False)
+
         entities = [
             ("proyectos", "☐ Proyectos"),
             ("areas", "☐ Areas"),
@@ -281,10 +1047,12 @@ class UniversalSearchDialog(QDialog):
         for entity_id, entity_text in entities:
             cb = QCheckBox(entity_text)
             cb.setChecked(True)  # Todos marcados por defecto
-            cb.stateChanged.connect(self.on_filter_changed)
+            self.entity_group.addButton(cb, ENTITY_FILTER_BITS[entity_id])
             self.entity_checkboxes[entity_id] = cb
             layout.addWidget(cb)
 
+        self.entity_group.idToggled.connect(self._on_entity_toggled)
+
         layout.addStretch()
 
         return container
@@ -340,36 +1108,114 @@ class UniversalSearchDialog(QDialog):
         return container
 
     def create_results_table(self):
-        """Crea la tabla de resultados"""
-        table = QTableWidget()
-        table.setColumnCount(8)
-
-        headers = ["☐", "Nombre", "PROYECTO", "AREA", "TABLA", "PROCESO", "CATEGORIA", "LISTA"]
-        table.setHorizontalHeaderLabels(headers)
-
-        # Configurar header
+        """Crea la tabla de resultados (QTableView + modelo + proxy de ordenamiento)"""
+        self.results_model = SearchResultsModel(self)
+        self.results_proxy = SearchResultsProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        # Sin reordenar en cada dataChanged (p.ej. al marcar checkboxes);
+        # el orden se aplica al hacer clic en el header y tras cada reset
+        self.results_proxy.setDynamicSortFilter(False)
+
+        table = QTableView()
+        table.setModel(self.results_proxy)
+
+        # Configurar header: anchos fijos/interactivos para que Qt no recorra
+        # todas las celdas calculando el ancho por contenido
         header = table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)  # Checkbox
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Nombre
         for i in range(2, 8):
             header.setSectionResizeMode(i, QHeaderView.ResizeMode.Interactive)
+            table.setColumnWidth(i, 110)
 
         table.setColumnWidth(0, 40)  # Checkbox
+        table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
 
         # Configurar tabla
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.setAlternatingRowColors(True)
         table.setShowGrid(True)
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)  # Orden original de la búsqueda
         table.setSortingEnabled(True)
         table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
 
         # Eventos
-        table.cellDoubleClicked.connect(self.on_cell_double_clicked)
+        table.doubleClicked.connect(self.on_cell_double_clicked)
         table.customContextMenuRequested.connect(self.show_context_menu)
-        table.itemSelectionChanged.connect(self.on_selection_changed)
+        table.selectionModel().selectionChanged.connect(self.on_selection_changed)
+
+        self._build_context_menu()
 
         return table
 
+    def _build_context_menu(self):
+        """Crea una sola vez el menú contextual; sus acciones actúan sobre self._ctx_result"""
+        self._ctx_result = None
+        self._ctx_menu = QMenu(self)
+
+        # Acción: Copiar contenido
+        copy_action = self._ctx_menu.addAction("📋 Copiar contenido")
+        copy_action.triggered.connect(lambda: self.copy_item_content(self._ctx_result))
+
+        # Acción: Copiar seleccionados (visible con más de un item marcado)
+        self._ctx_copy_selected_action = self._ctx_menu.addAction("")
+        self._ctx_copy_selected_action.triggered.connect(self.copy_selected_items)
+
+        self._ctx_menu.addSeparator()
+
+        # Acción: Editar
+        edit_action = self._ctx_menu.addAction("✏️ Editar")
+        edit_action.triggered.connect(lambda: self.edit_item(self._ctx_result))
+
+        # Acción: Eliminar
+        delete_action = self._ctx_menu.addAction("🗑️ Eliminar")
+        delete_action.triggered.connect(lambda: self.delete_item(self._ctx_result))
+
+        self._ctx_menu.addSeparator()
+
+        # Acción: Agregar/Quitar de favoritos
+        self._ctx_fav_action = self._ctx_menu.addAction("")
+        self._ctx_fav_action.triggered.connect(lambda: self.toggle_favorite(self._ctx_result))
+
+        self._ctx_menu.addSeparator()
+
+        # Navegación: categoría fija + pools de acciones para proyectos/áreas,
+        # que crecen según el máximo de relaciones visto en un resultado
+        self._ctx_category_action = self._ctx_menu.addAction("")
+        self._ctx_category_action.triggered.connect(lambda: self.navigate_to_category(self._ctx_result))
+        self._ctx_project_actions = []
+        self._ctx_area_actions = []
+
+    def _ctx_navigation_action(self, pool, index, navigate):
+        """Retorna la acción index del pool, creándola (en su posición del menú) si hace falta"""
+        if index < len(pool):
+            return pool[index]
+
+        action = QAction(self._ctx_menu)
+        action.triggered.connect(lambda checked=False, act=action: navigate(act.data()))
+        # Las acciones de proyecto van antes que las de área
+        before = self._ctx_area_actions[0] if pool is self._ctx_project_actions and self._ctx_area_actions else None
+        self._ctx_menu.insertAction(before, action)
+        pool.append(action)
+        return action
+
+    def _fill_ctx_navigation(self, pool, names, label, navigate):
+        """Muestra una acción de navegación por nombre y oculta el resto del pool"""
+        for i, name in enumerate(names):
+            action = self._ctx_navigation_action(pool, i, navigate)
+            action.setText(f"{label}: {name}")
+            action.setData(name)
+            action.setVisible(True)
+        for action in pool[len(names):]:
+            action.setVisible(False)
+
+    def _result_for_index(self, index):
+        """Retorna el SearchResult de un índice de la vista (mapeado por el proxy)"""
+        if not index.isValid():
+            return None
+        source_index = self.results_proxy.mapToSource(index)
+        return self.results_model.result_at(source_index.row())
+
     def create_tag_filter_panel(self):
         """Crea el panel lateral de filtro por tags"""
         panel = QFrame()
@@ -394,23 +1240,20 @@ class UniversalSearchDialog(QDialog):
         self.tag_count_label.setStyleSheet("color: #888888; padding: 5px;")
         layout.addWidget(self.tag_count_label)
 
-        # Área de scroll para tags
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-
-        self.tag_list_widget = QWidget()
-        self.tag_list_layout = QVBoxLayout(self.tag_list_widget)
-        self.tag_list_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-
-        # Mensaje inicial
+        # Mensaje inicial (visible mientras no hay tags)
         self.no_tags_label = QLabel("No hay tags disponibles\n\nLos tags aparecerán\nautomáticamente al\nbuscar items")
         self.no_tags_label.setStyleSheet("color: #666666; padding: 20px;")
         self.no_tags_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.tag_list_layout.addWidget(self.no_tags_label)
+        layout.addWidget(self.no_tags_label, 1)
 
-        scroll.setWidget(self.tag_list_widget)
-        layout.addWidget(scroll)
+        # Lista de tags con items marcables (sin un QCheckBox por tag)
+        self.tag_list_widget = QListWidget()
+        self.tag_list_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.tag_list_widget.itemChanged.connect(self._on_tag_item_changed)
+        self.tag_list_widget.setVisible(False)
+        layout.addWidget(self.tag_list_widget, 1)
+        self._last_tag_signature = None
+        self._tag_items = {}  # tag -> QListWidgetItem
 
         # Botón limpiar
         btn_clear = QPushButton("Limpiar")
@@ -455,21 +1298,137 @@ class UniversalSearchDialog(QDialog):
         self.no_preview_label = QLabel(
             "Selecciona un item\npara ver sus detalles"
         )
-        self.no_preview_label.setStyleSheet("""
-            QLabel {
-                color: #666666;
-                padding: 40px 20px;
-                font-size: 11pt;
-            }
-        """)
+        self.no_preview_label.setObjectName("previewPlaceholder")
         self.no_preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.preview_layout.addWidget(self.no_preview_label)
 
+        # Widgets del detalle: se crean una vez y se reutilizan
+        self._build_preview_template()
+
         scroll.setWidget(self.preview_content)
         layout.addWidget(scroll)
 
         return panel
 
+    def _build_preview_template(self):
+        """Crea (ocultos) los widgets del preview que update_preview rellena"""
+        self._preview_result = None
+        self._preview_widgets = []  # Todos los widgets del detalle, en orden
+
+        def add(widget, object_name=None):
+            if object_name:
+                widget.setObjectName(object_name)
+            widget.setVisible(False)
+            self.preview_layout.addWidget(widget)
+            self._preview_widgets.append(widget)
+            return widget
+
+        def label(object_name, word_wrap=False):
+            lbl = QLabel()
+            lbl.setWordWrap(word_wrap)
+            return add(lbl, object_name)
+
+        def separator():
+            sep = QFrame()
+            sep.setFrameShape(QFrame.Shape.HLine)
+            return add(sep, "previewSeparator")
+
+        def section(text):
+            lbl = label("previewSection")
+            lbl.setText(text)
+            return lbl
+
+        # Título con icono
+        self._prev_title = label("previewTitle", word_wrap=True)
+
+        # Tipo de resultado
+        self._prev_type = label("previewType")
+        self._prev_sep_top = separator()
+
+        # Contenido
+        self._prev_content_label = section("📄 Contenido:")
+        self._prev_content = add(QTextEdit(), "previewContent")
+        self._prev_content.setReadOnly(True)
+        self._prev_content.setMaximumHeight(150)
+
+        # Descripción
+        self._prev_desc_label = section("📝 Descripción:")
+        self._prev_desc = label("previewDescription", word_wrap=True)
+
+        # Tags (máximo 10 visibles)
+        self._prev_tags_label = section("🏷️ Tags:")
+        self._prev_tags_container = add(QWidget())
+        tags_layout = QHBoxLayout(self._prev_tags_container)
+        tags_layout.setContentsMargins(0, 0, 0, 0)
+        tags_layout.setSpacing(5)
+        tags_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
+
+        self._prev_tag_buttons = []
+        for _ in range(10):
+            tag_btn = QPushButton()
+            tag_btn.setObjectName("previewTag")
+            tag_btn.setFixedHeight(22)
+            tags_layout.addWidget(tag_btn)
+            self._prev_tag_buttons.append(tag_btn)
+
+        self._prev_tags_more = QLabel()
+        self._prev_tags_more.setObjectName("previewTagsMore")
+        tags_layout.addWidget(self._prev_tags_more)
+
+        # Relaciones
+        self._prev_sep_relations = separator()
+        self._prev_relations_label = section("🔗 Relaciones:")
+        self._prev_proyectos = label("previewRelation", word_wrap=True)
+        self._prev_areas = label("previewRelation", word_wrap=True)
+        self._prev_categoria = label("previewRelation", word_wrap=True)
+        self._prev_tabla = label("previewRelation", word_wrap=True)
+        self._prev_lista = label("previewRelation", word_wrap=True)
+        self._prev_procesos = label("previewRelation", word_wrap=True)
+
+        # Metadata
+        self._prev_sep_meta = separator()
+        self._prev_meta_label = section("ℹ️ Información:")
+        self._prev_favorite = label("previewFavorite")
+        self._prev_favorite.setText("⭐ Favorito")
+        self._prev_sensitive = label("previewSensitive")
+        self._prev_sensitive.setText("🔒 Sensible (cifrado)")
+        self._prev_usage = label("previewMeta")
+        self._prev_last_used = label("previewMeta")
+        self._prev_created = label("previewMeta")
+        self._prev_updated = label("previewMeta")
+
+        # Botones de acción (actúan sobre el resultado mostrado)
+        self._prev_sep_actions = separator()
+        self._prev_actions_label = section("⚡ Acciones:")
+
+        copy_btn = add(QPushButton("📋 Copiar Contenido"))
+        copy_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        copy_btn.clicked.connect(lambda: self.copy_item_content(self._preview_result))
+
+        self._prev_fav_btn = add(QPushButton())
+        self._prev_fav_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self._prev_fav_btn.clicked.connect(lambda: self.toggle_favorite(self._preview_result))
+
+        edit_btn = add(QPushButton("✏️ Editar"))
+        edit_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        edit_btn.clicked.connect(lambda: self.edit_item(self._preview_result))
+
+        delete_btn = add(QPushButton("🗑️ Eliminar"), "previewDeleteButton")
+        delete_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        delete_btn.clicked.connect(lambda: self.delete_item(self._preview_result))
+
+        # Widgets que se muestran para cualquier resultado
+        self._prev_always_visible = [
+            self._prev_title, self._prev_type, self._prev_sep_top,
+            self._prev_sep_relations, self._prev_relations_label,
+            self._prev_sep_meta, self._prev_meta_label, self._prev_usage,
+            self._prev_sep_actions, self._prev_actions_label,
+            copy_btn, self._prev_fav_btn, edit_btn, delete_btn,
+        ]
+
+        # Spacer al final
+        self.preview_layout.addStretch()
+
     def create_status_bar(self):
         """Crea la barra de estado inferior con paginación"""
         status_bar = QFrame()
@@ -504,14 +1463,27 @@ class UniversalSearchDialog(QDialog):
 
     def on_search_text_changed(self, text):
         """Handler cuando cambia el texto de búsqueda"""
+        self._discard_pending_search()
+        # Debounce: esperar tras el último cambio (más si las búsquedas son lentas)
+        self.search_timer.start(self._search_debounce_ms)
+
+    def _discard_pending_search(self):
+        """Descarta la búsqueda en curso y la paginación de la query anterior"""
         # Resetear paginación al cambiar búsqueda
         self.reset_pagination()
-        # Debounce: esperar 300ms después del último cambio
+        self._invalidate_page_cache()
+        # Cualquier búsqueda o filtro pendiente queda obsoleto
+        self._search_id += 1
+        self.filter_timer.stop()
         self.search_timer.stop()
-        self.search_timer.start(300)
+
+    def _run_search(self):
+        """Ejecuta la búsqueda del texto actual sin esperar al debounce"""
+        self._discard_pending_search()
+        self.perform_search()
 
     def perform_search(self):
-        """Realiza la búsqueda con paginación y operadores"""
+        """Realiza la búsqueda con paginación y operadores (la consulta corre en un worker)"""
         query = self.search_input.text().strip()
 
         if not query:
@@ -519,44 +1491,86 @@ class UniversalSearchDialog(QDialog):
             self.load_recent_items()
             return
 
-        try:
-            # Mostrar indicador de carga
-            self.show_loading()
+        # Agregar al historial
+        self.add_to_history(query)
 
-            # Agregar al historial
-            self.add_to_history(query)
+        # Parsear query para detectar operadores
+        parsed_query = self.parse_search_query(query)
 
-            # Parsear query para detectar operadores
-            parsed_query = self.parse_search_query(query)
+        # Usar la query base para la búsqueda
+        search_query = parsed_query['base_query']
 
-            # Usar la query base para la búsqueda
-            search_query = parsed_query['base_query']
+        logger.info(f"Buscando con query: '{search_query}'")
 
-            logger.info(f"Buscando con query: '{search_query}'")
+        # Cualquier búsqueda anterior aún en curso queda obsoleta
+        self._search_id += 1
 
-            # Obtener conteo total
-            self.total_items = self.db.universal_search_items_count(search_query)
-            logger.info(f"Total items encontrados: {self.total_items}")
+        cached = self._page_cache.get((search_query, self.current_page))
+        if cached is not None:
+            # Página precargada: sin ida y vuelta a la BD
+            logger.info(f"Página {self.current_page} servida desde caché")
+            self.total_items, results = cached
+            self._show_search_results(results, parsed_query)
+            return
 
-            # Calcular offset
-            offset = (self.current_page - 1) * self.page_size
+        # Mostrar indicador de carga
+        self.show_loading()
+        self._search_started = time.monotonic()
 
-            # Buscar items con paginación
-            results = self.search_engine.search_items(search_query, limit=self.page_size, offset=offset)
-            logger.info(f"Resultados obtenidos: {len(results)}")
+        worker = SearchWorker(
+            self.db, parsed_query, self.current_page,
+            self.page_size, self._search_id, parent=self
+        )
+        worker.loaded.connect(self._on_search_finished)
+        worker.failed.connect(self._on_search_failed)
+        worker.finished.connect(lambda: self._search_workers.discard(worker))
+        worker.finished.connect(worker.deleteLater)
+        self._search_workers.add(worker)
+        worker.start()
+
+    def _on_search_finished(self, search_id, page, total, results, parsed_query):
+        """Aplica los resultados del SearchWorker si siguen siendo los más recientes"""
+        if search_id != self._search_id:
+            logger.debug(f"Descartando resultados obsoletos de la búsqueda {search_id}")
+            return
 
+        logger.info(f"Total items encontrados: {total}")
+        logger.info(f"Resultados obtenidos: {len(results)}")
+
+        # Debounce adaptativo según lo que tardó esta búsqueda
+        elapsed = time.monotonic() - self._search_started
+        self._search_debounce_ms = (
+            SLOW_SEARCH_DEBOUNCE_MS if elapsed > SLOW_SEARCH_SECONDS else SEARCH_DEBOUNCE_MS
+        )
+
+        self.total_items = total
+        self._store_page(parsed_query['base_query'], page, total, results)
+        self._show_search_results(results, parsed_query)
+
+    def _on_search_failed(self, search_id, message):
+        """Muestra el error del SearchWorker si sigue siendo la búsqueda más reciente"""
+        if search_id != self._search_id:
+            return
+
+        self.hide_loading()
+        QMessageBox.critical(self, "Error", f"Error en búsqueda:\n{message}")
+
+    def _show_search_results(self, results, parsed_query):
+        """Aplica operadores y muestra una página de resultados de búsqueda"""
+        try:
             # Aplicar operadores de búsqueda solo si hay operadores
             if parsed_query['has_operators']:
                 logger.info("Aplicando operadores de búsqueda...")
                 results = self.apply_search_operators(results, parsed_query)
                 logger.info(f"Resultados después de operadores: {len(results)}")
 
-            self.current_results = results
-            self.update_results_table(results)
-            self.update_tag_filter_panel(results)
-            self.update_status_bar()
+            self._set_current_results(results)
             self.update_pagination_controls()
 
+            # Precargar páginas vecinas mientras el usuario lee esta
+            search_query = parsed_query['base_query']
+            QTimer.singleShot(0, lambda: self._prefetch_neighbors(search_query))
+
         except Exception as e:
             logger.error(f"Error en búsqueda: {e}", exc_info=True)
             QMessageBox.critical(self, "Error", f"Error en búsqueda:\n{str(e)}")
@@ -566,19 +1580,67 @@ class UniversalSearchDialog(QDialog):
             # Mantener el foco en el campo de búsqueda
             self.search_input.setFocus()
 
+    def _store_page(self, query, page, total, results):
+        """Guarda una página en la caché, descartando la más antigua si está llena"""
+        self._page_cache[(query, page)] = (total, results)
+        while len(self._page_cache) > PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+
+    def _invalidate_page_cache(self):
+        """Descarta las páginas cacheadas y las precargas en curso"""
+        self._page_cache.clear()
+        self._page_cache_generation += 1
+
+    def _prefetch_neighbors(self, query):
+        """Precarga en segundo plano la página anterior y la siguiente"""
+        total_pages = (self.total_items + self.page_size - 1) // self.page_size
+
+        for page in (self.current_page + 1, self.current_page - 1):
+            key = (query, page)
+            if not 1 <= page <= total_pages:
+                continue
+            if key in self._page_cache or key in self._prefetch_workers:
+                continue
+
+            worker = SearchPageWorker(
+                self.db, query, page, self.page_size,
+                self._page_cache_generation, parent=self
+            )
+            worker.loaded.connect(self._on_page_prefetched)
+            worker.finished.connect(lambda key=key: self._prefetch_workers.pop(key, None))
+            worker.finished.connect(worker.deleteLater)
+            self._prefetch_workers[key] = worker
+            worker.start()
+
+    def _on_page_prefetched(self, generation, query, page, results):
+        """Guarda la página precargada si la caché sigue vigente"""
+        if generation != self._page_cache_generation:
+            return
+        self._store_page(query, page, self.total_items, results)
+        logger.debug(f"Página {page} precargada para '{query}'")
+
+    def _wait_for_workers(self):
+        """Espera a que terminen las búsquedas y precargas en curso"""
+        for worker in [*self._search_workers, *self._prefetch_workers.values()]:
+            worker.wait()
+
+    def done(self, result):
+        """Espera a las búsquedas y precargas en curso antes de cerrar el diálogo"""
+        self._wait_for_workers()
+        super().done(result)
+
     def load_initial_data(self):
         """Carga datos iniciales (items recientes)"""
         self.load_recent_items()
 
     def load_recent_items(self):
         """Carga items recientes"""
+        # Una búsqueda aún en curso no debe sobrescribir esta vista
+        self._search_id += 1
         try:
             self.show_loading()
             results = self.search_engine.get_recent_items(limit=100)
-            self.current_results = results
-            self.update_results_table(results)
-            self.update_tag_filter_panel(results)
-            self.update_status_bar()
+            self._set_current_results(results)
         except Exception as e:
             logger.error(f"Error cargando items recientes: {e}", exc_info=True)
         finally:
@@ -586,85 +1648,89 @@ class UniversalSearchDialog(QDialog):
             # Mantener el foco en el campo de búsqueda
             self.search_input.setFocus()
 
+    def _set_current_results(self, results):
+        """Reemplaza los resultados actuales y refresca tabla, tags y estado"""
+        self.current_results = results
+        self._current_stats = None  # Se recalculan en update_status_bar
+        self._results_epoch += 1
+        # Los resultados nuevos se muestran sin filtrar
+        self._last_entity_mask = None
+        self._last_active_tags = None
+        self.update_results_table(results)
+        self.update_tag_filter_panel(results)
+        self.update_status_bar()
+
     def update_results_table(self, results):
         """Actualiza la tabla con los resultados"""
-        self.results_table.setRowCount(0)
-        self.results_table.setSortingEnabled(False)
-
-        for row, result in enumerate(results):
-            self.results_table.insertRow(row)
-
-            # Checkbox
-            cb = QCheckBox()
-            cb_widget = QWidget()
-            cb_layout = QHBoxLayout(cb_widget)
-            cb_layout.addWidget(cb)
-            cb_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            cb_layout.setContentsMargins(0, 0, 0, 0)
-            self.results_table.setCellWidget(row, 0, cb_widget)
-
-            # Nombre con icono
-            icon = result.icon if result.icon else "📄"
-            name_text = f"{icon} {result.name}"
-            name_item = QTableWidgetItem(name_text)
-            self.results_table.setItem(row, 1, name_item)
-
-            # Proyectos
-            proyectos_text = ", ".join(result.proyectos) if result.proyectos else ""
-            self.results_table.setItem(row, 2, QTableWidgetItem(proyectos_text))
-
-            # Areas
-            areas_text = ", ".join(result.areas) if result.areas else ""
-            self.results_table.setItem(row, 3, QTableWidgetItem(areas_text))
-
-            # Tabla
-            tabla_text = result.tabla if result.tabla else ""
-            self.results_table.setItem(row, 4, QTableWidgetItem(tabla_text))
-
-            # Proceso
-            procesos_text = ", ".join(result.procesos) if result.procesos else ""
-            self.results_table.setItem(row, 5, QTableWidgetItem(procesos_text))
-
-            # Categoría
-            categoria_text = result.categoria if result.categoria else ""
-            self.results_table.setItem(row, 6, QTableWidgetItem(categoria_text))
-
-            # Lista
-            lista_text = result.lista if result.lista else ""
-            self.results_table.setItem(row, 7, QTableWidgetItem(lista_text))
+        # Un único repintado tras el reset (y el reordenamiento del proxy)
+        self.results_table.setUpdatesEnabled(False)
+        try:
+            # Los resultados nuevos se muestran sin filtrar
+            self.results_proxy.clear_filters()
+            self.results_model.set_results(results)
+
+            # Reaplicar el orden elegido por el usuario (una sola vez por reset)
+            header = self.results_table.horizontalHeader()
+            sort_column = header.sortIndicatorSection()
+            if 0 <= sort_column < self.results_model.columnCount():
+                self.results_proxy.sort(sort_column, header.sortIndicatorOrder())
+        finally:
+            self.results_table.setUpdatesEnabled(True)
+            self.results_table.viewport().update()
 
-        self.results_table.setSortingEnabled(True)
+        # El reset del modelo no emite selectionChanged
+        self.clear_preview()
 
     def update_tag_filter_panel(self, results):
         """Actualiza el panel de filtro por tags"""
-        # Limpiar tags anteriores
-        while self.tag_list_layout.count():
-            item = self.tag_list_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
         # Extraer tags únicos
         unique_tags = self.search_engine.extract_unique_tags(results)
+        shown_tags = unique_tags[:50]  # Limitar a 50 tags
 
-        if not unique_tags:
-            # Mostrar mensaje si no hay tags
-            self.no_tags_label = QLabel("No hay tags disponibles\n\nLos tags aparecerán\nautomáticamente al\nbuscar items")
-            self.no_tags_label.setStyleSheet("color: #666666; padding: 20px;")
-            self.no_tags_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.tag_list_layout.addWidget(self.no_tags_label)
-            self.tag_count_label.setText("[0 tags]")
-        else:
-            # Agregar checkboxes para cada tag
-            for tag_name, count in unique_tags[:50]:  # Limitar a 50 tags
-                cb = QCheckBox(f"{tag_name} ({count})")
-                cb.stateChanged.connect(self.on_filter_changed)
-                self.tag_list_layout.addWidget(cb)
+        has_tags = bool(shown_tags)
+        self.no_tags_label.setVisible(not has_tags)
+        self.tag_list_widget.setVisible(has_tags)
+        self.tag_count_label.setText(f"[{len(unique_tags)} tags]")
+
+        self.tag_list_widget.setUpdatesEnabled(False)
+        try:
+            self._fill_tag_list(shown_tags)
+        finally:
+            self.tag_list_widget.setUpdatesEnabled(True)
+
+    def _fill_tag_list(self, shown_tags):
+        """Rellena (o solo actualiza) la lista de tags con las señales bloqueadas"""
+        signature = tuple(sorted(tag_name for tag_name, _ in shown_tags))
+
+        with QSignalBlocker(self.tag_list_widget):
+            if signature == self._last_tag_signature:
+                # Mismo conjunto de tags: solo actualizar contadores y desmarcar
+                for tag_name, count in shown_tags:
+                    item = self._tag_items[tag_name]
+                    item.setText(f"{tag_name} ({count})")
+                    item.setCheckState(Qt.CheckState.Unchecked)
+                self._active_tags.clear()
+                return
 
-            self.tag_count_label.setText(f"[{len(unique_tags)} tags]")
+            self._last_tag_signature = signature
+            self._active_tags.clear()
+            self.tag_list_widget.clear()
+            self.tag_list_widget.addItems([f"{tag_name} ({count})" for tag_name, count in shown_tags])
+
+            self._tag_items = {}
+            for i, (tag_name, _) in enumerate(shown_tags):
+                item = self.tag_list_widget.item(i)
+                item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                item.setCheckState(Qt.CheckState.Unchecked)
+                item.setData(Qt.ItemDataRole.UserRole, tag_name)  # Nombre canónico del tag
+                self._tag_items[tag_name] = item
 
     def update_status_bar(self):
         """Actualiza la barra de estado"""
-        stats = self.search_engine.get_statistics(self.current_results)
+        # Las estadísticas dependen solo de current_results: calcularlas una vez por conjunto
+        stats = self._current_stats
+        if stats is None:
+            stats = self._current_stats = self.search_engine.get_statistics(self.current_results)
 
         status_parts = []
         status_parts.append(f"📊 {stats['total']} Items")
@@ -722,6 +1788,7 @@ class UniversalSearchDialog(QDialog):
     def on_tab_clicked(self, tab_id):
         """Handler cuando se hace clic en una pestaña"""
         if tab_id == "refrescar":
+            self._invalidate_page_cache()
             self.perform_search()
         elif tab_id == "mas_usados":
             self.load_most_used()
@@ -738,13 +1805,12 @@ class UniversalSearchDialog(QDialog):
 
     def load_most_used(self):
         """Carga items más usados"""
+        # Una búsqueda aún en curso no debe sobrescribir esta vista
+        self._search_id += 1
         try:
             self.show_loading()
             results = self.search_engine.get_most_used(limit=100)
-            self.current_results = results
-            self.update_results_table(results)
-            self.update_tag_filter_panel(results)
-            self.update_status_bar()
+            self._set_current_results(results)
         except Exception as e:
             logger.error(f"Error cargando items más usados: {e}", exc_info=True)
         finally:
@@ -754,13 +1820,12 @@ class UniversalSearchDialog(QDialog):
 
     def load_items_with_tags(self):
         """Carga items con tags"""
+        # Una búsqueda aún en curso no debe sobrescribir esta vista
+        self._search_id += 1
         try:
             self.show_loading()
             results = self.search_engine.get_items_with_tags(limit=1000)
-            self.current_results = results
-            self.update_results_table(results)
-            self.update_tag_filter_panel(results)
-            self.update_status_bar()
+            self._set_current_results(results)
         except Exception as e:
             logger.error(f"Error cargando items con tags: {e}", exc_info=True)
         finally:
@@ -771,383 +1836,191 @@ class UniversalSearchDialog(QDialog):
     def on_filter_changed(self):
         """Handler cuando cambian los filtros - con debouncing"""
         # Detener timer previo y reiniciar (debouncing de 200ms)
+        self._filter_epoch = self._results_epoch
         self.filter_timer.stop()
         self.filter_timer.start(200)
 
+    def _on_entity_toggled(self, bit, checked):
+        """Actualiza la máscara de entidades con el checkbox que cambió"""
+        if checked:
+            self._entity_mask |= bit
+        else:
+            self._entity_mask &= ~bit
+        self.on_filter_changed()
+
+    def _on_tag_item_changed(self, item):
+        """Actualiza el conjunto de tags activos con el item que cambió"""
+        tag_name = item.data(Qt.ItemDataRole.UserRole)
+        if item.checkState() == Qt.CheckState.Checked:
+            self._active_tags.add(tag_name)
+        else:
+            self._active_tags.discard(tag_name)
+        self.on_filter_changed()
+
     def apply_filters_debounced(self):
         """Aplica filtros con debouncing y caché"""
+        if self._filter_epoch != self._results_epoch:
+            return  # Los resultados cambiaron desde que se pidió el filtro
+
         if not self.current_results:
             return
 
-        # Obtener filtros de entidad
-        entity_filters = {
-            'proyectos': self.entity_checkboxes['proyectos'].isChecked(),
-            'areas': self.entity_checkboxes['areas'].isChecked(),
-            'categorias': self.entity_checkboxes['categorias'].isChecked(),
-            'tablas': self.entity_checkboxes['tablas'].isChecked(),
-            'procesos': self.entity_checkboxes['procesos'].isChecked()
-        }
-
-        # Obtener filtros de tags
-        tag_filters = []
-        for i in range(self.tag_list_layout.count()):
-            widget = self.tag_list_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox) and widget.isChecked():
-                # Extraer nombre del tag (antes del paréntesis)
-                tag_text = widget.text()
-                tag_name = tag_text.split('(')[0].strip()
-                tag_filters.append(tag_name)
-
-        # Verificar si los filtros han cambiado (caché)
-        if (self.last_entity_filters == entity_filters and
-            self.last_tag_filters == tag_filters):
+        # Verificar si los filtros han cambiado (caché: un int y un frozenset)
+        entity_mask = self._entity_mask
+        active_tags = frozenset(self._active_tags)
+        if entity_mask == self._last_entity_mask and active_tags == self._last_active_tags:
             return  # No hay cambios, evitar recálculo
 
         # Guardar filtros actuales en caché
-        self.last_entity_filters = entity_filters.copy()
-        self.last_tag_filters = tag_filters.copy()
-
-        # Aplicar filtros
-        filtered_results = self.search_engine.apply_filters(
-            self.current_results,
-            entity_filters,
-            tag_filters
-        )
+        self._last_entity_mask = entity_mask
+        self._last_active_tags = active_tags
 
-        self.update_results_table(filtered_results)
+        # Aplicar filtros en el proxy (sin reconstruir el modelo). Como al
+        # reconstruir la tabla, las marcas de las filas se descartan
+        self.results_model.set_all_checked(False)
+        self.results_proxy.set_filters(entity_mask, active_tags)
         self.update_status_bar()
 
     def select_all_results(self):
-        """Selecciona todos los resultados"""
-        for row in range(self.results_table.rowCount()):
-            cb_widget = self.results_table.cellWidget(row, 0)
-            if cb_widget:
-                cb = cb_widget.findChild(QCheckBox)
-                if cb:
-                    cb.setChecked(True)
+        """Selecciona todos los resultados visibles (los ocultos por filtros quedan sin marcar)"""
+        self.results_model.set_all_checked(True, self.results_proxy.visible_source_rows())
 
     def deselect_all_results(self):
         """Deselecciona todos los resultados"""
-        for row in range(self.results_table.rowCount()):
-            cb_widget = self.results_table.cellWidget(row, 0)
-            if cb_widget:
-                cb = cb_widget.findChild(QCheckBox)
-                if cb:
-                    cb.setChecked(False)
+        self.results_model.set_all_checked(False)
 
     def invert_selection(self):
-        """Invierte la selección"""
-        for row in range(self.results_table.rowCount()):
-            cb_widget = self.results_table.cellWidget(row, 0)
-            if cb_widget:
-                cb = cb_widget.findChild(QCheckBox)
-                if cb:
-                    cb.setChecked(not cb.isChecked())
+        """Invierte la selección de los resultados visibles"""
+        self.results_model.invert_checked(self.results_proxy.visible_source_rows())
 
     def clear_tag_filters(self):
         """Limpia los filtros de tags"""
-        for i in range(self.tag_list_layout.count()):
-            widget = self.tag_list_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox):
-                widget.setChecked(False)
+        # Desmarcar sin emitir itemChanged por cada tag y filtrar una sola vez
+        with QSignalBlocker(self.tag_list_widget):
+            for i in range(self.tag_list_widget.count()):
+                self.tag_list_widget.item(i).setCheckState(Qt.CheckState.Unchecked)
+
+        if self._active_tags:
+            self._active_tags.clear()
+            self.on_filter_changed()
 
     def on_selection_changed(self):
         """Handler cuando cambia la selección en la tabla"""
-        selected_rows = self.results_table.selectedItems()
+        selected_rows = self.results_table.selectionModel().selectedRows()
         if not selected_rows:
             self.clear_preview()
             return
 
         # Obtener la fila seleccionada
-        row = self.results_table.currentRow()
-        if row >= 0 and row < len(self.current_results):
-            result = self.current_results[row]
+        index = self.results_table.currentIndex()
+        result = self._result_for_index(index if index.isValid() else selected_rows[0])
+        if result is not None:
             self.update_preview(result)
 
     def update_preview(self, result):
         """Actualiza el panel de preview con los detalles del item"""
-        # Limpiar contenido anterior
-        while self.preview_layout.count():
-            item = self.preview_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Un único relayout/repintado tras actualizar todos los widgets
+        self.preview_content.setUpdatesEnabled(False)
+        try:
+            self._fill_preview(result)
+        finally:
+            self.preview_content.setUpdatesEnabled(True)
 
-        # Título con icono
-        title_text = f"{result.icon} {result.name}" if result.icon else result.name
-        title = QLabel(title_text)
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 14pt;
-                font-weight: bold;
-                color: #ffffff;
-                padding: 5px;
-                background-color: #2d2d30;
-                border-radius: 4px;
-            }
-        """)
-        title.setWordWrap(True)
-        self.preview_layout.addWidget(title)
+    def _fill_preview(self, result):
+        """Rellena los widgets del preview con los datos de result"""
+        self._preview_result = result
+        self.no_preview_label.setVisible(False)
 
-        # Tipo de resultado
-        type_label = QLabel(f"Tipo: {result.result_type.value}")
-        type_label.setStyleSheet("color: #888888; font-size: 9pt;")
-        self.preview_layout.addWidget(type_label)
+        for widget in self._prev_always_visible:
+            widget.setVisible(True)
 
-        # Separador
-        sep1 = QFrame()
-        sep1.setFrameShape(QFrame.Shape.HLine)
-        sep1.setStyleSheet("background-color: #3e3e42;")
-        self.preview_layout.addWidget(sep1)
+        # Título y tipo
+        self._prev_title.setText(f"{result.icon} {result.name}" if result.icon else result.name)
+        self._prev_type.setText(f"Tipo: {result.result_type.value}")
 
         # Contenido
-        if result.content:
-            content_label = QLabel("📄 Contenido:")
-            content_label.setStyleSheet("font-weight: bold; color: #cccccc;")
-            self.preview_layout.addWidget(content_label)
-
-            content_text = QTextEdit()
-            content_text.setPlainText(result.content)
-            content_text.setReadOnly(True)
-            content_text.setMaximumHeight(150)
-            content_text.setStyleSheet("""
-                QTextEdit {
-                    background-color: #1e1e1e;
-                    color: #d4d4d4;
-                    border: 1px solid #3e3e42;
-                    border-radius: 3px;
-                    padding: 5px;
-                    font-family: 'Consolas', 'Courier New', monospace;
-                    font-size: 9pt;
-                }
-            """)
-            self.preview_layout.addWidget(content_text)
+        has_content = bool(result.content)
+        self._prev_content_label.setVisible(has_content)
+        self._prev_content.setVisible(has_content)
+        self._prev_content.setPlainText(result.content if has_content else "")
 
         # Descripción
-        if result.description:
-            desc_label = QLabel("📝 Descripción:")
-            desc_label.setStyleSheet("font-weight: bold; color: #cccccc;")
-            self.preview_layout.addWidget(desc_label)
-
-            desc_text = QLabel(result.description)
-            desc_text.setWordWrap(True)
-            desc_text.setStyleSheet("color: #d4d4d4; padding: 5px;")
-            self.preview_layout.addWidget(desc_text)
-
-        # Tags
-        if result.tags:
-            tags_label = QLabel("🏷️ Tags:")
-            tags_label.setStyleSheet("font-weight: bold; color: #cccccc;")
-            self.preview_layout.addWidget(tags_label)
-
-            tags_container = QWidget()
-            tags_layout = QHBoxLayout(tags_container)
-            tags_layout.setContentsMargins(0, 0, 0, 0)
-            tags_layout.setSpacing(5)
-            tags_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
-
-            for tag in result.tags[:10]:  # Limitar a 10 tags
-                tag_btn = QPushButton(tag)
-                tag_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #007acc;
-                        color: #ffffff;
-                        border: none;
-                        padding: 3px 8px;
-                        border-radius: 3px;
-                        font-size: 8pt;
-                    }
-                """)
-                tag_btn.setFixedHeight(22)
-                tags_layout.addWidget(tag_btn)
-
-            if len(result.tags) > 10:
-                more_label = QLabel(f"+{len(result.tags) - 10} más")
-                more_label.setStyleSheet("color: #888888; font-size: 8pt;")
-                tags_layout.addWidget(more_label)
-
-            self.preview_layout.addWidget(tags_container)
-
-        # Separador
-        sep2 = QFrame()
-        sep2.setFrameShape(QFrame.Shape.HLine)
-        sep2.setStyleSheet("background-color: #3e3e42;")
-        self.preview_layout.addWidget(sep2)
+        has_description = bool(result.description)
+        self._prev_desc_label.setVisible(has_description)
+        self._prev_desc.setVisible(has_description)
+        self._prev_desc.setText(result.description or "")
+
+        # Tags (máximo 10 visibles)
+        tags = result.tags
+        self._prev_tags_label.setVisible(bool(tags))
+        self._prev_tags_container.setVisible(bool(tags))
+        for i, tag_btn in enumerate(self._prev_tag_buttons):
+            if i < len(tags):
+                tag_btn.setText(tags[i])
+                tag_btn.setVisible(True)
+            else:
+                tag_btn.setVisible(False)
+        self._prev_tags_more.setVisible(len(tags) > 10)
+        if len(tags) > 10:
+            self._prev_tags_more.setText(f"+{len(tags) - 10} más")
 
         # Relaciones
-        relations_label = QLabel("🔗 Relaciones:")
-        relations_label.setStyleSheet("font-weight: bold; color: #cccccc;")
-        self.preview_layout.addWidget(relations_label)
-
-        if result.proyectos:
-            proj_label = QLabel(f"📁 Proyectos: {', '.join(result.proyectos)}")
-            proj_label.setWordWrap(True)
-            proj_label.setStyleSheet("color: #d4d4d4; font-size: 9pt; padding-left: 10px;")
-            self.preview_layout.addWidget(proj_label)
-
-        if result.areas:
-            area_label = QLabel(f"🏢 Áreas: {', '.join(result.areas)}")
-            area_label.setWordWrap(True)
-            area_label.setStyleSheet("color: #d4d4d4; font-size: 9pt; padding-left: 10px;")
-            self.preview_layout.addWidget(area_label)
-
-        if result.categoria:
-            cat_label = QLabel(f"📂 Categoría: {result.categoria}")
-            cat_label.setWordWrap(True)
-            cat_label.setStyleSheet("color: #d4d4d4; font-size: 9pt; padding-left: 10px;")
-            self.preview_layout.addWidget(cat_label)
-
-        if result.tabla:
-            tabla_label = QLabel(f"📊 Tabla: {result.tabla}")
-            tabla_label.setWordWrap(True)
-            tabla_label.setStyleSheet("color: #d4d4d4; font-size: 9pt; padding-left: 10px;")
-            self.preview_layout.addWidget(tabla_label)
-
-        if result.lista:
-            lista_label = QLabel(f"📋 Lista: {result.lista}")
-            lista_label.setWordWrap(True)
-            lista_label.setStyleSheet("color: #d4d4d4; font-size: 9pt; padding-left: 10px;")
-            self.preview_layout.addWidget(lista_label)
-
-        if result.procesos:
-            proc_label = QLabel(f"⚙️ Procesos: {', '.join(result.procesos)}")
-            proc_label.setWordWrap(True)
-            proc_label.setStyleSheet("color: #d4d4d4; font-size: 9pt; padding-left: 10px;")
-            self.preview_layout.addWidget(proc_label)
-
-        # Separador
-        sep3 = QFrame()
-        sep3.setFrameShape(QFrame.Shape.HLine)
-        sep3.setStyleSheet("background-color: #3e3e42;")
-        self.preview_layout.addWidget(sep3)
+        self._set_preview_line(self._prev_proyectos, result.proyectos_str, "📁 Proyectos: ")
+        self._set_preview_line(self._prev_areas, result.areas_str, "🏢 Áreas: ")
+        self._set_preview_line(self._prev_categoria, result.categoria, "📂 Categoría: ")
+        self._set_preview_line(self._prev_tabla, result.tabla, "📊 Tabla: ")
+        self._set_preview_line(self._prev_lista, result.lista, "📋 Lista: ")
+        self._set_preview_line(self._prev_procesos, result.procesos_str, "⚙️ Procesos: ")
 
         # Metadata
-        meta_label = QLabel("ℹ️ Información:")
-        meta_label.setStyleSheet("font-weight: bold; color: #cccccc;")
-        self.preview_layout.addWidget(meta_label)
-
-        if result.is_favorite:
-            fav_label = QLabel("⭐ Favorito")
-            fav_label.setStyleSheet("color: #FFD700; font-size: 9pt; padding-left: 10px;")
-            self.preview_layout.addWidget(fav_label)
-
-        if result.is_sensitive:
-            sens_label = QLabel("🔒 Sensible (cifrado)")
-            sens_label.setStyleSheet("color: #ff6b6b; font-size: 9pt; padding-left: 10px;")
-            self.preview_layout.addWidget(sens_label)
-
-        usage_label = QLabel(f"📈 Usado {result.use_count} veces")
-        usage_label.setStyleSheet("color: #888888; font-size: 9pt; padding-left: 10px;")
-        self.preview_layout.addWidget(usage_label)
-
-        if result.last_used:
-            last_used_label = QLabel(f"🕐 Último uso: {result.last_used}")
-            last_used_label.setStyleSheet("color: #888888; font-size: 9pt; padding-left: 10px;")
-            self.preview_layout.addWidget(last_used_label)
-
-        if result.created_at:
-            created_label = QLabel(f"📅 Creado: {result.created_at}")
-            created_label.setStyleSheet("color: #888888; font-size: 9pt; padding-left: 10px;")
-            self.preview_layout.addWidget(created_label)
-
-        if result.updated_at:
-            updated_label = QLabel(f"🔄 Actualizado: {result.updated_at}")
-            updated_label.setStyleSheet("color: #888888; font-size: 9pt; padding-left: 10px;")
-            self.preview_layout.addWidget(updated_label)
-
-        # Separador
-        sep4 = QFrame()
-        sep4.setFrameShape(QFrame.Shape.HLine)
-        sep4.setStyleSheet("background-color: #3e3e42;")
-        self.preview_layout.addWidget(sep4)
-
-        # Botones de acción
-        actions_label = QLabel("⚡ Acciones:")
-        actions_label.setStyleSheet("font-weight: bold; color: #cccccc;")
-        self.preview_layout.addWidget(actions_label)
-
-        # Botón copiar
-        copy_btn = QPushButton("📋 Copiar Contenido")
-        copy_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        copy_btn.clicked.connect(lambda: self.copy_item_content(result))
-        self.preview_layout.addWidget(copy_btn)
+        self._prev_favorite.setVisible(result.is_favorite)
+        self._prev_sensitive.setVisible(result.is_sensitive)
+        self._prev_usage.setText(f"📈 Usado {result.use_count} veces")
+        self._set_preview_line(self._prev_last_used, result.last_used, "🕐 Último uso: ")
+        self._set_preview_line(self._prev_created, result.created_at, "📅 Creado: ")
+        self._set_preview_line(self._prev_updated, result.updated_at, "🔄 Actualizado: ")
 
         # Botón favorito
-        fav_text = "⭐ Quitar de Favoritos" if result.is_favorite else "⭐ Agregar a Favoritos"
-        fav_btn = QPushButton(fav_text)
-        fav_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        fav_btn.clicked.connect(lambda: self.toggle_favorite(result))
-        self.preview_layout.addWidget(fav_btn)
-
-        # Botón editar
-        edit_btn = QPushButton("✏️ Editar")
-        edit_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        edit_btn.clicked.connect(lambda: self.edit_item(result))
-        self.preview_layout.addWidget(edit_btn)
-
-        # Botón eliminar
-        delete_btn = QPushButton("🗑️ Eliminar")
-        delete_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #c41e3a;
-                color: #ffffff;
-            }
-            QPushButton:hover {
-                background-color: #e4475b;
-            }
-        """)
-        delete_btn.clicked.connect(lambda: self.delete_item(result))
-        self.preview_layout.addWidget(delete_btn)
+        self._prev_fav_btn.setText(
+            "⭐ Quitar de Favoritos" if result.is_favorite else "⭐ Agregar a Favoritos"
+        )
 
-        # Spacer al final
-        self.preview_layout.addStretch()
+    @staticmethod
+    def _set_preview_line(label, value, prefix):
+        """Muestra 'prefix + value' en un label del preview, u oculta el label si no hay valor"""
+        label.setVisible(bool(value))
+        if value:
+            label.setText(f"{prefix}{value}")
 
     def clear_preview(self):
         """Limpia el panel de preview"""
-        # Limpiar contenido anterior
-        while self.preview_layout.count():
-            item = self.preview_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Restaurar mensaje inicial
-        self.no_preview_label = QLabel(
-            "Selecciona un item\npara ver sus detalles"
-        )
-        self.no_preview_label.setStyleSheet("""
-            QLabel {
-                color: #666666;
-                padding: 40px 20px;
-                font-size: 11pt;
-            }
-        """)
-        self.no_preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.preview_layout.addWidget(self.no_preview_label)
+        self._preview_result = None
+        self.preview_content.setUpdatesEnabled(False)
+        try:
+            for widget in self._preview_widgets:
+                widget.setVisible(False)
+            self.no_preview_label.setVisible(True)
+        finally:
+            self.preview_content.setUpdatesEnabled(True)
 
-    def on_cell_double_clicked(self, row, column):
+    def on_cell_double_clicked(self, index):
         """Handler cuando se hace doble clic en una celda"""
-        if row >= 0 and row < len(self.current_results):
-            result = self.current_results[row]
+        result = self._result_for_index(index)
+        if result is not None:
             if result.result_type == SearchResultType.ITEM:
                 # Copiar contenido al portapapeles
-                try:
-                    import pyperclip
-                    pyperclip.copy(result.content)
-                    logger.info(f"Item copiado: {result.name}")
-                    self.item_copied.emit(result.id)
-                except Exception as e:
-                    logger.error(f"Error copiando item: {e}")
+                QApplication.clipboard().setText(result.content or "")
+                logger.info(f"Item copiado: {result.name}")
+                self.item_copied.emit(result.id)
 
     def show_loading(self):
         """Muestra el indicador de carga"""
         self.loading_label.setVisible(True)
-        self.search_input.setEnabled(False)
         self.results_table.setEnabled(False)
 
     def hide_loading(self):
         """Oculta el indicador de carga"""
         self.loading_label.setVisible(False)
-        self.search_input.setEnabled(True)
         self.results_table.setEnabled(True)
 
     def focus_search_bar(self):
@@ -1162,66 +2035,14 @@ class UniversalSearchDialog(QDialog):
         Returns:
             dict con:
                 - 'base_query': query limpia para el motor de búsqueda
-                - 'and_terms': términos que DEBEN estar (AND, +)
-                - 'or_terms': términos de los que AL MENOS UNO debe estar (OR, |)
-                - 'not_terms': términos que NO deben estar (NOT, -)
-                - 'exact_phrases': frases exactas entre comillas
+                - 'and_terms': términos que DEBEN estar (AND, +), en minúsculas
+                - 'or_terms': términos de los que AL MENOS UNO debe estar (OR, |), en minúsculas
+                - 'not_terms': términos que NO deben estar (NOT, -), en minúsculas
+                - 'exact_phrases': frases exactas entre comillas, en minúsculas
                 - 'has_operators': True si se detectaron operadores
         """
-        parsed = {
-            'base_query': query,
-            'and_terms': [],
-            'or_terms': [],
-            'not_terms': [],
-            'exact_phrases': [],
-            'has_operators': False
-        }
-
-        # Extraer frases exactas (entre comillas)
-        exact_phrases = re.findall(r'"([^"]+)"', query)
-        if exact_phrases:
-            parsed['exact_phrases'] = exact_phrases
-            parsed['has_operators'] = True
-
-        # Remover frases exactas de la query para procesar el resto
-        query_without_phrases = re.sub(r'"[^"]+"', '', query)
-
-        # Detectar términos NOT (- o NOT seguido de palabra)
-        not_terms = re.findall(r'(?:NOT\s+|-)(\w+)', query_without_phrases, re.IGNORECASE)
-        if not_terms:
-            parsed['not_terms'] = not_terms
-            parsed['has_operators'] = True
-            query_without_phrases = re.sub(r'(?:NOT\s+|-)(\w+)', '', query_without_phrases, re.IGNORECASE)
-
-        # Detectar términos con AND explícito (AND o +)
-        and_terms = re.findall(r'(?:AND\s+|\+)(\w+)', query_without_phrases, re.IGNORECASE)
-        if and_terms:
-            parsed['and_terms'] = and_terms
-            parsed['has_operators'] = True
-            query_without_phrases = re.sub(r'(?:AND\s+|\+)(\w+)', '', query_without_phrases, re.IGNORECASE)
-
-        # Detectar términos con OR explícito (OR o |)
-        or_terms = re.findall(r'(?:OR\s+|\|)(\w+)', query_without_phrases, re.IGNORECASE)
-        if or_terms:
-            parsed['or_terms'] = or_terms
-            parsed['has_operators'] = True
-            query_without_phrases = re.sub(r'(?:OR\s+|\|)(\w+)', '', query_without_phrases, re.IGNORECASE)
-
-        # Los términos restantes se consideran términos base (búsqueda normal)
-        remaining_terms = [t for t in query_without_phrases.strip().split() if t]
-
-        # Crear query base limpia para el motor de búsqueda
-        # Si HAY operadores, combinar todos los términos
-        # Si NO hay operadores, usar la query original
-        if parsed['has_operators']:
-            all_search_terms = remaining_terms + and_terms + or_terms
-            parsed['base_query'] = ' '.join(all_search_terms + exact_phrases)
-        else:
-            # No hay operadores, usar la query original
-            parsed['base_query'] = query
-
-        logger.info(f"Query parseada: base='{parsed['base_query']}', operadores={parsed['has_operators']}")
-        return parsed
+        # Copia superficial: el dict cacheado se comparte entre llamadas
+        return dict(_parse_search_query(query))
 
     def apply_search_operators(self, results, parsed_query):
         """
@@ -1234,58 +2055,41 @@ class UniversalSearchDialog(QDialog):
         Returns:
             Lista filtrada de SearchResult
         """
-        if not results:
+        if not results or not parsed_query['has_operators']:
             return results
 
+        # Los términos ya vienen en minúsculas desde parse_search_query
+        not_terms = parsed_query['not_terms']
+        and_terms = parsed_query['and_terms']
+        exact_phrases = parsed_query['exact_phrases']
+        or_terms = parsed_query['or_terms']
+
+        # Con muchos términos, una sola pasada por texto en lugar de una por término
+        all_terms = tuple(dict.fromkeys(not_terms + and_terms + exact_phrases + or_terms))
+        matcher = _term_matcher(all_terms) if len(all_terms) >= MULTI_TERM_MATCH_MIN else None
+
         filtered_results = []
 
         for result in results:
-            # Crear texto combinado para buscar (nombre + contenido + descripción + tags)
-            search_text = f"{result.name} {result.content} {result.description or ''}"
-            if result.tags:
-                search_text += " " + " ".join(result.tags)
-            search_text = search_text.lower()
+            # Texto combinado para buscar (nombre + contenido + descripción + tags)
+            search_text = result.get_search_text_lower()
+            contains = matcher(search_text).__contains__ if matcher else search_text.__contains__
 
             # Verificar términos NOT (deben NO estar)
-            has_not_term = False
-            for not_term in parsed_query['not_terms']:
-                if not_term.lower() in search_text:
-                    has_not_term = True
-                    break
-
-            if has_not_term:
+            if any(map(contains, not_terms)):
                 continue  # Saltar este resultado
 
             # Verificar términos AND (TODOS deben estar)
-            all_and_present = True
-            for and_term in parsed_query['and_terms']:
-                if and_term.lower() not in search_text:
-                    all_and_present = False
-                    break
-
-            if not all_and_present:
+            if not all(map(contains, and_terms)):
                 continue  # Saltar este resultado
 
             # Verificar frases exactas (deben estar exactamente)
-            all_phrases_present = True
-            for phrase in parsed_query['exact_phrases']:
-                if phrase.lower() not in search_text:
-                    all_phrases_present = False
-                    break
-
-            if not all_phrases_present:
+            if not all(map(contains, exact_phrases)):
                 continue  # Saltar este resultado
 
             # Verificar términos OR (al menos UNO debe estar)
-            if parsed_query['or_terms']:
-                any_or_present = False
-                for or_term in parsed_query['or_terms']:
-                    if or_term.lower() in search_text:
-                        any_or_present = True
-                        break
-
-                if not any_or_present:
-                    continue  # Saltar este resultado
+            if or_terms and not any(map(contains, or_terms)):
+                continue  # Saltar este resultado
 
             # Si llegamos aquí, el resultado cumple todos los criterios
             filtered_results.append(result)
@@ -1298,16 +2102,13 @@ class UniversalSearchDialog(QDialog):
         if not query or len(query) < 2:
             return
 
-        # Remover si ya existe (para evitar duplicados)
-        if query in self.search_history:
-            self.search_history.remove(query)
-
-        # Agregar al inicio de la lista
-        self.search_history.insert(0, query)
+        # Remover si ya existe (para evitar duplicados) y agregar como la más reciente
+        self.search_history.pop(query, None)
+        self.search_history[query] = None
 
         # Limitar tamaño del historial
         if len(self.search_history) > self.max_history:
-            self.search_history = self.search_history[:self.max_history]
+            self.search_history.popitem(last=False)
 
         logger.info(f"Búsqueda agregada al historial: {query}")
 
@@ -1323,22 +2124,10 @@ class UniversalSearchDialog(QDialog):
 
         # Crear menú contextual
         menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #2d2d30;
-                color: #cccccc;
-                border: 1px solid #555555;
-            }
-            QMenu::item {
-                padding: 5px 20px;
-            }
-            QMenu::item:selected {
-                background-color: #094771;
-            }
-        """)
+        menu.setObjectName("searchHistoryMenu")
 
         # Agregar búsquedas recientes
-        for i, query in enumerate(self.search_history[:15]):  # Mostrar últimas 15
+        for query in islice(reversed(self.search_history), 15):  # Mostrar últimas 15
             action = QAction(f"🔍 {query}", self)
             action.triggered.connect(lambda checked, q=query: self.load_from_history(q))
             menu.addAction(action)
@@ -1358,8 +2147,10 @@ class UniversalSearchDialog(QDialog):
     def load_from_history(self, query):
         """Carga una búsqueda desde el historial"""
         logger.info(f"Cargando búsqueda desde historial: {query}")
-        self.search_input.setText(query)
-        # perform_search se llamará automáticamente por el signal textChanged
+        # El texto viene completo: buscar directamente sin pasar por el debounce
+        with QSignalBlocker(self.search_input):
+            self.search_input.setText(query)
+        self._run_search()
 
     def clear_search_history(self):
         """Limpia el historial de búsquedas"""
@@ -1378,6 +2169,12 @@ class UniversalSearchDialog(QDialog):
 
     def show_search_help(self):
         """Muestra ayuda sobre operadores de búsqueda"""
+        if self._help_dialog is None:
+            self._help_dialog = self._build_help_dialog()
+        self._help_dialog.exec()
+
+    def _build_help_dialog(self):
+        """Construye el QMessageBox de ayuda de operadores de búsqueda"""
         help_text = """
 <h2 style='color: #00ff88;'>🔍 Ayuda de Búsqueda Avanzada</h2>
 
@@ -1432,142 +2229,63 @@ Busca la frase exacta.<br>
         msg.setTextFormat(Qt.TextFormat.RichText)
         msg.setText(help_text)
         msg.setIcon(QMessageBox.Icon.Information)
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: #1e1e1e;
-            }
-            QLabel {
-                color: #cccccc;
-                min-width: 500px;
-            }
-            QPushButton {
-                background-color: #3e3e42;
-                color: #cccccc;
-                border: 1px solid #555555;
-                padding: 5px 15px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4e4e52;
-            }
-        """)
-        msg.exec()
+        msg.setObjectName("searchHelpBox")
+        return msg
 
     def show_context_menu(self, position: QPoint):
         """Muestra el menú contextual en la tabla"""
         # Obtener la fila clickeada
-        row = self.results_table.rowAt(position.y())
-        if row < 0 or row >= len(self.current_results):
+        result = self._result_for_index(self.results_table.indexAt(position))
+        if result is None:
             return
 
-        result = self.current_results[row]
+        self._ctx_result = result
 
-        # Crear menú
-        menu = QMenu(self)
-
-        # Acción: Copiar contenido
-        copy_action = QAction("📋 Copiar contenido", self)
-        copy_action.triggered.connect(lambda: self.copy_item_content(result))
-        menu.addAction(copy_action)
-
-        # Acción: Copiar seleccionados
+        # Copiar seleccionados
         selected_count = self.get_selected_count()
-        if selected_count > 1:
-            copy_selected_action = QAction(f"📋 Copiar {selected_count} items seleccionados", self)
-            copy_selected_action.triggered.connect(self.copy_selected_items)
-            menu.addAction(copy_selected_action)
-
-        menu.addSeparator()
+        self._ctx_copy_selected_action.setVisible(selected_count > 1)
+        self._ctx_copy_selected_action.setText(f"📋 Copiar {selected_count} items seleccionados")
 
-        # Acción: Editar
-        edit_action = QAction("✏️ Editar", self)
-        edit_action.triggered.connect(lambda: self.edit_item(result))
-        menu.addAction(edit_action)
-
-        # Acción: Eliminar
-        delete_action = QAction("🗑️ Eliminar", self)
-        delete_action.triggered.connect(lambda: self.delete_item(result))
-        menu.addAction(delete_action)
-
-        menu.addSeparator()
-
-        # Acción: Agregar/Quitar de favoritos
-        fav_text = "⭐ Quitar de favoritos" if result.is_favorite else "⭐ Agregar a favoritos"
-        fav_action = QAction(fav_text, self)
-        fav_action.triggered.connect(lambda: self.toggle_favorite(result))
-        menu.addAction(fav_action)
-
-        menu.addSeparator()
+        # Agregar/Quitar de favoritos
+        self._ctx_fav_action.setText(
+            "⭐ Quitar de favoritos" if result.is_favorite else "⭐ Agregar a favoritos"
+        )
 
         # Navegación
-        if result.categoria:
-            nav_cat_action = QAction(f"📂 Ir a categoría: {result.categoria}", self)
-            nav_cat_action.triggered.connect(lambda: self.navigate_to_category(result))
-            menu.addAction(nav_cat_action)
-
-        if result.proyectos:
-            for proyecto in result.proyectos:
-                nav_proj_action = QAction(f"📁 Ir a proyecto: {proyecto}", self)
-                nav_proj_action.triggered.connect(lambda checked, p=proyecto: self.navigate_to_project(p))
-                menu.addAction(nav_proj_action)
-
-        if result.areas:
-            for area in result.areas:
-                nav_area_action = QAction(f"🏢 Ir a área: {area}", self)
-                nav_area_action.triggered.connect(lambda checked, a=area: self.navigate_to_area(a))
-                menu.addAction(nav_area_action)
+        self._ctx_category_action.setVisible(bool(result.categoria))
+        self._ctx_category_action.setText(f"📂 Ir a categoría: {result.categoria}")
+        self._fill_ctx_navigation(
+            self._ctx_project_actions, result.proyectos, "📁 Ir a proyecto", self.navigate_to_project
+        )
+        self._fill_ctx_navigation(
+            self._ctx_area_actions, result.areas, "🏢 Ir a área", self.navigate_to_area
+        )
 
         # Mostrar menú
-        menu.exec(self.results_table.viewport().mapToGlobal(position))
+        self._ctx_menu.exec(self.results_table.viewport().mapToGlobal(position))
 
     def get_selected_count(self):
         """Obtiene el número de items seleccionados"""
-        count = 0
-        for row in range(self.results_table.rowCount()):
-            cb_widget = self.results_table.cellWidget(row, 0)
-            if cb_widget:
-                cb = cb_widget.findChild(QCheckBox)
-                if cb and cb.isChecked():
-                    count += 1
-        return count
+        return self.results_proxy.checked_count()
 
     def copy_item_content(self, result):
         """Copia el contenido de un item"""
-        try:
-            import pyperclip
-            pyperclip.copy(result.content)
-            logger.info(f"Item copiado: {result.name}")
-            self.item_copied.emit(result.id)
-        except Exception as e:
-            logger.error(f"Error copiando item: {e}")
-            QMessageBox.warning(self, "Error", f"Error al copiar: {e}")
+        QApplication.clipboard().setText(result.content or "")
+        logger.info(f"Item copiado: {result.name}")
+        self.item_copied.emit(result.id)
 
     def copy_selected_items(self):
         """Copia el contenido de todos los items seleccionados"""
-        try:
-            import pyperclip
-            selected_contents = []
-
-            for row in range(self.results_table.rowCount()):
-                cb_widget = self.results_table.cellWidget(row, 0)
-                if cb_widget:
-                    cb = cb_widget.findChild(QCheckBox)
-                    if cb and cb.isChecked() and row < len(self.current_results):
-                        result = self.current_results[row]
-                        selected_contents.append(result.content)
-
-            if selected_contents:
-                combined_content = "\n".join(selected_contents)
-                pyperclip.copy(combined_content)
-                logger.info(f"{len(selected_contents)} items copiados")
-                QMessageBox.information(
-                    self,
-                    "Copiado",
-                    f"Se copiaron {len(selected_contents)} items al portapapeles"
-                )
-        except Exception as e:
-            logger.error(f"Error copiando items: {e}")
-            QMessageBox.warning(self, "Error", f"Error al copiar: {e}")
+        selected_contents = [result.content or "" for result in self.results_proxy.checked_results()]
+
+        if selected_contents:
+            QApplication.clipboard().setText("\n".join(selected_contents))
+            logger.info(f"{len(selected_contents)} items copiados")
+            QMessageBox.information(
+                self,
+                "Copiado",
+                f"Se copiaron {len(selected_contents)} items al portapapeles"
+            )
 
     def edit_item(self, result):
         """Edita un item"""
@@ -1601,6 +2319,7 @@ Busca la frase exacta.<br>
             logger.info(f"Eliminando item: {result.name}")
             self.delete_item_requested.emit(result.id)
             # Recargar resultados
+            self._invalidate_page_cache()
             self.perform_search()
 
     def toggle_favorite(self, result):
@@ -1608,50 +2327,110 @@ Busca la frase exacta.<br>
         logger.info(f"Toggle favorite: {result.name}")
         self.toggle_favorite_requested.emit(result.id)
         # Actualizar visualmente
+        self._invalidate_page_cache()
         self.perform_search()
 
+    def _get_name_index(self, kind):
+        """
+        Retorna el índice nombre -> id de un tipo de entidad, cargándolo de la BD la primera vez
+
+        Args:
+            kind: Clave de NAME_INDEX_SOURCES ('categoria', 'proyecto' o 'area')
+
+        Returns:
+            Dict {nombre: id}; ante nombres repetidos se conserva el primero
+        """
+        index = self._name_indexes.get(kind)
+        if index is None:
+            index = {}
+            for row in getattr(self.db, NAME_INDEX_SOURCES[kind])():
+                index.setdefault(row['name'], row['id'])
+            self._name_indexes[kind] = index
+        return index
+
     def navigate_to_category(self, result):
         """Navega a la categoría del item"""
-        # Obtener category_id del resultado
         if hasattr(result, 'categoria') and result.categoria:
-            # Necesitamos buscar el ID de la categoría
             try:
-                categories = self.db.get_categories()
-                for cat in categories:
-                    if cat['name'] == result.categoria:
-                        logger.info(f"Navegando a categoría: {result.categoria}")
-                        self.navigate_to_category_requested.emit(cat['id'])
-                        self.close()
-                        break
+                category_id = self._get_name_index('categoria').get(result.categoria)
+                if category_id is not None:
+                    logger.info(f"Navegando a categoría: {result.categoria}")
+                    self.navigate_to_category_requested.emit(category_id)
+                    self.close()
             except Exception as e:
                 logger.error(f"Error navegando a categoría: {e}")
 
     def navigate_to_project(self, project_name):
         """Navega a un proyecto"""
         try:
-            projects = self.db.get_all_projects()
-            for proj in projects:
-                if proj['name'] == project_name:
-                    logger.info(f"Navegando a proyecto: {project_name}")
-                    self.navigate_to_project_requested.emit(proj['id'])
-                    self.close()
-                    break
+            project_id = self._get_name_index('proyecto').get(project_name)
+            if project_id is not None:
+                logger.info(f"Navegando a proyecto: {project_name}")
+                self.navigate_to_project_requested.emit(project_id)
+                self.close()
         except Exception as e:
             logger.error(f"Error navegando a proyecto: {e}")
 
     def navigate_to_area(self, area_name):
         """Navega a un área"""
         try:
-            areas = self.db.get_all_areas()
-            for area in areas:
-                if area['name'] == area_name:
-                    logger.info(f"Navegando a área: {area_name}")
-                    self.navigate_to_area_requested.emit(area['id'])
-                    self.close()
-                    break
+            area_id = self._get_name_index('area').get(area_name)
+            if area_id is not None:
+                logger.info(f"Navegando a área: {area_name}")
+                self.navigate_to_area_requested.emit(area_id)
+                self.close()
         except Exception as e:
             logger.error(f"Error navegando a área: {e}")
 
+    @staticmethod
+    def _csv_rows(results):
+        """Genera las filas CSV de los resultados, una a la vez"""
+        for result in results:
+            yield (
+                result.id,
+                result.name,
+                result.result_type.value,
+                result.proyectos_str,
+                result.areas_str,
+                result.categoria or '',
+                result.tabla or '',
+                result.lista or '',
+                result.procesos_str,
+                ', '.join(result.tags),
+                result.description or '',
+                'Sí' if result.is_favorite else 'No',
+                result.use_count,
+                result.last_used or '',
+                result.created_at or '',
+                result.updated_at or ''
+            )
+
+    @staticmethod
+    def _json_result(result):
+        """Convierte un resultado al diccionario que se exporta a JSON"""
+        return {
+            'id': result.id,
+            'name': result.name,
+            'type': result.result_type.value,
+            'content': result.content,
+            'icon': result.icon,
+            'color': result.color,
+            'description': result.description,
+            'proyectos': result.proyectos,
+            'areas': result.areas,
+            'categoria': result.categoria,
+            'tabla': result.tabla,
+            'lista': result.lista,
+            'procesos': result.procesos,
+            'tags': result.tags,
+            'is_favorite': result.is_favorite,
+            'is_sensitive': result.is_sensitive,
+            'use_count': result.use_count,
+            'last_used': result.last_used,
+            'created_at': result.created_at,
+            'updated_at': result.updated_at
+        }
+
     def export_to_csv(self):
         """Exporta los resultados actuales a CSV"""
         try:
@@ -1692,7 +2471,7 @@ Busca la frase exacta.<br>
                 return  # Usuario canceló
 
             # Escribir CSV
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as csvfile:
                 writer = csv.writer(csvfile)
 
                 # Header
@@ -1702,26 +2481,8 @@ Busca la frase exacta.<br>
                     'Favorito', 'Uso', 'Última Vez', 'Creado', 'Actualizado'
                 ])
 
-                # Datos
-                for result in self.current_results:
-                    writer.writerow([
-                        result.id,
-                        result.name,
-                        result.result_type.value,
-                        ', '.join(result.proyectos) if result.proyectos else '',
-                        ', '.join(result.areas) if result.areas else '',
-                        result.categoria or '',
-                        result.tabla or '',
-                        result.lista or '',
-                        ', '.join(result.procesos) if result.procesos else '',
-                        ', '.join(result.tags) if result.tags else '',
-                        result.description or '',
-                        'Sí' if result.is_favorite else 'No',
-                        result.use_count,
-                        result.last_used or '',
-                        result.created_at or '',
-                        result.updated_at or ''
-                    ])
+                # Datos (writerows consume el generador fila a fila)
+                writer.writerows(self._csv_rows(self.current_results))
 
             QMessageBox.information(
                 self,
@@ -1773,48 +2534,26 @@ Busca la frase exacta.<br>
             if not file_path:
                 return  # Usuario canceló
 
-            # Convertir resultados a diccionarios
-            results_data = []
-            for result in self.current_results:
-                result_dict = {
-                    'id': result.id,
-                    'name': result.name,
-                    'type': result.result_type.value,
-                    'content': result.content,
-                    'icon': result.icon,
-                    'color': result.color,
-                    'description': result.description,
-                    'proyectos': result.proyectos,
-                    'areas': result.areas,
-                    'categoria': result.categoria,
-                    'tabla': result.tabla,
-                    'lista': result.lista,
-                    'procesos': result.procesos,
-                    'tags': result.tags,
-                    'is_favorite': result.is_favorite,
-                    'is_sensitive': result.is_sensitive,
-                    'use_count': result.use_count,
-                    'last_used': result.last_used,
-                    'created_at': result.created_at,
-                    'updated_at': result.updated_at
-                }
-                results_data.append(result_dict)
-
-            # Crear estructura con metadata
-            export_data = {
-                'metadata': {
-                    'export_date': datetime.now().isoformat(),
-                    'total_results': len(self.current_results),
-                    'query': self.search_input.text(),
-                    'page': self.current_page,
-                    'page_size': self.page_size
-                },
-                'results': results_data
+            metadata = {
+                'export_date': datetime.now().isoformat(),
+                'total_results': len(self.current_results),
+                'query': self.search_input.text(),
+                'page': self.current_page,
+                'page_size': self.page_size
             }
 
-            # Escribir JSON
-            with open(file_path, 'w', encoding='utf-8') as jsonfile:
-                json.dump(export_data, jsonfile, indent=2, ensure_ascii=False)
+            # Escribir JSON: la envoltura a mano y cada resultado directamente
+            # al archivo, sin construir la lista completa de diccionarios.
+            # Un solo encoder compacto para todos los registros
+            encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+            with open(file_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as jsonfile:
+                jsonfile.write('{"metadata":')
+                jsonfile.write(encoder.encode(metadata))
+                jsonfile.write(',"results":[')
+                for i, result in enumerate(self.current_results):
+                    jsonfile.write(',\n' if i else '\n')
+                    jsonfile.write(encoder.encode(self._json_result(result)))
+                jsonfile.write('\n]}\n')
 
             QMessageBox.information(
                 self,
@@ -1835,16 +2574,8 @@ Busca la frase exacta.<br>
     def mark_selected_as_favorite(self):
         """Marca los items seleccionados como favoritos (acción en lote)"""
         try:
-            selected_ids = []
-
             # Obtener IDs de items seleccionados
-            for row in range(self.results_table.rowCount()):
-                cb_widget = self.results_table.cellWidget(row, 0)
-                if cb_widget:
-                    cb = cb_widget.findChild(QCheckBox)
-                    if cb and cb.isChecked() and row < len(self.current_results):
-                        result = self.current_results[row]
-                        selected_ids.append(result.id)
+            selected_ids = [result.id for result in self.results_proxy.checked_results()]
 
             if not selected_ids:
                 QMessageBox.information(self, "Marcar Favoritos", "No hay items seleccionados")
@@ -1860,9 +2591,13 @@ Busca la frase exacta.<br>
             )
 
             if reply == QMessageBox.StandardButton.Yes:
-                # Marcar cada item como favorito
-                for item_id in selected_ids:
-                    self.db.update_item(item_id, is_favorite=True)
+                # Sin lecturas en curso mientras se escribe; lo que traigan
+                # queda descartado al invalidar la caché
+                self._wait_for_workers()
+                self._invalidate_page_cache()
+
+                # Marcar todos los items en una sola transacción
+                self.db.update_items_favorite(selected_ids, True)
 
                 logger.info(f"Marcados {len(selected_ids)} items como favoritos")
                 QMessageBox.information(
@@ -1872,6 +2607,7 @@ Busca la frase exacta.<br>
                 )
 
                 # Refrescar vista
+                self._invalidate_page_cache()
                 self.perform_search()
 
         except Exception as e:
@@ -1881,18 +2617,10 @@ Busca la frase exacta.<br>
     def delete_selected_batch(self):
         """Elimina los items seleccionados (acción en lote)"""
         try:
-            selected_ids = []
-            selected_names = []
-
             # Obtener IDs y nombres de items seleccionados
-            for row in range(self.results_table.rowCount()):
-                cb_widget = self.results_table.cellWidget(row, 0)
-                if cb_widget:
-                    cb = cb_widget.findChild(QCheckBox)
-                    if cb and cb.isChecked() and row < len(self.current_results):
-                        result = self.current_results[row]
-                        selected_ids.append(result.id)
-                        selected_names.append(result.name)
+            selected = self.results_proxy.checked_results()
+            selected_ids = [result.id for result in selected]
+            selected_names = [result.name for result in selected]
 
             if not selected_ids:
                 QMessageBox.information(self, "Eliminar Items", "No hay items seleccionados")
@@ -1912,14 +2640,13 @@ Busca la frase exacta.<br>
             )
 
             if reply == QMessageBox.StandardButton.Yes:
-                # Eliminar cada item
-                deleted_count = 0
-                for item_id in selected_ids:
-                    try:
-                        self.db.delete_item(item_id)
-                        deleted_count += 1
-                    except Exception as e:
-                        logger.error(f"Error eliminando item {item_id}: {e}")
+                # Sin lecturas en curso mientras se escribe; lo que traigan
+                # queda descartado al invalidar la caché
+                self._wait_for_workers()
+                self._invalidate_page_cache()
+
+                # Eliminar todos los items en una sola transacción
+                deleted_count = self.db.delete_items(selected_ids)
 
                 logger.info(f"Eliminados {deleted_count}/{len(selected_ids)} items")
                 QMessageBox.information(
@@ -1929,6 +2656,7 @@ Busca la frase exacta.<br>
                 )
 
                 # Refrescar vista
+                self._invalidate_page_cache()
                 self.perform_search()
 
         except Exception as e:
@@ -1937,112 +2665,4 @@ Busca la frase exacta.<br>
 
     def apply_styles(self):
         """Aplica estilos al diálogo"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-                color: #cccccc;
-            }
-
-            QFrame {
-                background-color: #252526;
-                border: 1px solid #3e3e42;
-            }
-
-            QPushButton {
-                background-color: #3e3e42;
-                color: #cccccc;
-                border: 1px solid #555555;
-                padding: 5px 10px;
-                border-radius: 3px;
-            }
-
-            QPushButton:hover {
-                background-color: #4e4e52;
-            }
-
-            QPushButton:pressed {
-                background-color: #2e2e32;
-            }
-
-            QPushButton:checked {
-                background-color: #007acc;
-                color: #ffffff;
-            }
-
-            QLineEdit {
-                background-color: #3c3c3c;
-                color: #cccccc;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-            }
-
-            QLineEdit:focus {
-                border: 1px solid #007acc;
-            }
-
-            QTableWidget {
-                background-color: #1e1e1e;
-                color: #cccccc;
-                gridline-color: #3e3e42;
-                border: 1px solid #3e3e42;
-            }
-
-            QTableWidget::item {
-                padding: 5px;
-            }
-
-            QTableWidget::item:selected {
-                background-color: #094771;
-                color: #ffffff;
-            }
-
-            QTableWidget::item:alternate {
-                background-color: #252526;
-            }
-
-            QHeaderView::section {
-                background-color: #2d2d30;
-                color: #cccccc;
-                padding: 5px;
-                border: 1px solid #3e3e42;
-                font-weight: bold;
-            }
-
-            QCheckBox {
-                color: #cccccc;
-                spacing: 5px;
-            }
-
-            QCheckBox::indicator {
-                width: 15px;
-                height: 15px;
-                border: 1px solid #555555;
-                border-radius: 3px;
-                background-color: #3c3c3c;
-            }
-
-            QCheckBox::indicator:checked {
-                background-color: #007acc;
-                border-color: #007acc;
-            }
-
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-
-            QScrollBar:vertical {
-                background-color: #2d2d30;
-                width: 12px;
-            }
-
-            QScrollBar::handle:vertical {
-                background-color: #555555;
-                border-radius: 6px;
-            }
-
-            QScrollBar::handle:vertical:hover {
-                background-color: #666666;
-            }
-        """)
+        self.setStyleSheet(UNIVERSAL_SEARCH_QSS)
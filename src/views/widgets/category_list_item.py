@@ -6,14 +6,22 @@ FASE 4: Item con checkbox, icono, nombre, badge y menú contextual
 from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QLabel, QCheckBox, QPushButton, QMenu
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QSignalBlocker
 from PyQt6.QtGui import QFont, QCursor
+from functools import lru_cache
+import json
 import logging
 
 # Get logger
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def cached_cursor(shape: Qt.CursorShape) -> QCursor:
+    """Return a shared QCursor for the given shape (created on first use)"""
+    return QCursor(shape)
+
+
 class CategoryListItem(QWidget):
     """
     Widget for displaying a category in the management list.
@@ -62,7 +70,7 @@ class CategoryListItem(QWidget):
         """Initialize the UI"""
         # Widget properties
         self.setFixedHeight(60)
-        self.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+        self.setCursor(cached_cursor(Qt.CursorShape.ArrowCursor))
 
         # Enable hover events
         self.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
@@ -101,12 +109,11 @@ class CategoryListItem(QWidget):
             }
         """)
         self.checkbox.stateChanged.connect(self._on_checkbox_changed)
-        self.checkbox.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.checkbox.setCursor(cached_cursor(Qt.CursorShape.PointingHandCursor))
         layout.addWidget(self.checkbox)
 
         # Icon label
-        icon = self.category.get('icon', '📁')
-        self.icon_label = QLabel(icon)
+        self.icon_label = QLabel()
         self.icon_label.setStyleSheet("""
             QLabel {
                 font-size: 28px;
@@ -118,7 +125,7 @@ class CategoryListItem(QWidget):
         layout.addWidget(self.icon_label)
 
         # Name label
-        self.name_label = QLabel(self.category['name'])
+        self.name_label = QLabel()
         self.name_label.setStyleSheet("""
             QLabel {
                 font-size: 13pt;
@@ -129,67 +136,48 @@ class CategoryListItem(QWidget):
         self.name_label.setMinimumWidth(200)
         layout.addWidget(self.name_label)
 
-        # Tags label
-        tags = self.category.get('tags')
-        if tags:
-            # Parse tags if it's a JSON string
-            import json
-            if isinstance(tags, str):
-                try:
-                    tags = json.loads(tags)
-                except:
-                    tags = []
-
-            if tags and isinstance(tags, list):
-                tags_text = ", ".join(tags[:3])  # Show max 3 tags
-                if len(tags) > 3:
-                    tags_text += f" +{len(tags) - 3}"
-
-                self.tags_label = QLabel(f"🏷️ {tags_text}")
-                self.tags_label.setStyleSheet("""
-                    QLabel {
-                        background-color: rgba(0, 122, 204, 0.2);
-                        color: #4fc3f7;
-                        border: 1px solid rgba(0, 122, 204, 0.4);
-                        border-radius: 10px;
-                        padding: 4px 10px;
-                        font-size: 9pt;
-                    }
-                """)
-                self.tags_label.setFixedHeight(24)
-                self.tags_label.setToolTip(", ".join(tags))
-                layout.addWidget(self.tags_label)
+        # Tags label (hidden when the category has no tags)
+        self.tags_label = QLabel()
+        self.tags_label.setStyleSheet("""
+            QLabel {
+                background-color: rgba(0, 122, 204, 0.2);
+                color: #4fc3f7;
+                border: 1px solid rgba(0, 122, 204, 0.4);
+                border-radius: 10px;
+                padding: 4px 10px;
+                font-size: 9pt;
+            }
+        """)
+        self.tags_label.setFixedHeight(24)
+        layout.addWidget(self.tags_label)
 
         # Spacer
         layout.addStretch()
 
-        # Pinned indicator (if category is pinned)
-        if self.is_pinned:
-            pin_label = QLabel("📌")
-            pin_label.setStyleSheet("""
-                QLabel {
-                    font-size: 16px;
-                    color: #888888;
-                }
-            """)
-            pin_label.setToolTip("Categoría anclada")
-            layout.addWidget(pin_label)
+        # Pinned indicator (shown if category is pinned)
+        self.pin_label = QLabel("📌")
+        self.pin_label.setStyleSheet("""
+            QLabel {
+                font-size: 16px;
+                color: #888888;
+            }
+        """)
+        self.pin_label.setToolTip("Categoría anclada")
+        layout.addWidget(self.pin_label)
 
-        # Predefined indicator (if category is predefined)
-        if self.is_predefined:
-            predefined_label = QLabel("🔒")
-            predefined_label.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    color: #888888;
-                }
-            """)
-            predefined_label.setToolTip("Categoría predefinida del sistema")
-            layout.addWidget(predefined_label)
+        # Predefined indicator (shown if category is predefined)
+        self.predefined_label = QLabel("🔒")
+        self.predefined_label.setStyleSheet("""
+            QLabel {
+                font-size: 14px;
+                color: #888888;
+            }
+        """)
+        self.predefined_label.setToolTip("Categoría predefinida del sistema")
+        layout.addWidget(self.predefined_label)
 
         # Badge with item count
-        item_count = self.category.get('item_count', 0)
-        self.badge_label = QLabel(f"{item_count} items")
+        self.badge_label = QLabel()
         self.badge_label.setStyleSheet("""
             QLabel {
                 background-color: rgba(255, 255, 255, 0.1);
@@ -223,12 +211,75 @@ class CategoryListItem(QWidget):
             }
         """)
         self.menu_btn.clicked.connect(self._show_context_menu)
-        self.menu_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.menu_btn.setCursor(cached_cursor(Qt.CursorShape.PointingHandCursor))
         layout.addWidget(self.menu_btn)
 
         # Apply base style
         self._apply_base_style()
 
+        # Fill labels from category data
+        self._apply_category_data()
+
+    def _apply_category_data(self):
+        """Fill the child widgets from self.category"""
+        self.icon_label.setText(self.category.get('icon', '📁'))
+        self.name_label.setText(self.category['name'])
+
+        # Parse tags if it's a JSON string
+        tags = self.category.get('tags')
+        if isinstance(tags, str):
+            try:
+                tags = json.loads(tags)
+            except:
+                tags = []
+
+        if tags and isinstance(tags, list):
+            tags_text = ", ".join(tags[:3])  # Show max 3 tags
+            if len(tags) > 3:
+                tags_text += f" +{len(tags) - 3}"
+            self.tags_label.setText(f"🏷️ {tags_text}")
+            self.tags_label.setToolTip(", ".join(tags))
+            self.tags_label.show()
+        else:
+            self.tags_label.hide()
+
+        self.pin_label.setVisible(bool(self.is_pinned))
+        self.predefined_label.setVisible(bool(self.is_predefined))
+
+        item_count = self.category.get('item_count', 0)
+        self.badge_label.setText(f"{item_count} items")
+
+    def rebind(self, category: dict, db=None):
+        """
+        Reuse this widget for another category (object pooling)
+
+        Args:
+            category: Category dictionary from database
+            db: DBManager instance
+        """
+        self.db = db
+        self.category_id = category['id']
+        self._is_hovered = False
+        self.update_from_dict(category)
+
+    def update_from_dict(self, category: dict):
+        """
+        Refresh this row in place from an updated category dictionary
+
+        Args:
+            category: Category dictionary (same id as the current one)
+        """
+        self.category = category
+        self.is_active = category.get('is_active', 1)
+        self.is_pinned = category.get('is_pinned', 0)
+        self.is_predefined = category.get('is_predefined', 0)
+
+        with QSignalBlocker(self.checkbox):
+            self.checkbox.setChecked(bool(self.is_active))
+
+        self._apply_category_data()
+        self.update_visual_state()
+
     def _apply_base_style(self):
         """Apply base stylesheet"""
         self.setStyleSheet("""
@@ -258,16 +309,14 @@ class CategoryListItem(QWidget):
                     logger.info(f"Category {self.category_id} active state changed to: {new_active_state}")
                 else:
                     # Revert checkbox if update failed
-                    self.checkbox.blockSignals(True)
-                    self.checkbox.setChecked(not new_active_state)
-                    self.checkbox.blockSignals(False)
+                    with QSignalBlocker(self.checkbox):
+                        self.checkbox.setChecked(not new_active_state)
                     logger.error(f"Failed to update category {self.category_id} active state")
             except Exception as e:
                 logger.error(f"Error updating category active state: {e}")
                 # Revert checkbox
-                self.checkbox.blockSignals(True)
-                self.checkbox.setChecked(not new_active_state)
-                self.checkbox.blockSignals(False)
+                with QSignalBlocker(self.checkbox):
+                    self.checkbox.setChecked(not new_active_state)
 
     def _show_context_menu(self):
         """Show context menu with actions"""